@@ -0,0 +1,109 @@
+"""Requests/sec of a stub ASGI app whose layers each read the same headers.
+
+Every layer parsing the raw headers itself is compared with the layers
+sharing the view ``HeadersMiddleware`` attaches to the scope.
+
+    python -m benchmarks.bench_asgi [--requests N] [--layers N] [--json]
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from fast_header import Accept, CacheControl, ContentType
+from fast_header.asgi import HeadersMiddleware, get_headers
+
+from .common import arg_parser, report
+
+SCOPE = {
+    "type": "http",
+    "method": "POST",
+    "path": "/",
+    "headers": [
+        (b"host", b"example.com"),
+        (b"content-type", b"application/json; charset=utf-8"),
+        (b"accept", b"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"),
+        (b"cache-control", b"max-age=0, no-transform"),
+        (b"user-agent", b"bench"),
+    ],
+}
+RESPONSE = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [ContentType(type="application/json"), CacheControl(no_store=True)],
+}
+RAW_RESPONSE = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", str(ContentType(type="application/json")).encode()),
+        (b"cache-control", str(CacheControl(no_store=True)).encode()),
+    ],
+}
+
+
+def raw(scope: Any, name: bytes) -> bytes:
+    for k, v in scope["headers"]:
+        if k == name:
+            return v
+    raise KeyError(name)
+
+
+def per_layer_app(layers: int):
+    async def app(scope, receive, send):
+        for _ in range(layers):
+            ContentType.parse_bytes(raw(scope, b"content-type"))
+            Accept.parse_bytes(raw(scope, b"accept"))
+            CacheControl.parse_bytes(raw(scope, b"cache-control"))
+        await send(
+            {
+                **RAW_RESPONSE,
+                "headers": [(k, v) for k, v in RAW_RESPONSE["headers"]],
+            }
+        )
+
+    return app
+
+
+def shared_app(layers: int):
+    async def app(scope, receive, send):
+        for _ in range(layers):
+            headers = get_headers(scope)
+            headers.content_type
+            headers.accept
+            headers.cache_control
+        await send(RESPONSE)
+
+    return HeadersMiddleware(app)
+
+
+async def serve(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--layers", type=int, default=4)
+    args = parser.parse_args()
+    results = []
+    for name, app in (
+        ("per-layer parse", per_layer_app(args.layers)),
+        ("HeadersMiddleware", shared_app(args.layers)),
+    ):
+        rps = max(asyncio.run(serve(app, args.requests)) for _ in range(args.repeat))
+        results.append(dict(app=name, layers=args.layers, requests_per_s=rps))
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
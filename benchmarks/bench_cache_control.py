@@ -0,0 +1,40 @@
+"""CacheControl parse and str() for directive sets typical at proxies and CDNs.
+
+    python -m benchmarks.bench_cache_control [--json]
+"""
+
+from fast_header import CacheControl
+
+from .common import arg_parser, measure, report
+
+DIRECTIVE_SETS = {
+    "static_asset": "public, max-age=31536000, immutable",
+    "cdn_shared": "public, max-age=60, s-maxage=3600, stale-while-revalidate=60, stale-if-error=86400",
+    "revalidate": "no-cache, must-revalidate",
+    "private": "private, no-store",
+    "never_cache": "no-cache, no-store, must-revalidate, proxy-revalidate, max-age=0",
+    "request": "max-stale=30, min-fresh=10, only-if-cached",
+}
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    for name, text in DIRECTIVE_SETS.items():
+        data = text.encode()
+        cc = CacheControl.parse(text)
+        results.append(
+            dict(
+                directives=name,
+                parse_ns=measure(lambda: CacheControl.parse(text), args.repeat),
+                parse_bytes_ns=measure(
+                    lambda: CacheControl.parse_bytes(data), args.repeat
+                ),
+                str_ns=measure(lambda: str(cc), args.repeat),
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
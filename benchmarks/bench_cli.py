@@ -0,0 +1,41 @@
+"""Lines/sec of ``python -m fast_header`` statistics by number of worker processes.
+
+    python -m benchmarks.bench_cli [--lines N] [--json]
+"""
+
+import io
+import os
+import random
+import tempfile
+import time
+
+from fast_header.__main__ import main
+
+from .common import arg_parser, report
+from .corpora import CACHE_CONTROL
+
+
+def run() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--lines", type=int, default=200_000)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    values = [v for group in CACHE_CONTROL.values() for v in group]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "access.log")
+        with open(path, "w", encoding="latin-1") as f:
+            for i in range(args.lines):
+                f.write(f"GET /{i}\t{rnd.choice(values)}\n")
+        for jobs in sorted({1, 2, os.cpu_count() or 1}):
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                main(["cache-control", path, "-c", "1", "-j", str(jobs)], io.StringIO())
+                best = min(best, time.perf_counter() - start)
+            results.append(dict(jobs=jobs, lines_per_s=args.lines / best))
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    run()
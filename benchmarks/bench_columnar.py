@@ -0,0 +1,63 @@
+"""Columnar parsing against a list of models from parse_many.
+
+    python -m benchmarks.bench_columnar [--rows N] [--json]
+"""
+
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from fast_header import CacheControl, ContentType
+from fast_header.columnar import cache_control_columns, content_type_columns
+
+from .common import arg_parser, report
+from .corpora import CACHE_CONTROL, CONTENT_TYPE
+
+
+def run(fn: Callable[[], Any]) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter_ns()
+    ret = fn()
+    elapsed = time.perf_counter_ns() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ret
+    return elapsed, size
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    results = []
+    for cls, corpus, columns in (
+        (ContentType, CONTENT_TYPE, content_type_columns),
+        (CacheControl, CACHE_CONTROL, cache_control_columns),
+    ):
+        pool: List[str] = [v for group in corpus.values() for v in group]
+        # mostly repeated values, with a tail of distinct ones
+        values = [
+            rnd.choice(pool) if rnd.random() < 0.9 else f"{rnd.choice(pool)}, x{i}"
+            for i in range(args.rows)
+        ]
+        if cls is ContentType:
+            values = [v.replace(", x", "; x=") if ", x" in v else v for v in values]
+        models_ns, models_mem = run(lambda: list(cls.parse_many(values)))
+        columns_ns, columns_mem = run(lambda: columns(values))
+        results.append(
+            dict(
+                header=cls.__name__,
+                rows=args.rows,
+                models_ms=models_ns / 1e6,
+                columns_ms=columns_ns / 1e6,
+                models_mb=models_mem / 2**20,
+                columns_mb=columns_mem / 2**20,
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
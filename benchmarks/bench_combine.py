@@ -0,0 +1,70 @@
+"""Applying a proxy policy to origin Cache-Control values.
+
+Compares parsing, mutating a copy and re-serializing each value against
+CacheControlPolicy, uncached and memoized.
+
+    python -m benchmarks.bench_combine [--rows N] [--json]
+"""
+
+import random
+from typing import List
+
+from fast_header import CacheControl
+from fast_header.cache_control import CacheControlPolicy, combine
+
+from .common import arg_parser, measure, report
+from .corpora import CACHE_CONTROL
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    pool: List[str] = [v for group in CACHE_CONTROL.values() for v in group]
+    values = [rnd.choice(pool).encode() for _ in range(args.rows)]
+    restrict = CacheControl.parse("private, max-age=300")
+
+    def by_hand():
+        for value in values:
+            cc = CacheControl.parse_bytes(value)
+            max_age = cc.max_age if cc.max_age is not None else 300
+            str(
+                cc.model_copy(
+                    update=dict(
+                        private=True,
+                        public=False,
+                        immutable=False,
+                        max_age=min(max_age, 300),
+                    )
+                )
+            ).encode()
+
+    def uncached():
+        for value in values:
+            combine(CacheControl.parse_bytes(value), restrict).override(
+                immutable=False
+            ).to_bytes()
+
+    policy = CacheControlPolicy(restrict, immutable=False)
+
+    def memoized():
+        apply_value = policy.apply_value
+        for value in values:
+            apply_value(value)
+
+    results = []
+    for name, fn in (
+        ("parse+copy+str", by_hand),
+        ("combine", uncached),
+        ("policy", memoized),
+    ):
+        ns = measure(fn, args.repeat)
+        results.append(
+            dict(mode=name, rows=args.rows, ms=ns / 1e6, ns_per_value=ns / args.rows)
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
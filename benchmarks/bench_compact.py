@@ -0,0 +1,64 @@
+"""CompactCacheControl against CacheControl: memory per entry and speed.
+
+    python -m benchmarks.bench_compact [--rows N] [--json]
+"""
+
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable, List
+
+from fast_header.cache_control import CacheControl, CompactCacheControl
+
+from .common import arg_parser, measure, report
+
+
+def allocated(fn: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    ret = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ret
+    return size
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    # distinct values, so neither parse cache nor interning shares instances
+    texts: List[str] = [
+        f"public, max-age={i}, stale-if-error={rnd.randint(0, 86400)}"
+        for i in range(args.rows)
+    ]
+    sample = texts[:1000]
+    model = CacheControl.parse(texts[0])
+    compact = CompactCacheControl.parse(texts[0])
+    other = CompactCacheControl.parse("no-store, max-age=30")
+    results = []
+    for name, cls, obj in (
+        ("CacheControl", CacheControl, model),
+        ("CompactCacheControl", CompactCacheControl, compact),
+    ):
+        mem = allocated(lambda: [cls.parse(t) for t in texts])
+        parse_ns = measure(lambda: [cls.parse(t) for t in sample], args.repeat)
+        results.append(
+            dict(
+                cls=name,
+                bytes_per_entry=mem / args.rows,
+                parse_us=parse_ns / 1e3 / len(sample),
+                str_us=measure(lambda: str(obj), args.repeat) / 1e3,
+                merge_us=(
+                    measure(lambda: compact | other, args.repeat) / 1e3
+                    if cls is CompactCacheControl
+                    else float("nan")
+                ),
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""If-None-Match parsing and evaluation against lists of growing length.
+
+    python -m benchmarks.bench_conditional [--json]
+"""
+
+from fast_header import ETag, IfNoneMatch
+
+from .common import arg_parser, measure, report
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    current = ETag(value="miss")
+    for n in (1, 10, 100, 1000):
+        text = ", ".join(f'W/"{i:08x}"' for i in range(n))
+        inm = IfNoneMatch.parse(text)
+        inm.evaluate(current)
+        results.append(
+            dict(
+                tags=n,
+                parse_ns=measure(lambda: IfNoneMatch.parse(text), args.repeat),
+                evaluate_ns=measure(lambda: inm.evaluate(current), args.repeat),
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Parse throughput per header class, with the cost of a validating rebuild.
+
+``validate_ns`` is what building the same result through pydantic
+validation costs; ``parse`` no longer pays it.
+
+    python -m benchmarks.bench_construct [--json]
+"""
+
+from fast_header import CacheControl, ContentDisposition, ContentRange, ContentType
+from fast_header import ETag, Range
+
+from .common import arg_parser, measure, report
+
+SIZE = 10_000
+
+CASES = [
+    (ContentType, "application/json; charset=utf-8"),
+    (ContentDisposition, 'attachment; filename="report.pdf"'),
+    (CacheControl, "public, max-age=31536000, immutable"),
+    (ETag, 'W/"5e15153d-120f"'),
+    (ContentRange, "bytes 0-1023/146515"),
+]
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    for cls, text in CASES:
+        parse = cls.parse
+        parsed = parse(text)
+        dumped = parsed.model_dump()
+        validate = cls.model_validate
+        parse_ns = measure(lambda: parse(text), args.repeat)
+        results.append(
+            dict(
+                header=cls.__name__,
+                value=text,
+                parse_ns=parse_ns,
+                parses_per_sec=int(1e9 / parse_ns),
+                validate_ns=measure(lambda: validate(dumped), args.repeat),
+            )
+        )
+    text = "bytes=0-99, 200-299, 400-499, -100"
+    parse_ns = measure(lambda: Range.parse(text, SIZE), args.repeat)
+    dumped = [r.model_dump() for r in Range.parse(text, SIZE) or []]
+    results.append(
+        dict(
+            header="Range",
+            value=text,
+            parse_ns=parse_ns,
+            parses_per_sec=int(1e9 / parse_ns),
+            validate_ns=measure(
+                lambda: [Range.model_validate(d) for d in dumped], args.repeat
+            ),
+        )
+    )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""ETag factories: metadata tags, cold content hashing and cached lookups.
+
+    python -m benchmarks.bench_etag [--json]
+"""
+
+import os
+import tempfile
+
+from fast_header import ETag, etag
+
+from .common import arg_parser, measure, report
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (1 << 10, 1 << 20, 1 << 24):
+            path = os.path.join(tmp, f"{size}.bin")
+            with open(path, "wb") as f:
+                f.write(os.urandom(size))
+
+            def cold() -> ETag:
+                etag.DIGEST_CACHE.clear()
+                return ETag.from_file(path)
+
+            results.append(
+                dict(
+                    size=size,
+                    stat_ns=measure(
+                        lambda: ETag.from_file(path, weak=True), args.repeat
+                    ),
+                    hash_ns=measure(cold, args.repeat),
+                    cached_ns=measure(lambda: ETag.from_file(path), args.repeat),
+                )
+            )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
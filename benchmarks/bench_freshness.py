@@ -0,0 +1,65 @@
+"""Freshness of a sweep over stored entries: per model, per column, NumPy.
+
+    python -m benchmarks.bench_freshness [--rows N] [--json]
+"""
+
+import random
+from typing import List
+
+from fast_header import CacheControl
+from fast_header.cache_control import UNSET
+from fast_header.columnar import cache_control_columns
+from fast_header.freshness import freshness, freshness_columns, freshness_numpy
+
+from .common import arg_parser, measure, report
+from .corpora import CACHE_CONTROL
+
+NOW = 1_700_000_000
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    pool: List[str] = [v for group in CACHE_CONTROL.values() for v in group]
+    texts = [rnd.choice(pool) for _ in range(args.rows)]
+    received = [NOW - rnd.randint(0, 86400) for _ in texts]
+    date = [t - rnd.randint(0, 5) for t in received]
+    age = [rnd.choice((UNSET, 0, 30)) for _ in texts]
+    models = [CacheControl.parse(t) for t in texts]
+    cols = cache_control_columns(texts)
+
+    def per_model():
+        for cc, t, d, a in zip(models, received, date, age):
+            freshness(cc, NOW, t, shared=True, date=d, age=None if a == UNSET else a)
+
+    def per_column():
+        freshness_columns(cols, NOW, received, shared=True, date=date, age=age)
+
+    cases = [("models", per_model), ("columns", per_column)]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        table = cols.to_numpy()
+        arrays = [np.array(v) for v in (received, date, age)]
+
+        def vectorized():
+            freshness_numpy(
+                table, NOW, arrays[0], shared=True, date=arrays[1], age=arrays[2]
+            )
+
+        cases.append(("numpy", vectorized))
+    results = []
+    for name, fn in cases:
+        ns = measure(fn, args.repeat)
+        results.append(
+            dict(mode=name, rows=args.rows, ms=ns / 1e6, ns_per_row=ns / args.rows)
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Cold-start cost of fast_header, measured with ``python -X importtime``.
+
+Each statement runs in a fresh interpreter. ``import_us`` sums the cumulative
+import time of the top-level imports it triggers (pydantic included when it is
+loaded); ``wall_ms`` is the time of the whole statement.
+
+    python -m benchmarks.bench_import [--json]
+"""
+
+import statistics
+import subprocess
+import sys
+
+from .common import arg_parser, report
+
+STATEMENTS = [
+    "import fast_header",
+    "from fast_header import ETag",
+    "from fast_header import ContentType, CacheControl",
+    "from fast_header import ContentType; ContentType.parse('text/html')",
+    "from fast_header import ContentType; ContentType(type='text/x-a')",
+]
+
+PROGRAM = """
+import time
+start = time.perf_counter()
+{statement}
+print((time.perf_counter() - start) * 1e3)
+"""
+
+
+def run(statement: str) -> tuple[float, float]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROGRAM.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_us = 0
+    timing = False
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        _, cumulative, name = line.split("|")
+        if timing and not name.startswith("  "):
+            import_us += int(cumulative)
+        # only imports made by the statement, after interpreter startup
+        timing = timing or name.strip() == "site"
+    return import_us, float(proc.stdout)
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    for statement in STATEMENTS:
+        runs = [run(statement) for _ in range(args.repeat)]
+        results.append(
+            dict(
+                statement=statement,
+                import_us=statistics.median(r[0] for r in runs),
+                wall_ms=statistics.median(r[1] for r in runs),
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Cost of parse with instrumentation off, before and after install/uninstall.
+
+    python -m benchmarks.bench_instrument [--json]
+"""
+
+from fast_header import CacheControl, ContentType
+from fast_header.instrument import instrumented
+
+from .common import arg_parser, measure, report
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    for cls, value in (
+        (ContentType, "text/plain; charset=latin-1"),
+        (CacheControl, "public, max-age=60"),
+    ):
+        off = measure(lambda: cls.parse(value), args.repeat)
+        with instrumented():
+            on = measure(lambda: cls.parse(value), args.repeat)
+        after = measure(lambda: cls.parse(value), args.repeat)
+        results.append(
+            dict(header=cls.__name__, off_ns=off, on_ns=on, uninstalled_ns=after)
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Memory held by parsed headers with and without interned instances.
+
+    python -m benchmarks.bench_intern [--count N] [--json]
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from fast_header import CacheControl, ContentType
+
+from .common import arg_parser, report
+
+VALUES = {
+    ContentType: [
+        "application/json",
+        "text/html; charset=utf-8",
+        b"application/json",
+        b"image/png",
+    ],
+    CacheControl: [
+        "no-cache",
+        "public, max-age=31536000, immutable",
+        b"private, max-age=0",
+        b"no-store",
+    ],
+}
+
+
+def hold(parse: Callable[[Any], Any], values: List[Any], count: int) -> Dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter_ns()
+    held = [parse(values[i % len(values)]) for i in range(count)]
+    elapsed = time.perf_counter_ns() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return dict(bytes=size, ns_per_parse=elapsed / count)
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    results = []
+    for cls, values in VALUES.items():
+
+        def parse(value: Any) -> Any:
+            if isinstance(value, bytes):
+                return cls.parse_bytes(value)
+            return cls.parse(value)
+
+        interned = hold(parse, values, args.count)
+        registry = cls.__interned__
+        cls.clear_interned()
+        try:
+            plain = hold(parse, values, args.count)
+        finally:
+            cls.__interned__ = registry
+        results.append(
+            dict(
+                header=cls.__name__,
+                count=args.count,
+                plain_mb=plain["bytes"] / 2**20,
+                interned_mb=interned["bytes"] / 2**20,
+                plain_ns=plain["ns_per_parse"],
+                interned_ns=interned["ns_per_parse"],
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Streaming multipart/form-data parsing throughput by feed chunk size.
+
+    python -m benchmarks.bench_multipart [--json]
+"""
+
+import os
+
+from fast_header.multipart import FormDataParser
+
+from .common import arg_parser, measure, report
+
+SIZE = 1 << 22
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    body = (
+        b"--xYzZY\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="a.bin"\r\n'
+        b"Content-Type: application/octet-stream\r\n\r\n"
+        + os.urandom(SIZE)
+        + b"\r\n--xYzZY--\r\n"
+    )
+    results = []
+    for chunk_size in (1 << 12, 1 << 16, 1 << 20):
+        chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+        def parse() -> None:
+            parser = FormDataParser("xYzZY")
+            for chunk in chunks:
+                parser.feed(chunk)
+            parser.close()
+
+        ns = measure(parse, args.repeat)
+        results.append(
+            dict(chunk_size=chunk_size, parse_ns=ns, mb_per_s=SIZE / ns * 1e3)
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""parse_bytes() against .decode("latin-1") + parse() on typical ASGI values.
+
+    python -m benchmarks.bench_parse_bytes [--json]
+"""
+
+from fast_header import CacheControl, ContentDisposition, ContentRange, ContentType
+from fast_header import ETag, Range
+
+from .common import arg_parser, measure, report
+
+SIZE = 10_000
+
+CASES = [
+    (ContentType, b"application/json; charset=utf-8"),
+    (ContentType, b'multipart/form-data; boundary="----WebKitFormBoundary7MA4YWxk"'),
+    (ContentDisposition, b'attachment; filename="report.pdf"'),
+    (
+        ContentDisposition,
+        b"attachment; filename=\"EURO rates.pdf\"; filename*=UTF-8''%E2%82%AC%20rates.pdf",
+    ),
+    (CacheControl, b"no-cache"),
+    (CacheControl, b"public, max-age=31536000, immutable"),
+    (ETag, b'W/"5e15153d-120f"'),
+    (ContentRange, b"bytes 0-1023/146515"),
+]
+
+RANGES = [b"bytes=0-1023", b"bytes=0-99, 200-299, 400-499, -100"]
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    for cls, data in CASES:
+        parse = cls.parse
+        parse_bytes = cls.parse_bytes
+        decoded = measure(lambda: parse(data.decode("latin-1")), args.repeat)
+        native = measure(lambda: parse_bytes(data), args.repeat)
+        results.append(
+            dict(
+                header=cls.__name__,
+                value=data.decode("latin-1"),
+                decode_parse_ns=decoded,
+                parse_bytes_ns=native,
+                saving=f"{(1 - native / decoded) * 100:.1f}%",
+            )
+        )
+    for data in RANGES:
+        decoded = measure(
+            lambda: Range.parse(data.decode("latin-1"), SIZE), args.repeat
+        )
+        native = measure(lambda: Range.parse_bytes(data, SIZE), args.repeat)
+        results.append(
+            dict(
+                header="Range",
+                value=data.decode("latin-1"),
+                decode_parse_ns=decoded,
+                parse_bytes_ns=native,
+                saving=f"{(1 - native / decoded) * 100:.1f}%",
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""parse_many() against a parse() loop on a skewed access-log column.
+
+    python -m benchmarks.bench_parse_many [--json]
+"""
+
+import random
+
+from fast_header import CacheControl, ContentType
+
+from .common import arg_parser, measure, report
+
+ROWS = 10_000
+
+COLUMNS = {
+    ContentType: [
+        "application/json; charset=utf-8",
+        "text/html; charset=utf-8",
+        "application/octet-stream",
+        "image/png",
+        "multipart/form-data; boundary=----WebKitFormBoundary7MA4YWxk",
+        "not a media type",
+    ],
+    CacheControl: [
+        "no-cache",
+        "max-age=0",
+        "public, max-age=31536000, immutable",
+        "private, no-store",
+        "no-cache, no-store, must-revalidate",
+    ],
+}
+
+
+def column(values, rows):
+    rnd = random.Random(42)
+    # a few values dominate, like real traffic
+    weights = [2**-i for i in range(len(values))]
+    return rnd.choices(values, weights, k=rows)
+
+
+def parse_loop(cls, rows):
+    ret = []
+    for row in rows:
+        try:
+            ret.append(cls.parse(row))
+        except ValueError:
+            pass
+    return ret
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--rows", type=int, default=ROWS)
+    args = parser.parse_args()
+    results = []
+    for cls, values in COLUMNS.items():
+        rows = column(values, args.rows)
+        loop = measure(lambda: parse_loop(cls, rows), args.repeat)
+        many = measure(lambda: list(cls.parse_many(rows, [])), args.repeat)
+        results.append(
+            dict(
+                header=cls.__name__,
+                rows=args.rows,
+                loop_ns_per_row=loop / args.rows,
+                parse_many_ns_per_row=many / args.rows,
+                speedup=f"{loop / many:.1f}x",
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""plan_range against evaluating If-Range and building the headers by hand.
+
+    python -m benchmarks.bench_range_plan [--json]
+"""
+
+from fast_header import ContentRange, ETag, Range
+from fast_header.byteranges import ByteRanges
+from fast_header.content_range import plan_range
+from fast_header.helper import construct
+
+from .common import arg_parser, measure, report
+
+SIZE = 10_000_000
+ETAG = ETag(value="5f1c-3a8")
+CASES = {
+    "single": b"bytes=1000-1999",
+    "suffix": b"bytes=-500",
+    "multipart": b"bytes=0-99, 5000-5999, 9000000-",
+}
+
+
+def by_hand(http_range: bytes, if_range: bytes) -> list:
+    tag = ETag.parse_bytes(if_range)
+    if tag.weak or ETAG.weak or tag.value != ETAG.value:
+        return [(b"content-length", str(SIZE).encode())]
+    ranges = Range.parse_bytes(http_range, SIZE, coalesce=True)
+    if not ranges:
+        return []
+    if len(ranges) == 1:
+        r = ranges[0]
+        content_range = construct(
+            ContentRange,
+            {"range": Range(start=r.start, stop=r.stop - 1), "size": SIZE},
+        )
+        return [
+            (b"content-length", str(len(r)).encode()),
+            (b"content-range", str(content_range).encode()),
+        ]
+    body = ByteRanges(ranges, SIZE, "video/mp4")
+    return [
+        (b"content-length", str(body.content_length).encode()),
+        (b"content-type", str(body.content_type).encode()),
+    ]
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    args = parser.parse_args()
+    results = []
+    for name, http_range in CASES.items():
+        if_range = b'"5f1c-3a8"'
+        hand_ns = measure(lambda: by_hand(http_range, if_range), args.repeat)
+        plan_ns = measure(
+            lambda: plan_range(
+                http_range, SIZE, if_range=if_range, etag=ETAG, content_type="video/mp4"
+            ).headers(),
+            args.repeat,
+        )
+        results.append(dict(case=name, by_hand_us=hand_ns / 1e3, plan_us=plan_ns / 1e3))
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Reassembling a multipart/byteranges body: ByteRangesReader into an mmap
+against splitting the buffered body and copying each part by hand.
+
+    python -m benchmarks.bench_reassembly [--size MB] [--ranges N] [--json]
+"""
+
+import mmap
+import os
+from typing import List
+
+from fast_header import ContentRange, Range
+from fast_header.byteranges import ByteRanges, ByteRangesReader, RangeFile
+
+from .common import arg_parser, measure, report
+
+CHUNK_SIZE = 1 << 16
+
+
+def by_hand(raw: bytes, boundary: bytes, out: bytearray) -> None:
+    # the whole body is buffered, split on the delimiter, then each part copied
+    for part in raw.split(b"--" + boundary)[1:-1]:
+        head, _, data = part.partition(b"\r\n\r\n")
+        cr = None
+        for line in head.split(b"\r\n"):
+            if line.lower().startswith(b"content-range:"):
+                cr = ContentRange.parse(line[14:].strip().decode("latin-1"))
+        assert cr is not None and cr.range is not None
+        data = data[:-2]  # CRLF before the next delimiter
+        out[cr.range.start : cr.range.stop + 1] = data
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--size", type=int, default=16, help="file size in MiB")
+    parser.add_argument("--ranges", type=int, default=64)
+    args = parser.parse_args()
+    size = args.size << 20
+    data = os.urandom(size)
+    step = size // args.ranges
+    # every other slice of the file
+    ranges: List[Range] = [
+        Range(start=i, stop=i + step // 2) for i in range(0, size - step + 1, step)
+    ]
+    body = ByteRanges(ranges, size, "application/octet-stream")
+    raw = b"".join(body.chunks(data))
+    chunks = [raw[i : i + CHUNK_SIZE] for i in range(0, len(raw), CHUNK_SIZE)]
+    boundary = body.boundary.encode()
+    out = bytearray(size)
+    target = mmap.mmap(-1, size)
+
+    def reader() -> None:
+        with RangeFile(target, size) as file:
+            r = ByteRangesReader(file, boundary)
+            for chunk in chunks:
+                r.feed(chunk)
+            r.close()
+
+    results = []
+    for name, fn in (
+        ("split+copy", lambda: by_hand(raw, boundary, out)),
+        ("ByteRangesReader", reader),
+    ):
+        ns = measure(fn, args.repeat)
+        results.append(
+            dict(
+                mode=name,
+                body_mb=len(raw) / 2**20,
+                ms=ns / 1e6,
+                mb_per_s=len(raw) / 2**20 / (ns / 1e9),
+            )
+        )
+    target.close()
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
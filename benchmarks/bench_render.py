@@ -0,0 +1,43 @@
+"""str().encode() against rendering bytes directly, and the cached to_bytes().
+
+    python -m benchmarks.bench_render [--json]
+"""
+
+from fast_header import CacheControl, ContentDisposition, ContentType, ETag
+
+from .common import arg_parser, measure, report
+
+MODELS = [
+    ContentType.parse("text/plain; charset=utf-8; format=flowed"),
+    ContentDisposition(filename="€ rates.txt"),
+    CacheControl.parse("public, max-age=60, stale-while-revalidate=30"),
+    ETag(value="abc", weak=True),
+]
+
+
+def main() -> None:
+    args = arg_parser(__doc__ or "").parse_args()
+    results = []
+    buf = bytearray()
+
+    for model in MODELS:
+
+        def render() -> None:
+            del buf[:]
+            model._render(buf)
+
+        results.append(
+            dict(
+                header=type(model).__name__,
+                str_encode_ns=measure(
+                    lambda: str(model).encode("latin-1"), args.repeat
+                ),
+                render_ns=measure(render, args.repeat),
+                to_bytes_ns=measure(model.to_bytes, args.repeat),
+            )
+        )
+    report(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import json
+import sys
+import timeit
+from typing import Any, Callable, Dict, List
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Best-of-``repeat`` time of one ``fn()`` call, in nanoseconds."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def arg_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--json", action="store_true", help="write results as JSON to stdout"
+    )
+    return parser
+
+
+def report(results: List[Dict[str, Any]], as_json: bool) -> None:
+    if as_json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    keys = list(results[0].keys()) if results else []
+    widths = [max(len(k), *(len(_fmt(r[k])) for r in results)) for k in keys]
+    print("  ".join(k.ljust(w) for k, w in zip(keys, widths)))
+    for r in results:
+        print("  ".join(_fmt(r[k]).ljust(w) for k, w in zip(keys, widths)))
+
+
+def _fmt(v: Any) -> str:
+    if isinstance(v, float):
+        return f"{v:.1f}"
+    return str(v)
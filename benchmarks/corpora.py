@@ -0,0 +1,68 @@
+"""Header values the benchmarks run against, grouped by shape."""
+
+from typing import Dict, List
+
+LONG_PARAMS = "; ".join(f"p{i}=value{i}" for i in range(20))
+
+CONTENT_TYPE: Dict[str, List[str]] = {
+    "common": [
+        "application/json",
+        "application/json; charset=utf-8",
+        "text/html; charset=UTF-8",
+        "application/x-www-form-urlencoded",
+        "multipart/form-data; boundary=----WebKitFormBoundary7MA4YWxkTrZu0gW",
+    ],
+    "quoted": [
+        'text/plain; charset="utf-8"; format="flowed"',
+        'application/xml; profile="urn:example:\\"quoted\\""',
+    ],
+    "long_params": [f"text/plain; {LONG_PARAMS}"],
+}
+
+CONTENT_DISPOSITION: Dict[str, List[str]] = {
+    "common": [
+        "inline",
+        "attachment",
+        'attachment; filename="report.pdf"',
+        'form-data; name="file"; filename="photo.jpg"',
+    ],
+    "rfc5987": [
+        "attachment; filename*=UTF-8''%E2%82%AC%20rates.pdf",
+        "attachment; filename=\"EURO rates.pdf\"; filename*=UTF-8''%E2%82%AC%20rates.pdf",
+        "attachment; filename*=ISO-8859-1''%A3%20rates.pdf",
+    ],
+    "long_params": [f"attachment; {LONG_PARAMS}"],
+}
+
+CACHE_CONTROL: Dict[str, List[str]] = {
+    "common": [
+        "no-cache",
+        "no-store",
+        "max-age=0",
+        "public, max-age=31536000, immutable",
+        "private, no-cache, no-store, must-revalidate",
+    ],
+    "all_directives": [
+        "max-age=60, s-maxage=120, max-stale=30, min-fresh=10, no-cache, "
+        "no-store, no-transform, only-if-cached, must-revalidate, "
+        "proxy-revalidate, must-understand, private, public, immutable, "
+        "stale-while-revalidate=30, stale-if-error=86400"
+    ],
+}
+
+ETAG: Dict[str, List[str]] = {
+    "common": ['"33a64df551425fcc55e4d42a148795d9f25f89d4"', 'W/"0815"'],
+}
+
+CONTENT_RANGE: Dict[str, List[str]] = {
+    "common": ["bytes 0-1023/146515", "bytes */146515", "bytes 42-1233/*"],
+}
+
+RANGE_SIZE = 10_000_000
+
+RANGE: Dict[str, List[str]] = {
+    "common": ["bytes=0-", "bytes=0-1023", "bytes=-500"],
+    "many_ranges": [
+        "bytes=" + ", ".join(f"{i * 1000}-{i * 1000 + 499}" for i in range(100))
+    ],
+}
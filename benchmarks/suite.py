@@ -0,0 +1,136 @@
+"""Time parse and __str__ for every header class over the shared corpora.
+
+Results are written as JSON so runs from two releases can be compared:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json --compare before.json
+"""
+
+from datetime import datetime, timezone
+from email.message import Message
+from importlib import metadata
+import json
+import platform
+import sys
+from typing import Any, Callable, Dict, List
+
+from fast_header import CacheControl, ContentDisposition, ContentRange, ContentType
+from fast_header import ETag, Range
+
+from . import corpora
+from .common import arg_parser, measure, report
+
+HEADERS: List[tuple[type, Dict[str, List[str]]]] = [
+    (ContentType, corpora.CONTENT_TYPE),
+    (ContentDisposition, corpora.CONTENT_DISPOSITION),
+    (CacheControl, corpora.CACHE_CONTROL),
+    (ETag, corpora.ETAG),
+    (ContentRange, corpora.CONTENT_RANGE),
+]
+
+
+def email_params(name: str) -> Callable[[str], Any]:
+    """Parameter parsing through the stdlib ``email`` package."""
+
+    def parse(value: str) -> Any:
+        msg = Message()
+        msg[name] = value
+        return msg.get_params(header=name)
+
+    return parse
+
+
+BASELINES: Dict[type, Callable[[str], Any]] = {
+    ContentType: email_params("content-type"),
+    ContentDisposition: email_params("content-disposition"),
+}
+
+
+def run_all(repeat: int) -> List[Dict[str, Any]]:
+    results = []
+
+    def add(header: str, corpus: str, op: str, fn: Callable[[], Any], n: int) -> None:
+        # ns is per header value, so corpora of different sizes compare
+        results.append(
+            dict(header=header, corpus=corpus, op=op, ns=measure(fn, repeat) / n)
+        )
+
+    for cls, groups in HEADERS:
+        for corpus, values in groups.items():
+            parsed = [cls.parse(v) for v in values]
+            n = len(values)
+            add(
+                cls.__name__, corpus, "parse", lambda: [cls.parse(v) for v in values], n
+            )
+            add(cls.__name__, corpus, "str", lambda: [str(p) for p in parsed], n)
+            if (baseline := BASELINES.get(cls)) is not None:
+                add(
+                    cls.__name__,
+                    corpus,
+                    "email.message",
+                    lambda baseline=baseline: [baseline(v) for v in values],
+                    n,
+                )
+    size = corpora.RANGE_SIZE
+    for corpus, values in corpora.RANGE.items():
+        parsed = [Range.parse(v, size) or [] for v in values]
+        n = len(values)
+        add("Range", corpus, "parse", lambda: [Range.parse(v, size) for v in values], n)
+        add(
+            "Range",
+            corpus,
+            "str",
+            lambda: [", ".join(str(r) for r in rs) for rs in parsed],
+            n,
+        )
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        version = metadata.version("fast-header")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return dict(
+        fast_header=version,
+        python=sys.version.split()[0],
+        implementation=platform.python_implementation(),
+        machine=platform.machine(),
+        timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    )
+
+
+def compare(results: List[Dict[str, Any]], path: str) -> None:
+    with open(path) as f:
+        before = {
+            (r["header"], r["corpus"], r["op"]): r["ns"]
+            for r in json.load(f)["results"]
+        }
+    for r in results:
+        old = before.get((r["header"], r["corpus"], r["op"]))
+        r["before_ns"] = old
+        r["change"] = "" if old is None else f"{(r['ns'] / old - 1) * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = arg_parser(__doc__ or "")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args()
+    results = run_all(args.repeat)
+    if args.compare:
+        compare(results, args.compare)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(dict(environment=environment(), results=results), f, indent=2)
+    if args.json:
+        json.dump(
+            dict(environment=environment(), results=results), sys.stdout, indent=2
+        )
+        sys.stdout.write("\n")
+    else:
+        report(results, False)
+
+
+if __name__ == "__main__":
+    main()
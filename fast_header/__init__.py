@@ -1,5 +1,60 @@
-from .cache_control import CacheControl
-from .etag import ETag
-from .content_disposition import ContentDisposition, Disposition
-from .content_type import ContentType
-from .content_range import Range, ContentRange
\ No newline at end of file
+from __future__ import annotations
+
+# typing is not imported at runtime, to keep `import fast_header` cheap
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, List
+
+    from .cache_control import CacheControl, CompactCacheControl
+    from .etag import ETag
+    from .content_disposition import ContentDisposition, Disposition
+    from .content_type import ContentType
+    from .content_range import Range, ContentRange
+    from .accept import Accept, MediaRange
+    from .conditional import IfMatch, IfNoneMatch
+
+# name -> submodule defining it; submodules (and pydantic) load on first access
+_LAZY = {
+    "CacheControl": "cache_control",
+    "CompactCacheControl": "cache_control",
+    "ETag": "etag",
+    "ContentDisposition": "content_disposition",
+    "Disposition": "content_disposition",
+    "ContentType": "content_type",
+    "Range": "content_range",
+    "ContentRange": "content_range",
+    "Accept": "accept",
+    "MediaRange": "accept",
+    "IfMatch": "conditional",
+    "IfNoneMatch": "conditional",
+}
+
+# spelled out for static tools; tests check it matches _LAZY
+__all__ = [
+    "CacheControl",
+    "CompactCacheControl",
+    "ETag",
+    "ContentDisposition",
+    "Disposition",
+    "ContentType",
+    "Range",
+    "ContentRange",
+    "Accept",
+    "MediaRange",
+    "IfMatch",
+    "IfNoneMatch",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib, so that -X importtime reports it
+    value = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY])
@@ -0,0 +1,238 @@
+"""Parse one header column of large line-oriented exports.
+
+    python -m fast_header cache-control access.log --column 7
+    zcat logs.tsv.gz | python -m fast_header content-disposition --normalize
+
+Lines are read lazily and parsed in chunks by a process pool, with a bounded
+number of chunks in flight, so memory does not grow with the input.
+"""
+
+import argparse
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import chain, islice
+import json
+import os
+import sys
+from typing import (
+    IO,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Type,
+)
+
+from .headers import HEADER_MODELS
+from .helper import HeaderModel
+
+CHUNK_SIZE = 10_000
+# distinct normalized values (and error messages) kept when aggregating; the
+# rarest are dropped
+MAX_DISTINCT = 100_000
+SAMPLE_ERRORS = 20
+
+
+def _model(header: str) -> Type[HeaderModel]:
+    cls = HEADER_MODELS.get(header.lower().encode("latin-1"))
+    if cls is None:
+        names = sorted(cls.HEADER_NAME for cls in HEADER_MODELS.values())
+        raise ValueError(f"unknown header {header!r}, expected one of {names}")
+    return cls
+
+
+def _value(line: bytes, column: int | None, delimiter: bytes) -> bytes | None:
+    line = line.rstrip(b"\r\n")
+    if column is None:
+        return line
+    fields = line.split(delimiter, column + 1)
+    return fields[column] if column < len(fields) else None
+
+
+def _parse(
+    cls: Type[HeaderModel], value: bytes, memo: Dict[bytes, HeaderModel | str]
+) -> HeaderModel | str:
+    ret = memo.get(value)
+    if ret is None:
+        try:
+            ret = cls.parse_bytes(value)
+        except ValueError as e:
+            ret = str(e).splitlines()[0]
+        memo[value] = ret
+    return ret
+
+
+def new_stats() -> Dict[str, Any]:
+    return dict(
+        lines=0,
+        parsed=0,
+        invalid=0,
+        missing=0,
+        fields=Counter(),
+        values=Counter(),
+        errors=Counter(),
+        samples=[],
+    )
+
+
+def merge_stats(total: Dict[str, Any], part: Dict[str, Any]) -> None:
+    for k in ("lines", "parsed", "invalid", "missing"):
+        total[k] += part[k]
+    for k in ("fields", "values", "errors"):
+        total[k].update(part[k])
+    for k in ("values", "errors"):
+        if len(total[k]) > 2 * MAX_DISTINCT:
+            total[k] = Counter(dict(total[k].most_common(MAX_DISTINCT)))
+    total["samples"].extend(part["samples"][: SAMPLE_ERRORS - len(total["samples"])])
+
+
+def stats_chunk(
+    header: str, column: int | None, delimiter: bytes, lines: Sequence[bytes]
+) -> Dict[str, Any]:
+    cls = _model(header)
+    stats = new_stats()
+    fields: Counter[str] = stats["fields"]
+    memo: Dict[bytes, HeaderModel | str] = {}
+    for line in lines:
+        stats["lines"] += 1
+        value = _value(line, column, delimiter)
+        if not value:
+            stats["missing"] += 1
+            continue
+        ret = _parse(cls, value, memo)
+        if isinstance(ret, str):
+            stats["invalid"] += 1
+            stats["errors"][ret] += 1
+            if len(stats["samples"]) < SAMPLE_ERRORS:
+                stats["samples"].append(value.decode("latin-1"))
+            continue
+        stats["parsed"] += 1
+        stats["values"][str(ret)] += 1
+        fields.update(ret.model_fields_set)
+        if ret.model_extra:
+            fields.update(ret.model_extra.keys())
+    return stats
+
+
+def normalize_chunk(
+    header: str, column: int | None, delimiter: bytes, lines: Sequence[bytes]
+) -> List[Dict[str, Any]]:
+    cls = _model(header)
+    memo: Dict[bytes, HeaderModel | str] = {}
+    ret: List[Dict[str, Any]] = []
+    for line in lines:
+        value = _value(line, column, delimiter)
+        if not value:
+            ret.append({"value": None})
+            continue
+        parsed = _parse(cls, value, memo)
+        if isinstance(parsed, str):
+            ret.append({"raw": value.decode("latin-1"), "error": parsed})
+        else:
+            ret.append({"value": str(parsed)})
+    return ret
+
+
+def _lines(paths: Sequence[str]) -> Iterator[bytes]:
+    for path in paths or ["-"]:
+        if path == "-":
+            yield from sys.stdin.buffer
+            continue
+        with open(path, "rb") as f:
+            yield from f
+
+
+def _chunks(lines: Iterable[bytes], size: int) -> Iterator[List[bytes]]:
+    it = iter(lines)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def run_chunks(
+    executor: Executor, fn: Any, chunks: Iterable[Any], in_flight: int, *args: Any
+) -> Iterator[Any]:
+    """Results of ``fn(*args, chunk)`` in input order, ``in_flight`` at a time."""
+    pending: Deque[Future] = deque()
+    for chunk in chunks:
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args, chunk))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m fast_header",
+        description="Parse one header column of line-oriented input.",
+    )
+    parser.add_argument("header", help="header name, e.g. cache-control")
+    parser.add_argument("files", nargs="*", help="input files, - for stdin")
+    parser.add_argument(
+        "-c", "--column", type=int, help="0-based column holding the header value"
+    )
+    parser.add_argument("-d", "--delimiter", default="\t", help="column separator")
+    parser.add_argument(
+        "--normalize",
+        action="store_true",
+        help="write every value re-serialized (or its error) instead of statistics",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument(
+        "--top", type=int, default=20, help="most common values in the statistics"
+    )
+    return parser
+
+
+def _write(out: IO[str], obj: Any) -> None:
+    out.write(json.dumps(obj, ensure_ascii=False))
+    out.write("\n")
+
+
+def main(argv: Sequence[str] | None = None, out: IO[str] | None = None) -> int:
+    stream: IO[str] = sys.stdout if out is None else out
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        cls = _model(args.header)
+    except ValueError as e:
+        parser.error(str(e))
+    header = cls.HEADER_NAME
+    delimiter = args.delimiter.encode("latin-1")
+    fn = normalize_chunk if args.normalize else stats_chunk
+    chunks = _chunks(_lines(args.files), args.chunk_size)
+    jobs = max(1, args.jobs)
+    with ProcessPoolExecutor(jobs) if jobs > 1 else _InlineExecutor() as executor:
+        results = run_chunks(
+            executor, fn, chunks, 2 * jobs, header, args.column, delimiter
+        )
+        if args.normalize:
+            records = chain.from_iterable(results)
+            for line, record in enumerate(records, 1):
+                _write(stream, {"line": line, **record})
+            return 0
+        total = new_stats()
+        for result in results:
+            merge_stats(total, result)
+    total["fields"] = dict(total["fields"].most_common())
+    total["values"] = dict(total["values"].most_common(args.top))
+    total["errors"] = dict(total["errors"].most_common(args.top))
+    _write(stream, {"header": header, **total})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
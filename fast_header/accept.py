@@ -0,0 +1,179 @@
+import re
+from typing import ClassVar, Self, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from .cache import LRUCache
+from .content_type import PARAM_REGEXP, QESC_REGEXP, TOKEN_REGEXP, ContentType
+from .helper import BytesLike, HeaderModel, cached_parse, construct, latin1, qstring
+
+# media-range in RFC 7231 sec 5.3.2; a bare "*" is read as "*/*" as browsers
+# and HTTP client libraries still send it
+MEDIA_RANGE_REGEXP = re.compile(
+    r"""[ \t]*(?:([!#$%&'*+.^_`|~0-9A-Za-z-]+)/([!#$%&'*+.^_`|~0-9A-Za-z-]+)|(\*))[ \t]*"""
+)
+SEPARATOR_REGEXP = re.compile(r"""(?:[ \t]*,)+[ \t]*""")
+
+
+class MediaRange(BaseModel):
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    type: str
+    parameters: Tuple[Tuple[str, str], ...] = ()
+    q: float = 1.0
+
+    @property
+    def specificity(self) -> int:
+        if self.type == "*/*":
+            return 0
+        if self.type.endswith("/*"):
+            return 1
+        return 3 if self.parameters else 2
+
+    def matches(self, content_type: ContentType) -> bool:
+        if self.type != "*/*":
+            if self.type.endswith("/*"):
+                if not content_type.type.startswith(self.type[:-1]):
+                    return False
+            elif self.type != content_type.type:
+                return False
+        if self.parameters:
+            params = content_type.parameters
+            for k, v in self.parameters:
+                if params.get(k) != v:
+                    return False
+        return True
+
+    def __str__(self) -> str:
+        ret = self.type
+        for k, v in self.parameters:
+            ret += f"; {k}={v if TOKEN_REGEXP.search(v) else qstring(v)}"
+        if self.q != 1.0:
+            ret += f"; q={self.q:g}"
+        return ret
+
+
+def _q_value(text: str) -> float:
+    try:
+        q = float(text)
+    except ValueError:
+        raise ValueError("invalid q-value")
+    if not 0.0 <= q <= 1.0:
+        raise ValueError("invalid q-value")
+    return q
+
+
+class Accept(HeaderModel):
+    HEADER_NAME: ClassVar[str] = "Accept"
+    # most preferred first: by q-value, then specificity, then header order
+    ranges: Tuple[MediaRange, ...] = ()
+
+    @classmethod
+    @cached_parse
+    def parse(cls, text: str) -> Self:
+        ranges = []
+        index = 0
+        if m := SEPARATOR_REGEXP.match(text):
+            index = m.end()
+        while index != len(text):
+            m = MEDIA_RANGE_REGEXP.match(text, index)
+            if m is None:
+                raise ValueError("invalid media range")
+            index = m.end()
+            if m.group(3) is not None:
+                type = "*/*"
+            elif m.group(1) == "*" and m.group(2) != "*":
+                raise ValueError("invalid media range")
+            else:
+                type = f"{m.group(1)}/{m.group(2)}".lower()
+            params = []
+            q = 1.0
+            while m := PARAM_REGEXP.match(text, index):
+                index = m.end()
+                key = m.group(1).lower()
+                value = m.group(2)
+                if key == "q":
+                    q = _q_value(value)
+                    # what follows q is accept-ext, which is not part of the range
+                    while m := PARAM_REGEXP.match(text, index):
+                        index = m.end()
+                    break
+                if value[0] == '"':
+                    value = QESC_REGEXP.sub(lambda x: x.group(1), value[1:-1])
+                params.append((key, value))
+            ranges.append(
+                construct(
+                    MediaRange, {"type": type, "parameters": tuple(params), "q": q}
+                )
+            )
+            if index == len(text):
+                break
+            m = SEPARATOR_REGEXP.match(text, index)
+            if m is None:
+                raise ValueError("invalid media range")
+            index = m.end()
+        # stable, so equal preferences keep their header order
+        ranges.sort(key=lambda r: (-r.q, -r.specificity))
+        return construct(cls, {"ranges": tuple(ranges)})
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike) -> Self:
+        return cls.parse(latin1(bytes(data)))
+
+    def negotiate(self, available: Sequence[ContentType]) -> ContentType | None:
+        """The offer the client prefers most, or None if it accepts none."""
+        best = None
+        best_key = None
+        for i, offer in enumerate(available):
+            # the most specific matching range decides the offer's q-value
+            match = None
+            for r in self.ranges:
+                if r.matches(offer) and (
+                    match is None or r.specificity > match.specificity
+                ):
+                    match = r
+            if match is None or match.q == 0.0:
+                continue
+            key = (match.q, match.specificity, -i)
+            if best_key is None or key > best_key:
+                best = offer
+                best_key = key
+        return best
+
+    def __str__(self) -> str:
+        return ", ".join(str(r) for r in self.ranges)
+
+
+NEGOTIATION_CACHE: LRUCache[
+    Tuple[str | None, Tuple[ContentType | str, ...]], ContentType | None
+] = LRUCache(1024)
+
+
+def negotiate(
+    accept: str | None, available: Sequence[ContentType | str]
+) -> ContentType | None:
+    """Pick the best of ``available`` for an ``Accept`` header value.
+
+    Results are memoized per (header, offers), since a handful of Accept
+    values make up almost all traffic. A missing or malformed header accepts
+    anything, so the first offer wins.
+    """
+    return NEGOTIATION_CACHE.get_or_compute(
+        (accept, tuple(available)), _negotiate, accept, available
+    )
+
+
+def _negotiate(
+    accept: str | None, available: Sequence[ContentType | str]
+) -> ContentType | None:
+    offers = [ContentType.parse(o) if isinstance(o, str) else o for o in available]
+    if not offers:
+        return None
+    if not accept:
+        return offers[0]
+    try:
+        parsed = Accept.parse(accept)
+    except ValueError:
+        return offers[0]
+    return parsed.negotiate(offers)
@@ -0,0 +1,83 @@
+from typing import Any, Awaitable, Callable, Iterable, List, MutableMapping, Tuple
+
+from .headers import Headers
+from .helper import HeaderModel
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+SCOPE_KEY = "fast_header.headers"
+# messages whose "headers" go out to the client
+RESPONSE_START_TYPES = frozenset(
+    ("http.response.start", "websocket.accept", "websocket.http.response.start")
+)
+
+
+def get_headers(scope: Scope) -> Headers:
+    """The typed view of the request headers, shared by everything in the request.
+
+    Works with or without ``HeadersMiddleware``; the first caller creates it.
+    """
+    headers = scope.get(SCOPE_KEY)
+    if headers is None:
+        headers = scope[SCOPE_KEY] = Headers(scope.get("headers", ()))
+    return headers
+
+
+def render_headers(headers: Iterable[Any]) -> List[Tuple[bytes, bytes]]:
+    """Replace ``HeaderModel`` entries of a response header list by raw pairs.
+
+    An entry may be a model, rendered under its own header name, or a
+    ``(name, model)`` pair. A list is returned unchanged when it holds no
+    model; any other iterable is copied into a list first.
+    """
+    if not isinstance(headers, list):
+        headers = list(headers)
+    for i, item in enumerate(headers):
+        if isinstance(item, HeaderModel) or isinstance(item[1], HeaderModel):
+            break
+    else:
+        return headers
+    ret = headers[:i]
+    for item in headers[i:]:
+        if isinstance(item, HeaderModel):
+            ret.append(item.to_header())
+        elif isinstance(item[1], HeaderModel):
+            ret.append((item[0], item[1].to_bytes()))
+        else:
+            ret.append(item)
+    return ret
+
+
+class HeadersMiddleware:
+    """ASGI middleware sharing one lazily parsed ``Headers`` view per request.
+
+    The view is stored in ``scope["fast_header.headers"]`` (see
+    ``get_headers``), so each header is parsed at most once whichever layer
+    asks first. Response header lists sent by the app may hold models; they
+    are rendered to bytes on the way out.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        scope = dict(scope)
+        scope[SCOPE_KEY] = Headers(scope.get("headers", ()))
+
+        async def send_rendered(message: Message) -> None:
+            if message["type"] in RESPONSE_START_TYPES and (
+                headers := message.get("headers")
+            ):
+                rendered = render_headers(headers)
+                if rendered is not headers:
+                    message = {**message, "headers": rendered}
+            await send(message)
+
+        await self.app(scope, receive, send_rendered)
@@ -0,0 +1,297 @@
+from bisect import bisect_left, bisect_right
+from mmap import mmap
+import os
+import secrets
+from typing import (
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Self,
+    Sequence,
+    Tuple,
+    overload,
+)
+
+from .content_range import ContentRange, Range
+from .content_type import ContentType
+from .headers import Headers
+from .helper import construct
+from .multipart import (
+    MAX_HEADER_SIZE,
+    Event,
+    MultipartParser,
+    PartData,
+    PartEnd,
+    RangePartStart,
+)
+
+
+class FileRegion(NamedTuple):
+    """A slice of a file, in the argument order of ``os.sendfile``."""
+
+    fd: int
+    offset: int
+    # not "count", which would shadow tuple.count
+    length: int
+
+
+Chunk = bytes | memoryview | FileRegion
+
+
+class ByteRanges:
+    """Body of a ``multipart/byteranges`` response.
+
+    ``ranges`` are the (end-exclusive) ranges returned by ``Range.parse``.
+    Part headers are rendered once up front, so ``content_length`` is known
+    before any data is read.
+    """
+
+    def __init__(
+        self,
+        ranges: Sequence[Range],
+        size: int,
+        content_type: ContentType | str | None = None,
+        boundary: str | None = None,
+    ):
+        self.boundary = boundary or secrets.token_hex(16)
+        self.content_type = ContentType.multipart(self.boundary)
+        delimiter = b"--" + self.boundary.encode("latin-1")
+        part_type = (
+            b"Content-Type: " + str(content_type).encode("latin-1") + b"\r\n"
+            if content_type is not None
+            else b""
+        )
+        self.parts: List[Tuple[bytes, Range]] = []
+        # the ContentRange rendering, without building one per part
+        content_range = b"Content-Range: bytes %d-%d/" + b"%d" % size + b"\r\n\r\n"
+        for i, r in enumerate(ranges):
+            head = b"".join(
+                (
+                    b"\r\n" if i else b"",
+                    delimiter,
+                    b"\r\n",
+                    part_type,
+                    content_range % (r.start, r.stop - 1),
+                )
+            )
+            self.parts.append((head, r))
+        self.tail = b"\r\n" + delimiter + b"--\r\n"
+        self.content_length = len(self.tail) + sum(
+            len(head) + r.stop - r.start for head, r in self.parts
+        )
+
+    @overload
+    def chunks(self, source: int) -> Iterator[bytes | FileRegion]: ...
+
+    @overload
+    def chunks(
+        self, source: mmap | bytes | bytearray | memoryview
+    ) -> Iterator[bytes | memoryview]: ...
+
+    def chunks(
+        self, source: int | mmap | bytes | bytearray | memoryview
+    ) -> Iterator[Chunk]:
+        """Yield the body as pre-rendered headers and slices of ``source``.
+
+        A file descriptor yields ``FileRegion`` tuples for ``os.sendfile``;
+        a buffer or mmap yields zero-copy ``memoryview`` slices.
+        """
+        if isinstance(source, int):
+            for head, r in self.parts:
+                yield head
+                yield FileRegion(source, r.start, r.stop - r.start)
+        else:
+            view = memoryview(source)
+            for head, r in self.parts:
+                yield head
+                yield view[r.start : r.stop]
+        yield self.tail
+
+    async def achunks(
+        self, source: int | mmap | bytes | bytearray | memoryview
+    ) -> AsyncIterator[Chunk]:
+        for chunk in self.chunks(source):
+            yield chunk
+
+
+class ByteRangesParser(MultipartParser):
+    """``multipart/byteranges`` response body parser (RFC 9110 sec 14.6).
+
+    Each part starts with a ``RangePartStart`` carrying its parsed
+    ``Content-Range``, which must be a satisfied byte range.
+    """
+
+    def _part_start(self, headers: Headers) -> Event:
+        raw = headers.get_raw(b"content-range")
+        if raw is None:
+            raise ValueError("missing Content-Range in byteranges part")
+        content_range = ContentRange.parse_bytes(raw)
+        r = content_range.range
+        if (
+            content_range.unit != "bytes"
+            or r is None
+            or r.stop < r.start
+            or (content_range.size is not None and r.stop >= content_range.size)
+        ):
+            raise ValueError(f"invalid byteranges part Content-Range {raw!r}")
+        return RangePartStart(headers, content_range, r.start, r.stop + 1)
+
+
+class RangeFile:
+    """A pre-sized mmap, buffer or file descriptor being filled by byte ranges.
+
+    ``write`` puts data at its offset, with ``os.pwrite`` for a descriptor,
+    and records the written interval, so ``missing`` tells a resumed
+    download exactly which ranges to ask for. Close it (or use it as a
+    context manager) before closing an mmap target.
+    """
+
+    def __init__(
+        self,
+        target: int | mmap | bytearray | memoryview,
+        size: int,
+        filled: Iterable[Range] = (),
+    ):
+        self.size = size
+        self._fd = -1
+        self._view: memoryview | None = None
+        if isinstance(target, int):
+            self._fd = target
+        else:
+            self._view = memoryview(target).cast("B")
+            if len(self._view) != size:
+                raise ValueError(f"target holds {len(self._view)} bytes, not {size}")
+        # sorted, disjoint and non-adjacent [start, stop) intervals
+        self._starts: List[int] = []
+        self._stops: List[int] = []
+        for r in filled:
+            self._add(r.start, r.stop)
+
+    def write(self, offset: int, data: bytes | bytearray | memoryview) -> None:
+        data = memoryview(data).cast("B")
+        stop = offset + len(data)
+        if offset < 0 or stop > self.size:
+            raise ValueError(f"bytes {offset}-{stop - 1} are outside of {self.size}")
+        if self._view is not None:
+            self._view[offset:stop] = data
+        else:
+            pos = offset
+            while data:
+                n = os.pwrite(self._fd, data, pos)
+                data = data[n:]
+                pos += n
+        self._add(offset, stop)
+
+    def close(self) -> None:
+        """Release the view of the target, so that an mmap can be closed."""
+        if self._view is not None:
+            self._view.release()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _add(self, start: int, stop: int) -> None:
+        if start >= stop:
+            return
+        starts = self._starts
+        stops = self._stops
+        # intervals [i, j) overlap or touch [start, stop)
+        i = bisect_left(stops, start)
+        j = bisect_right(starts, stop)
+        if i < j:
+            start = min(start, starts[i])
+            stop = max(stop, stops[j - 1])
+        starts[i:j] = [start]
+        stops[i:j] = [stop]
+
+    @property
+    def filled(self) -> List[Range]:
+        return [
+            construct(Range, {"start": start, "stop": stop})
+            for start, stop in zip(self._starts, self._stops)
+        ]
+
+    def missing(self) -> List[Range]:
+        """The ranges not written yet, end-exclusive like ``Range.parse``."""
+        ret = []
+        pos = 0
+        for start, stop in zip(self._starts, self._stops):
+            if start > pos:
+                ret.append(construct(Range, {"start": pos, "stop": start}))
+            pos = stop
+        if pos < self.size:
+            ret.append(construct(Range, {"start": pos, "stop": self.size}))
+        return ret
+
+    @property
+    def complete(self) -> bool:
+        return self.size == 0 or (self._starts == [0] and self._stops == [self.size])
+
+    def range_header(self) -> str | None:
+        """``Range`` header value requesting what is missing, if anything."""
+        missing = self.missing()
+        if not missing:
+            return None
+        return "bytes=" + ", ".join(f"{r.start}-{r.stop - 1}" for r in missing)
+
+
+class ByteRangesReader:
+    """Write a ``multipart/byteranges`` response body into a ``RangeFile``.
+
+    ``feed`` takes body chunks and writes every part at the offset of its
+    ``Content-Range`` as soon as its bytes arrive, from slices of the fed
+    chunks. Should the body be cut short or malformed, ``file.missing()``
+    still tells exactly what was not written.
+    """
+
+    def __init__(
+        self,
+        file: RangeFile,
+        boundary: str | bytes,
+        max_header_size: int = MAX_HEADER_SIZE,
+    ):
+        self.file = file
+        self.parser = ByteRangesParser(boundary, max_header_size)
+        self._offset = 0
+        self._stop = 0
+
+    @classmethod
+    def from_content_type(
+        cls, content_type: ContentType, file: RangeFile, **kwargs
+    ) -> Self:
+        boundary = content_type.parameters.get("boundary")
+        if not boundary:
+            raise ValueError("missing boundary parameter")
+        return cls(file, boundary, **kwargs)
+
+    @property
+    def done(self) -> bool:
+        return self.parser.done
+
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        for event in self.parser.feed(data):
+            if isinstance(event, PartData):
+                offset = self._offset
+                if offset + len(event.data) > self._stop:
+                    raise ValueError("byteranges part longer than its Content-Range")
+                self.file.write(offset, event.data)
+                self._offset = offset + len(event.data)
+            elif isinstance(event, RangePartStart):
+                size = event.content_range.size
+                if size is not None and size != self.file.size:
+                    raise ValueError(
+                        f"Content-Range size {size} is not the file size "
+                        f"{self.file.size}"
+                    )
+                self._offset = event.start
+                self._stop = event.stop
+            elif isinstance(event, PartEnd) and self._offset != self._stop:
+                raise ValueError("byteranges part shorter than its Content-Range")
+
+    def close(self) -> None:
+        self.parser.close()
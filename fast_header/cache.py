@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Generic, Hashable, NamedTuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """Size-bounded mapping that evicts the least recently used entry.
+
+    Values are shared between callers, so they must be immutable.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def get_or_compute(self, key: K, compute: Callable[..., V], *args: Any) -> V:
+        data = self._data
+        with self._lock:
+            if key in data:
+                data.move_to_end(key)
+                self.hits += 1
+                return data[key]
+            self.misses += 1
+        # Computed outside the lock: a racing miss only costs a second compute
+        value = compute(*args)
+        with self._lock:
+            data[key] = value
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._data)
+        )
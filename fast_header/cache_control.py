@@ -1,11 +1,57 @@
-from io import StringIO
 import re
-from typing import Annotated, ClassVar, List, Self
+import struct
+from typing import Annotated, Any, Callable, ClassVar, Dict, Iterable, Self, Tuple
 from pydantic import Field
 
-from .helper import HeaderModel, Invalid2None
+from .cache import LRUCache
+from .helper import (
+    BytesLike,
+    HeaderModel,
+    Invalid2None,
+    cached_parse,
+    construct,
+    latin1,
+    value_key,
+)
 
 HEADER_REGEXP = re.compile(r'([a-zA-Z][a-zA-Z_-]*)\s*(?:=(?:"([^"]*)"|([^ \t",;]*)))?')
+# One match per directive: (name, "=" if a value follows, quoted value, token value)
+DIRECTIVE_REGEXP = re.compile(
+    r'([a-zA-Z][a-zA-Z_-]*)\s*(?:(=)(?:"([^"]*)"|([^ \t",;]*)))?'
+)
+# \x1c-\x1f, \x85 and \xa0 are whitespace to the str pattern as well
+B_DIRECTIVE_REGEXP = re.compile(
+    rb'([a-zA-Z][a-zA-Z_-]*)[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0]*(?:(=)(?:"([^"]*)"|([^ \t",;]*)))?'
+)
+
+INT_REGEXP = re.compile(r"[+-]?[0-9]+\Z")
+# Spellings pydantic accepts for a bool
+TRUE_VALUES = frozenset(("1", "on", "t", "true", "y", "yes"))
+FALSE_VALUES = frozenset(("0", "off", "f", "false", "n", "no"))
+
+
+def _to_int(v: str | bool) -> int | None:
+    if not isinstance(v, str):  # a directive without a value
+        return 1
+    return int(v) if INT_REGEXP.match(v) else None
+
+
+def _to_bool(v: str | bool) -> bool | None:
+    if not isinstance(v, str):
+        return True
+    v = v.lower()
+    if v in TRUE_VALUES:
+        return True
+    if v in FALSE_VALUES:
+        return False
+    return None
+
+
+def _to_int_or_bool(v: str | bool) -> int | bool | None:
+    if v is True:
+        return True
+    ret = _to_int(v)
+    return _to_bool(v) if ret is None else ret
 
 
 class CacheControl(HeaderModel):
@@ -60,17 +106,14 @@ class CacheControl(HeaderModel):
     )
 
     @classmethod
+    @cached_parse
     def parse(cls, text: str | None) -> Self:
-        if not text:
-            return cls()
-        return cls.model_validate(
-            {
-                cls.__alias_mapping__.get(m.group(1), m.group(1)): cls.parse_value(
-                    m.group(0)
-                )
-                for m in HEADER_REGEXP.finditer(text)
-            }
-        )
+        return construct(cls, parse_fields(text) if text else {})
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike | None) -> Self:
+        return construct(cls, parse_fields_bytes(data) if data else {})
 
     @classmethod
     def parse_value(cls, text: str) -> str | bool:
@@ -79,25 +122,416 @@ class CacheControl(HeaderModel):
             return True
         return tokens[1]
 
-    def __str__(self) -> str:
-        io = StringIO()
-        for name, info in self.model_fields.items():
-            v = getattr(self, name)
-            alias = self.__field_alias__(info)
-            if isinstance(alias, List):
-                name = alias[0]
-            elif isinstance(alias, str):
-                name = alias
-            if v is None:
+    def combine(self, other: "CacheControl") -> "CacheControl":
+        """The most restrictive of two values; see ``combine``."""
+        key = (value_key(self), value_key(other))
+        return COMBINE_CACHE.get_or_compute(key, combine, self, other)
+
+    def override(self, **fields: Any) -> Self:
+        """Copy with ``fields`` set as given; ``False``/``None`` removes one.
+
+        Values are not validated, so they must be of the field's type.
+        """
+        cls = type(self)
+        if unknown := fields.keys() - cls.model_fields.keys():
+            raise TypeError(f"unknown CacheControl fields: {sorted(unknown)}")
+        values = self.__dict__
+        return construct(cls, {**{k: values[k] for k in cls.model_fields}, **fields})
+
+    def _render(self, buf: bytearray) -> None:
+        values = self.__dict__
+        ret = []
+        for field, name, name_eq in B_SERIALIZED_NAMES:
+            v = values[field]
+            if v is None or v is False:
                 continue
-            if v is False:
+            ret.append(name if v is True else name_eq + str(v).encode())
+        buf += b", ".join(ret)
+
+    def __str__(self) -> str:
+        values = self.__dict__
+        ret = []
+        for field, name in self.__serialized_names__:
+            v = values[field]
+            if v is None or v is False:
                 continue
-            if v is True:
-                io.write(name)
-                io.write(", ")
-            else:
-                io.write(name)
-                io.write("=")
-                io.write(str(v))
-                io.write(", ")
-        return io.getvalue().removesuffix(", ")
+            ret.append(name if v is True else f"{name}={v}")
+        return ", ".join(ret)
+
+
+def parse_fields(text: str) -> Dict[str, Any]:
+    """Field values of the directives in ``text``; unknown directives are skipped."""
+    fields = {}
+    for name, eq, quoted, token in DIRECTIVE_REGEXP.findall(text):
+        d = DIRECTIVES.get(name) or DIRECTIVES.get(name.lower())
+        if d is not None:
+            fields[d[0]] = d[1](quoted or token) if eq else d[2]
+    return fields
+
+
+def parse_fields_bytes(data: BytesLike) -> Dict[str, Any]:
+    fields = {}
+    for name, eq, quoted, token in B_DIRECTIVE_REGEXP.findall(data):
+        d = B_DIRECTIVES.get(name) or B_DIRECTIVES.get(name.lower())
+        if d is not None:
+            fields[d[0]] = d[1](latin1(quoted or token)) if eq else d[2]
+    return fields
+
+
+# directives that only restrict caching, kept if either side has one
+RESTRICTIVE_FIELDS = (
+    "no_cache",
+    "no_store",
+    "no_transform",
+    "only_if_cached",
+    "must_revalidate",
+    "proxy_revalidate",
+    "must_understand",
+    "private",
+)
+# limits in seconds, the smaller one wins
+MAX_SECONDS_FIELDS = ("max_age", "s_maxage", "stale_while_revalidate", "stale_if_error")
+
+
+def _smaller(a: int | bool | None, b: int | bool | None) -> int | bool | None:
+    # None and False are unset, True is unbounded
+    if a is None or a is False:
+        return b
+    if b is None or b is False or b is True:
+        return a
+    return b if a is True else min(a, b)
+
+
+def combine(a: CacheControl, b: CacheControl) -> CacheControl:
+    """The most restrictive of ``a`` and ``b``: what both allow.
+
+    A directive missing on one side leaves the other's in place. Restricting
+    directives are kept if either side has them, the smaller ``max-age``,
+    ``s-maxage``, ``max-stale`` and stale windows and the larger
+    ``min-fresh`` win, ``private`` drops ``public``, and ``no-cache`` or
+    ``no-store`` drop ``immutable``.
+    """
+    va = a.__dict__
+    vb = b.__dict__
+    fields: Dict[str, Any] = {f: True for f in RESTRICTIVE_FIELDS if va[f] or vb[f]}
+    for f in MAX_SECONDS_FIELDS + ("max_stale",):
+        if (v := _smaller(va[f], vb[f])) is not None and v is not False:
+            fields[f] = v
+    x, y = va["min_fresh"], vb["min_fresh"]
+    if x is not None or y is not None:
+        fields["min_fresh"] = max(v for v in (x, y) if v is not None)
+    if (va["public"] or vb["public"]) and "private" not in fields:
+        fields["public"] = True
+    if (va["immutable"] or vb["immutable"]) and not (
+        "no_cache" in fields or "no_store" in fields
+    ):
+        fields["immutable"] = True
+    return construct(CacheControl, fields)
+
+
+# Same coercions the field validators apply, per field
+CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    name: (
+        _to_int_or_bool
+        if info.annotation == int | bool
+        else _to_bool if info.annotation is bool else _to_int
+    )
+    for name, info in CacheControl.model_fields.items()
+}
+
+# directive name -> (field, converter for its value, value when given bare)
+DIRECTIVES: Dict[str, Tuple[str, Callable[[Any], Any], Any]] = {
+    name: (field, CONVERTERS[field], CONVERTERS[field](True))
+    for name, field in (
+        *((field, field) for field in CacheControl.model_fields),
+        *CacheControl.__alias_mapping__.items(),
+    )
+}
+B_DIRECTIVES = {name.encode(): d for name, d in DIRECTIVES.items()}
+# Packed layout of a CacheControl, as used by columnar output: one bit per
+# directive that can be given bare (max-stale included), and the fields holding
+# a number of seconds, -1 when absent
+FLAG_BITS: Dict[str, int] = {
+    field: 1 << i
+    for i, field in enumerate(
+        field
+        for field, info in CacheControl.model_fields.items()
+        if info.annotation is bool or info.annotation == int | bool
+    )
+}
+INT_FIELDS: Tuple[str, ...] = tuple(
+    field
+    for field, info in CacheControl.model_fields.items()
+    if info.annotation == int | None or info.annotation == int | bool
+)
+UNSET = -1
+# RFC 9111 sec 1.2.2: larger delta-seconds mean 2**31; negative ones are invalid
+DELTA_SECONDS_MAX = 2**31 - 1
+_INT_INDEX = {field: i for i, field in enumerate(INT_FIELDS)}
+
+
+def pack_fields(fields: Dict[str, Any]) -> Tuple[int, ...]:
+    """``(flags, *ints)`` of CacheControl field values in the packed layout.
+
+    Unset and invalid values are dropped; seconds are clamped into
+    ``[0, DELTA_SECONDS_MAX]``.
+    """
+    flags = 0
+    ints = [UNSET] * len(INT_FIELDS)
+    for field, v in fields.items():
+        if v is None or v is False:
+            continue
+        if bit := FLAG_BITS.get(field):
+            flags |= bit
+        if v is not True and field in _INT_INDEX:
+            ints[_INT_INDEX[field]] = min(max(v, 0), DELTA_SECONDS_MAX)
+    return (flags, *ints)
+
+
+def unpack_fields(flags: int, ints: Iterable[int]) -> Dict[str, Any]:
+    """CacheControl field values of a packed layout, only those that are set."""
+    fields: Dict[str, Any] = {
+        field: True for field, bit in FLAG_BITS.items() if flags & bit
+    }
+    for field, v in zip(INT_FIELDS, ints):
+        if v != UNSET:
+            fields[field] = v
+    return fields
+
+
+# (field, b"name", b"name=") in serialization order, for render_into
+B_SERIALIZED_NAMES = tuple(
+    (field, name.encode(), name.encode() + b"=")
+    for field, name in CacheControl.__serialized_names__
+)
+
+# INT_FIELDS as int32, native order
+INTS_STRUCT = struct.Struct(f"{len(INT_FIELDS)}i")
+UNSET_INTS = INTS_STRUCT.pack(*(UNSET for _ in INT_FIELDS))
+# (name, index in INT_FIELDS or -1, flag bit or 0) in serialization order
+COMPACT_SERIALIZED_NAMES = tuple(
+    (name, _INT_INDEX.get(field, -1), FLAG_BITS.get(field, 0))
+    for field, name in CacheControl.__serialized_names__
+)
+
+
+class CompactCacheControl:
+    """Immutable ``CacheControl`` packed into a flag word and an int32 array.
+
+    An instance is about 100 bytes against over a kilobyte for the model,
+    and values with the same directives share one instance when the parse
+    cache is on. Flags follow ``FLAG_BITS`` and the array ``INT_FIELDS``;
+    seconds are clamped like ``pack_fields`` does, and invalid values
+    dropped. Fields read like on the model (``compact.max_age``).
+
+    ``a | b`` has the directives of either, with the smaller of two values;
+    ``a & b`` those of both, with the larger value. ``a <= b`` when
+    ``a | b == b``.
+    """
+
+    __slots__ = ("flags", "_ints")
+    __parse_cache__: ClassVar[LRUCache[Any, Any] | None] = None
+
+    flags: int
+    _ints: bytes
+
+    def __init__(self, flags: int = 0, ints: Iterable[int] | None = None):
+        object.__setattr__(self, "flags", flags)
+        object.__setattr__(
+            self, "_ints", UNSET_INTS if ints is None else INTS_STRUCT.pack(*ints)
+        )
+
+    @classmethod
+    def enable_parse_cache(cls, maxsize: int = 1024) -> LRUCache[Any, Self]:
+        cls.__parse_cache__ = LRUCache(maxsize)
+        return cls.__parse_cache__
+
+    @classmethod
+    def disable_parse_cache(cls) -> None:
+        cls.__parse_cache__ = None
+
+    @classmethod
+    @cached_parse
+    def parse(cls, text: str | None) -> Self:
+        flags, *ints = pack_fields(parse_fields(text) if text else {})
+        return cls(flags, ints)
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike | None) -> Self:
+        flags, *ints = pack_fields(parse_fields_bytes(data) if data else {})
+        return cls(flags, ints)
+
+    @classmethod
+    def from_model(cls, cc: CacheControl) -> Self:
+        values = cc.__dict__
+        flags, *ints = pack_fields(
+            {field: values[field] for field in CacheControl.model_fields}
+        )
+        return cls(flags, ints)
+
+    def to_model(self) -> CacheControl:
+        return construct(CacheControl, unpack_fields(self.flags, self.ints))
+
+    @property
+    def ints(self) -> Tuple[int, ...]:
+        return INTS_STRUCT.unpack(self._ints)
+
+    def __getattr__(self, name: str) -> Any:
+        bit = FLAG_BITS.get(name)
+        i = _INT_INDEX.get(name)
+        if bit is None and i is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        v = UNSET if i is None else self.ints[i]
+        if v != UNSET:
+            return v
+        if bit is not None:
+            return bool(self.flags & bit)
+        return None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__!r} object is immutable")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.flags, self.ints)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactCacheControl):
+            return NotImplemented
+        return self.flags == other.flags and self._ints == other._ints
+
+    def __hash__(self) -> int:
+        return hash((self.flags, self._ints))
+
+    def __or__(self, other: Self) -> Self:
+        if not isinstance(other, CompactCacheControl):
+            return NotImplemented
+        return type(self)(
+            self.flags | other.flags,
+            (
+                b if a == UNSET else a if b == UNSET else min(a, b)
+                for a, b in zip(self.ints, other.ints)
+            ),
+        )
+
+    def __and__(self, other: Self) -> Self:
+        if not isinstance(other, CompactCacheControl):
+            return NotImplemented
+        return type(self)(
+            self.flags & other.flags,
+            (
+                UNSET if UNSET in (a, b) else max(a, b)
+                for a, b in zip(self.ints, other.ints)
+            ),
+        )
+
+    def __le__(self, other: Self) -> bool:
+        if not isinstance(other, CompactCacheControl):
+            return NotImplemented
+        return self | other == other
+
+    def __lt__(self, other: Self) -> bool:
+        if not isinstance(other, CompactCacheControl):
+            return NotImplemented
+        return self != other and self <= other
+
+    def __ge__(self, other: Self) -> bool:
+        if not isinstance(other, CompactCacheControl):
+            return NotImplemented
+        return other <= self
+
+    def __gt__(self, other: Self) -> bool:
+        if not isinstance(other, CompactCacheControl):
+            return NotImplemented
+        return other < self
+
+    def __str__(self) -> str:
+        flags = self.flags
+        ints = INTS_STRUCT.unpack(self._ints)
+        ret = []
+        for name, i, bit in COMPACT_SERIALIZED_NAMES:
+            if i >= 0 and ints[i] != UNSET:
+                ret.append(f"{name}={ints[i]}")
+            elif flags & bit:
+                ret.append(name)
+        return ", ".join(ret)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.parse({str(self)!r})"
+
+
+# (a, b) -> a.combine(b)
+# keyed by value_key, as 1 == True would make max-stale=1 hit max-stale
+COMBINE_CACHE: LRUCache[Tuple[Tuple, Tuple], CacheControl] = LRUCache(4096)
+
+
+class CacheControlPolicy:
+    """What a proxy does to the ``Cache-Control`` of every response it passes.
+
+    The origin's value is combined with ``restrict`` (most restrictive wins,
+    see ``combine``), then the ``override`` fields are set as given; so
+    ``CacheControlPolicy("private, max-age=300", immutable=False)`` forces
+    ``private``, caps ``max-age`` at 300 and strips ``immutable``. Results
+    are memoized per origin value, parsed or raw.
+    """
+
+    def __init__(
+        self,
+        restrict: CacheControl | str | None = None,
+        *,
+        maxsize: int = 4096,
+        **override: Any,
+    ):
+        if unknown := override.keys() - CacheControl.model_fields.keys():
+            raise TypeError(f"unknown CacheControl fields: {sorted(unknown)}")
+        self.restrict: CacheControl | None = (
+            CacheControl.parse(restrict) if isinstance(restrict, str) else restrict
+        )
+        self.override = override
+        # keyed by value_key, see COMBINE_CACHE
+        self.cache: LRUCache[Tuple, CacheControl] = LRUCache(maxsize)
+        self.value_cache: LRUCache[str | bytes | None, bytes] = LRUCache(maxsize)
+
+    def apply(self, origin: CacheControl) -> CacheControl:
+        return self.cache.get_or_compute(value_key(origin), self._apply, origin)
+
+    def apply_value(self, value: str | BytesLike | None) -> bytes:
+        """``apply`` to a raw header value, rendered back to bytes."""
+        if not isinstance(value, (str, bytes)) and value is not None:
+            value = bytes(value)
+        return self.value_cache.get_or_compute(value, self._apply_value, value)
+
+    def _apply(self, origin: CacheControl) -> CacheControl:
+        ret = origin if self.restrict is None else combine(origin, self.restrict)
+        return ret.override(**self.override) if self.override else ret
+
+    def _apply_value(self, value: str | bytes | None) -> bytes:
+        if isinstance(value, bytes):
+            origin = CacheControl.parse_bytes(value)
+        else:
+            origin = CacheControl.parse(value)
+        return self.apply(origin).to_bytes()
+
+
+# Interned so that parsing or building one of these returns a shared instance
+COMMON_CACHE_CONTROLS = (
+    "no-cache",
+    "no-store",
+    "no-cache, no-store",
+    "no-cache, no-store, must-revalidate",
+    "private",
+    "private, no-cache",
+    "private, max-age=0",
+    "public",
+    "max-age=0",
+    "max-age=0, must-revalidate",
+    "max-age=0, private, must-revalidate",
+    "public, max-age=3600",
+    "public, max-age=86400",
+    "public, max-age=31536000",
+    "public, max-age=31536000, immutable",
+)
+for _value in COMMON_CACHE_CONTROLS:
+    CacheControl.intern(CacheControl.parse(_value))
@@ -0,0 +1,216 @@
+"""Parse a column of raw header values into compact arrays instead of models.
+
+Repeated values are parsed once per call, and rows hold small integer codes
+into per-call tables, so memory is a few bytes per row. ``to_numpy`` turns
+the columns into a NumPy structured array when NumPy is installed.
+"""
+
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from .cache_control import (
+    FLAG_BITS,
+    INT_FIELDS,
+    CacheControl,
+    pack_fields,
+    parse_fields,
+    parse_fields_bytes,
+    unpack_fields,
+)
+from .content_type import ContentType
+from .helper import BytesLike, construct, import_numpy
+
+# type codes of rows without a value, and of rows that failed to parse
+MISSING = -1
+INVALID = -2
+
+Value = str | BytesLike | None
+
+
+def _key(value: Value) -> str | bytes | None:
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+
+def _row_ids(
+    values: Iterable[Value],
+    rows: List[Any],
+    memo_size: int,
+    parse: Callable[[str | bytes | None], Any],
+) -> List[int]:
+    """Index into ``rows`` of each value, parsing up to ``memo_size`` values once."""
+    memo: Dict[Any, int] = {}
+    ret = []
+    append = ret.append
+    for value in values:
+        key = _key(value)
+        row_id = memo.get(key)
+        if row_id is None:
+            row_id = len(rows)
+            rows.append(parse(key))
+            if len(memo) < memo_size:
+                memo[key] = row_id
+        append(row_id)
+    return ret
+
+
+def _code(table: List[str], codes: Dict[str, int], name: str) -> int:
+    code = codes.get(name)
+    if code is None:
+        code = codes[name] = len(table)
+        table.append(name)
+    return code
+
+
+class ContentTypeColumns:
+    """``Content-Type`` values as columns.
+
+    ``type_codes[i]`` indexes ``types``, or is ``MISSING``/``INVALID``;
+    ``charset_codes[i]`` indexes ``charsets``, or is ``MISSING``.
+    """
+
+    __slots__ = ("types", "type_codes", "charsets", "charset_codes", "boundaries")
+
+    def __init__(self) -> None:
+        self.types: List[str] = []
+        self.type_codes = array("i")
+        self.charsets: List[str] = []
+        self.charset_codes = array("i")
+        self.boundaries: List[str | None] = []
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+    def type(self, i: int) -> str | None:
+        code = self.type_codes[i]
+        return self.types[code] if code >= 0 else None
+
+    def charset(self, i: int) -> str | None:
+        code = self.charset_codes[i]
+        return self.charsets[code] if code >= 0 else None
+
+    def to_numpy(self) -> Any:
+        np = import_numpy()
+        ret = np.empty(
+            len(self),
+            dtype=[("type_code", "i4"), ("charset_code", "i4"), ("boundary", "O")],
+        )
+        ret["type_code"] = np.frombuffer(self.type_codes, dtype=np.int32)
+        ret["charset_code"] = np.frombuffer(self.charset_codes, dtype=np.int32)
+        ret["boundary"] = self.boundaries
+        return ret
+
+
+def content_type_columns(
+    values: Iterable[Value], memo_size: int = 4096
+) -> ContentTypeColumns:
+    """Parse ``values`` into columns; invalid values get the ``INVALID`` type code.
+
+    Up to ``memo_size`` distinct values are parsed once per call.
+    """
+    cols = ContentTypeColumns()
+    type_index: Dict[str, int] = {}
+    charset_index: Dict[str, int] = {}
+    rows: List[Tuple[int, int, str | None]] = []
+    row_ids = _row_ids(
+        values,
+        rows,
+        memo_size,
+        lambda key: _content_type_row(key, cols, type_index, charset_index),
+    )
+    cols.type_codes = array("i", map([r[0] for r in rows].__getitem__, row_ids))
+    cols.charset_codes = array("i", map([r[1] for r in rows].__getitem__, row_ids))
+    cols.boundaries = list(map([r[2] for r in rows].__getitem__, row_ids))
+    return cols
+
+
+def _content_type_row(
+    key: str | bytes | None,
+    cols: ContentTypeColumns,
+    type_index: Dict[str, int],
+    charset_index: Dict[str, int],
+) -> Tuple[int, int, str | None]:
+    if not key:
+        return (MISSING, MISSING, None)
+    try:
+        ct = (
+            ContentType.parse_bytes(key)
+            if isinstance(key, bytes)
+            else ContentType.parse(key)
+        )
+    except ValueError:
+        return (INVALID, MISSING, None)
+    params = ct.__pydantic_extra__ or {}
+    charset = params.get("charset")
+    return (
+        _code(cols.types, type_index, ct.type),
+        (
+            MISSING
+            if charset is None
+            else _code(cols.charsets, charset_index, charset.lower())
+        ),
+        params.get("boundary"),
+    )
+
+
+class CacheControlColumns:
+    """``Cache-Control`` values as columns.
+
+    ``flags[i]`` has the ``FLAG_BITS`` of the directives present in row ``i``;
+    ``ints[field][i]`` is the number of seconds of ``field`` (one of
+    ``INT_FIELDS``), or ``UNSET``.
+    """
+
+    __slots__ = ("flags", "ints")
+
+    def __init__(self) -> None:
+        self.flags = array("I")
+        self.ints: Dict[str, array] = {field: array("i") for field in INT_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def has(self, field: str) -> List[bool]:
+        bit = FLAG_BITS[field]
+        return [bool(f & bit) for f in self.flags]
+
+    def row(self, i: int) -> CacheControl:
+        """Row ``i`` as a model."""
+        ints = (column[i] for column in self.ints.values())
+        return construct(CacheControl, unpack_fields(self.flags[i], ints))
+
+    def to_numpy(self) -> Any:
+        np = import_numpy()
+        ret = np.empty(
+            len(self), dtype=[("flags", "u4"), *((f, "i4") for f in INT_FIELDS)]
+        )
+        ret["flags"] = np.frombuffer(self.flags, dtype=np.uint32)
+        for field, column in self.ints.items():
+            ret[field] = np.frombuffer(column, dtype=np.int32)
+        return ret
+
+
+def _cache_control_row(key: str | bytes | None) -> Tuple[int, ...]:
+    if not key:
+        return pack_fields({})
+    if isinstance(key, bytes):
+        return pack_fields(parse_fields_bytes(key))
+    return pack_fields(parse_fields(key))
+
+
+def cache_control_columns(
+    values: Iterable[Value], memo_size: int = 4096
+) -> CacheControlColumns:
+    """Parse ``values`` into columns without building models.
+
+    Up to ``memo_size`` distinct values are parsed once per call.
+    """
+    cols = CacheControlColumns()
+    rows: List[Tuple[int, ...]] = []
+    row_ids = _row_ids(values, rows, memo_size, _cache_control_row)
+    cols.flags = array("I", map([r[0] for r in rows].__getitem__, row_ids))
+    for i, field in enumerate(INT_FIELDS, 1):
+        column = [r[i] for r in rows]
+        cols.ints[field] = array("i", map(column.__getitem__, row_ids))
+    return cols
@@ -0,0 +1,103 @@
+from functools import cached_property
+import re
+from typing import ClassVar, FrozenSet, Self, Tuple
+
+from .etag import ETag
+from .helper import BytesLike, HeaderModel, cached_parse, construct, latin1
+
+# entity-tag in RFC 9110 sec 8.8.3; unquoted tags are tolerated like ETag.parse.
+# An unquoted tag may not start with W/, or "W/a" would match both with and
+# without the prefix and a failing list match would backtrack exponentially
+ENTITY_TAG = r"""(W/)?(?:"([\x21\x23-\x7e\x80-\xff]*)"|(?!W/)([^\s",*][^\s",]*))"""
+ENTITY_TAG_REGEXP = re.compile(ENTITY_TAG)
+# 1#entity-tag, empty list elements allowed
+ENTITY_TAG_LIST_REGEXP = re.compile(
+    rf"""[ \t,]*(?:{ENTITY_TAG}(?:[ \t]*,[ \t,]*{ENTITY_TAG})*)?[ \t,]*"""
+)
+ANY_REGEXP = re.compile(r"""[ \t]*\*[ \t]*""")
+
+
+class ETagList(HeaderModel):
+    """``*`` or a set of entity-tags, as sent in conditional request headers.
+
+    Tags are kept as sets of opaque values so a comparison is one hash lookup
+    however long the list is.
+    """
+
+    any: bool = False
+    strong: FrozenSet[str] = frozenset()
+    weak: FrozenSet[str] = frozenset()
+
+    @classmethod
+    @cached_parse
+    def parse(cls, text: str) -> Self:
+        if ANY_REGEXP.fullmatch(text):
+            return construct(cls, {"any": True})
+        if not ENTITY_TAG_LIST_REGEXP.fullmatch(text):
+            raise ValueError("invalid entity-tag list")
+        strong = set()
+        weak = set()
+        for w, quoted, token in ENTITY_TAG_REGEXP.findall(text):
+            (weak if w else strong).add(quoted or token)
+        return construct(cls, {"strong": frozenset(strong), "weak": frozenset(weak)})
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike) -> Self:
+        return cls.parse(latin1(bytes(data)))
+
+    @cached_property
+    def etags(self) -> Tuple[ETag, ...]:
+        return tuple(
+            [ETag(value=v) for v in sorted(self.strong)]
+            + [ETag(value=v, weak=True) for v in sorted(self.weak)]
+        )
+
+    def matches_strong(self, current: ETag | None) -> bool:
+        if current is None:
+            return False
+        if self.any:
+            return True
+        return not current.weak and current.value in self.strong
+
+    def matches_weak(self, current: ETag | None) -> bool:
+        if current is None:
+            return False
+        return self.any or current.value in self.strong or current.value in self.weak
+
+    def __str__(self) -> str:
+        if self.any:
+            return "*"
+        return ", ".join(
+            f'W/"{e.value}"' if e.weak else f'"{e.value}"' for e in self.etags
+        )
+
+
+class IfMatch(ETagList):
+    HEADER_NAME: ClassVar[str] = "If-Match"
+
+    def evaluate(self, current: ETag | None) -> bool:
+        """Whether the request may proceed; otherwise answer 412."""
+        return self.matches_strong(current)
+
+
+class IfNoneMatch(ETagList):
+    HEADER_NAME: ClassVar[str] = "If-None-Match"
+
+    def evaluate(self, current: ETag | None) -> bool:
+        """Whether the request may proceed; otherwise answer 304 (GET/HEAD) or 412."""
+        return not self.matches_weak(current)
+
+
+def if_match(header: str | None, current: ETag | None) -> bool:
+    """Evaluate a raw ``If-Match`` value; a missing header always passes."""
+    if header is None:
+        return True
+    return IfMatch.parse(header).evaluate(current)
+
+
+def if_none_match(header: str | None, current: ETag | None) -> bool:
+    """Evaluate a raw ``If-None-Match`` value; a missing header always passes."""
+    if header is None:
+        return True
+    return IfNoneMatch.parse(header).evaluate(current)
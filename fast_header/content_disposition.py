@@ -1,12 +1,22 @@
+from functools import cached_property
 from io import StringIO
 import os
 import re
-from typing import TYPE_CHECKING, ClassVar, Dict, Literal, Self, cast
-from pydantic import BaseModel, Field, field_validator, model_validator
+import sys
+from typing import TYPE_CHECKING, ClassVar, Dict, Literal, Self, get_args
+from pydantic import Field, field_validator, model_validator
 from urllib.parse import quote, unquote
-from .helper import qstring
+from .helper import (
+    BytesLike,
+    HeaderModel,
+    cached_parse,
+    construct,
+    latin1,
+    qstring,
+)
 
 Disposition = Literal["attachment", "inline", "form-data"]
+DISPOSITIONS = frozenset(get_args(Disposition))
 
 # RegExp to match percent encoding escape
 HEX_ESCAPE_REGEXP = re.compile(r"""%[0-9A-Fa-f]{2}""")
@@ -32,6 +42,15 @@ DISPOSITION_TYPE_REGEXP = re.compile(
     r"""^([!#$%&'*+.0-9A-Z^_`a-z|~-]+)[\x09\x20]*(?:$|;)"""
 )
 
+# Byte-level counterparts used by parse_bytes
+B_PARAM_REGEXP = re.compile(
+    rb""";[\x09\x20]*([!#$%&'*+.0-9A-Z^_`a-z|~-]+)[\x09\x20]*=[\x09\x20]*("(?:[\x20!\x23-\x5b\x5d-\x7e\x80-\xff]|\\[\x20-\x7e])*"|[!#$%&'*+.0-9A-Z^_`a-z|~-]+)[\x09\x20]*"""
+)
+B_QESC_REGEXP = re.compile(rb"""\\([\x00-\x7f])""")
+B_DISPOSITION_TYPE_REGEXP = re.compile(
+    rb"""([!#$%&'*+.0-9A-Z^_`a-z|~-]+)[\x09\x20]*(?:$|(?=;))"""
+)
+
 
 def _ustring(text: str) -> str:
     return "UTF-8''" + quote(text, encoding="utf-8")
@@ -53,7 +72,7 @@ def _decode_field(text: str) -> str:
         raise ValueError("unsupported charset in extended field")
 
 
-class ContentDisposition(BaseModel, extra="allow"):
+class ContentDisposition(HeaderModel, extra="allow"):
     HEADER_NAME: ClassVar[str] = "Content-Disposition"
     type: Disposition = Field(default="attachment")
     filename: str | None = Field(default=None)
@@ -130,9 +149,10 @@ class ContentDisposition(BaseModel, extra="allow"):
             )
         return ret
 
-    def __str__(self) -> str:
+    @cached_property
+    def _parameters_text(self) -> str:
+        # parameters_star rebuilds and sorts a dict, so render it once
         io = StringIO()
-        io.write(self.type)
         for k, v in sorted(self.parameters_star.items()):
             val = _ustring(v) if k.endswith("*") else qstring(v)
             io.write("; ")
@@ -141,13 +161,40 @@ class ContentDisposition(BaseModel, extra="allow"):
             io.write(val)
         return io.getvalue()
 
+    @cached_property
+    def _parameters_bytes(self) -> bytes:
+        return self._parameters_text.encode("latin-1")
+
+    def _render(self, buf: bytearray) -> None:
+        buf += self.type.encode("latin-1")
+        buf += self._parameters_bytes
+
+    def __str__(self) -> str:
+        return self.type + self._parameters_text
+
+    @classmethod
+    def _from_params(cls, type: str, params: Dict[str, str]) -> Self:
+        # Same checks as the field validators, without a pydantic round trip
+        if type not in DISPOSITIONS:
+            raise ValueError(f"invalid disposition type {type!r}")
+        fields: Dict[str, str] = {"type": type}
+        if (filename := params.pop("filename", None)) is not None:
+            fields["filename"] = os.path.basename(filename)
+        if (fallback := params.pop("fallback", None)) is not None:
+            if NON_LATIN1_REGEXP.search(fallback):
+                raise ValueError("fallback must be ISO-8859-1 string")
+            fields["fallback"] = fallback
+        params.pop("type", None)
+        return construct(cls, fields, params)
+
     @classmethod
+    @cached_parse
     def parse(cls, text: str) -> Self:
         m = DISPOSITION_TYPE_REGEXP.search(text)
         if not m:
             raise ValueError("invalid type format")
         index = len(m.group(0))
-        type = cast(Disposition, m.group(1).lower())
+        type = m.group(1).lower()
         names = []
         params = {}
         if m.group(0).endswith(";"):
@@ -156,7 +203,7 @@ class ContentDisposition(BaseModel, extra="allow"):
             if m.start() != index:
                 raise ValueError("invalid parameter format")
             index += len(m.group(0))
-            key = m.group(1).lower()
+            key = sys.intern(m.group(1).lower())
             value = m.group(2)
             if key in names:
                 raise ValueError("invalid duplicate parameter")
@@ -174,5 +221,35 @@ class ContentDisposition(BaseModel, extra="allow"):
             params[key] = value
         if index != -1 and index != len(text):
             raise ValueError("invalid parameter format")
-        params["type"] = type
-        return cls.model_validate(params)
+        return cls._from_params(type, params)
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike) -> Self:
+        m = B_DISPOSITION_TYPE_REGEXP.match(data)
+        if not m:
+            raise ValueError("invalid type format")
+        index = m.end()
+        type = latin1(m.group(1).lower())
+        names = []
+        params = {}
+        while index != len(data):
+            m = B_PARAM_REGEXP.match(data, index)
+            if not m:
+                raise ValueError("invalid parameter format")
+            index = m.end()
+            key = sys.intern(latin1(m.group(1).lower()))
+            value = m.group(2)
+            if key in names:
+                raise ValueError("invalid duplicate parameter")
+            names.append(key)
+
+            if key.find("*") + 1 == len(key):
+                params[key[:-1]] = _decode_field(latin1(value))
+                continue
+            if isinstance(params.get(key), str):
+                continue
+            if value[0] == 0x22:  # "
+                value = B_QESC_REGEXP.sub(lambda m: m.group(1), value[1:-1])
+            params[key] = latin1(value)
+        return cls._from_params(type, params)
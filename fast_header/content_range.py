@@ -1,14 +1,41 @@
-from pydantic import BaseModel
-from typing import ClassVar, List, Self, cast
+from operator import attrgetter
+from pydantic import BaseModel, ConfigDict
+from typing import AnyStr, ClassVar, Iterable, List, NamedTuple, Self, Tuple, cast
 import re
 
+from .conditional import ENTITY_TAG_REGEXP
+from .content_type import ContentType
+from .etag import ETag
+from .helper import (
+    BytesLike,
+    HeaderModel,
+    cached_parse,
+    construct,
+    latin1,
+    parse_http_date,
+)
+
 PAT = re.compile(r"bytes=([^;]+)")
 SPLIT = re.compile(r",\s*")
 
 RANGE_PAT = re.compile(r"""^(\w+) ((\d+)-(\d+)|\*)\/(\d+|\*)$""")
 
+# Byte-level counterparts used by parse_bytes
+B_PAT = re.compile(rb"bytes=([^;]+)")
+B_SPLIT = re.compile(rb",\s*")
+B_RANGE_PAT = re.compile(rb"""^(\w+) ((\d+)-(\d+)|\*)\/(\d+|\*)$""")
+
+# Spec count above which a Range header is refused when a cap is asked for
+MAX_RANGES = 100
+
+
+class TooManyRanges(ValueError):
+    pass
+
 
 class Range(BaseModel):
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     start: int = 0
     stop: int
 
@@ -19,18 +46,59 @@ class Range(BaseModel):
         return self.stop - self.start
 
     @classmethod
-    def parse(cls, http_range: str | None, size: int) -> List["Range"] | None:
+    def parse(
+        cls,
+        http_range: str | None,
+        size: int,
+        *,
+        max_ranges: int | None = None,
+        coalesce: bool = False,
+    ) -> List["Range"] | None:
+        """Satisfiable ranges of a ``Range`` header for a ``size``-byte body.
+
+        Returns None when the header should be ignored and an empty list when
+        nothing is satisfiable. With ``max_ranges``, a header with more specs
+        raises TooManyRanges before any of them is parsed. With ``coalesce``,
+        the result is sorted and overlapping or adjacent ranges are merged.
+        """
         if not http_range:
             return None
         m = PAT.match(http_range)
         if m is None:
             return None
         matched = m.group(1)
+        if max_ranges is not None and matched.count(",") >= max_ranges:
+            raise TooManyRanges(f"more than {max_ranges} ranges")
+        return cls._from_specs(SPLIT.split(matched), "-", size, coalesce)
+
+    @classmethod
+    def parse_bytes(
+        cls,
+        http_range: BytesLike | None,
+        size: int,
+        *,
+        max_ranges: int | None = None,
+        coalesce: bool = False,
+    ) -> List["Range"] | None:
+        if not http_range:
+            return None
+        m = B_PAT.match(http_range)
+        if m is None:
+            return None
+        matched = m.group(1)
+        if max_ranges is not None and matched.count(b",") >= max_ranges:
+            raise TooManyRanges(f"more than {max_ranges} ranges")
+        return cls._from_specs(B_SPLIT.split(matched), b"-", size, coalesce)
+
+    @classmethod
+    def _from_specs(
+        cls, specs: Iterable[AnyStr], dash: AnyStr, size: int, coalesce: bool
+    ) -> List["Range"] | None:
         ret: List[Range] = []
-        for range_spec in SPLIT.split(matched):
-            if "-" not in range_spec:
+        for range_spec in specs:
+            if dash not in range_spec:
                 return None
-            r = range_spec.split("-")
+            r = range_spec.split(dash)
             r0 = r[0]
             r1 = r[1]
             if not r0:
@@ -51,19 +119,35 @@ class Range(BaseModel):
                     if r1 >= size:
                         r1 = size - 1
             if r0 <= r1:
-                ret.append(Range(start=r0, stop=r1 + 1))
-        if sum([len(r) for r in ret]) > size:
+                ret.append(construct(Range, {"start": r0, "stop": r1 + 1}))
+        if coalesce:
+            return coalesce_ranges(ret)
+        if sum(r.stop - r.start for r in ret) > size:
             return []
         return ret
 
 
-class ContentRange(BaseModel):
+def coalesce_ranges(ranges: Iterable[Range]) -> List[Range]:
+    """Sort ranges and merge the ones that overlap or touch."""
+    ret: List[Range] = []
+    for r in sorted(ranges, key=attrgetter("start")):
+        if ret and r.start <= ret[-1].stop:
+            last = ret[-1]
+            if r.stop > last.stop:
+                ret[-1] = construct(Range, {"start": last.start, "stop": r.stop})
+        else:
+            ret.append(r)
+    return ret
+
+
+class ContentRange(HeaderModel):
     HEADER_NAME: ClassVar[str] = "Content-Range"
     unit: str = "bytes"
     range: Range | None = None
     size: int | None = None
 
     @classmethod
+    @cached_parse
     def parse(cls, text: str) -> Self:
         m = RANGE_PAT.match(text)
         if not m:
@@ -73,12 +157,146 @@ class ContentRange(BaseModel):
         end = m.group(4)
         size = m.group(5)
         if start and end:
-            r = Range.model_validate(dict(start=start, stop=end))
+            r = construct(Range, {"start": int(start), "stop": int(end)})
+        else:
+            r = None
+        return construct(
+            cls, {"unit": unit, "range": r, "size": None if size == "*" else int(size)}
+        )
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike) -> Self:
+        m = B_RANGE_PAT.match(data)
+        if not m:
+            raise ValueError("invalid range")
+        start = m.group(3)
+        end = m.group(4)
+        size = m.group(5)
+        if start and end:
+            r = construct(Range, {"start": int(start), "stop": int(end)})
         else:
             r = None
-        return cls(unit=unit, range=r, size=None if size == "*" else int(size))
+        return construct(
+            cls,
+            {
+                "unit": latin1(m.group(1)),
+                "range": r,
+                "size": None if size == b"*" else int(size),
+            },
+        )
 
     def __str__(self) -> str:
         return (
             f"{self.unit} {self.range or '*'}/{'*' if self.size is None else self.size}"
         )
+
+
+def if_range_holds(
+    if_range: str | BytesLike | None,
+    etag: ETag | str | None = None,
+    last_modified: int | float | None = None,
+) -> bool:
+    """Whether the ``Range`` of a request applies (RFC 9110 sec 13.1.5).
+
+    An entity-tag must strongly match ``etag``; an HTTP-date must equal
+    ``last_modified``, in seconds since the epoch. Without ``If-Range`` the
+    range always applies.
+    """
+    if if_range is None:
+        return True
+    if not isinstance(if_range, str):
+        if_range = latin1(bytes(if_range))
+    value = if_range.strip(" \t")
+    if value.startswith(('"', "W/")):
+        m = ENTITY_TAG_REGEXP.fullmatch(value)
+        if m is None or m.group(1) or etag is None:
+            return False
+        if isinstance(etag, str):
+            etag = ETag.parse(etag)
+        return not etag.weak and m.group(2) == etag.value
+    date = parse_http_date(value)
+    return date is not None and last_modified is not None and date == int(last_modified)
+
+
+class RangePlan(NamedTuple):
+    """How to answer a request with a ``Range`` header, before reading any data.
+
+    Send ``status`` with ``headers()``, then for each ``(head, start, stop)``
+    of ``parts`` write ``head`` and bytes ``start:stop`` of the
+    representation, then ``tail``.
+    """
+
+    status: int
+    content_length: int
+    # Content-Range of a single-range 206 or of a 416
+    content_range: bytes | None = None
+    # multipart/byteranges only
+    boundary: str | None = None
+    content_type: bytes | None = None
+    parts: Tuple[Tuple[bytes, int, int], ...] = ()
+    tail: bytes = b""
+
+    def headers(self) -> List[Tuple[bytes, bytes]]:
+        ret = [(b"content-length", b"%d" % self.content_length)]
+        if self.content_range is not None:
+            ret.append((b"content-range", self.content_range))
+        if self.content_type is not None:
+            ret.append((b"content-type", self.content_type))
+        return ret
+
+
+def plan_range(
+    http_range: str | BytesLike | None,
+    size: int,
+    *,
+    if_range: str | BytesLike | None = None,
+    etag: ETag | str | None = None,
+    last_modified: int | float | None = None,
+    content_type: ContentType | str | None = None,
+    boundary: str | None = None,
+    max_ranges: int | None = MAX_RANGES,
+) -> RangePlan:
+    """Plan the response to a ``Range`` request for a ``size``-byte body.
+
+    The result is a 200 for the whole body when there is no usable range
+    (none sent, an ``If-Range`` that does not hold, another unit, a
+    malformed header, or more than ``max_ranges`` specs), a 206 for one
+    range, a 206 ``multipart/byteranges`` for several (``content_type`` goes
+    in each part), or a 416. Ranges are sorted and coalesced.
+    """
+    full = RangePlan(200, size, parts=((b"", 0, size),))
+    if not http_range or not if_range_holds(if_range, etag, last_modified):
+        return full
+    try:
+        if isinstance(http_range, str):
+            ranges = Range.parse(http_range, size, max_ranges=max_ranges, coalesce=True)
+        else:
+            ranges = Range.parse_bytes(
+                http_range, size, max_ranges=max_ranges, coalesce=True
+            )
+    except ValueError:  # TooManyRanges, or a malformed spec from the client
+        return full
+    if ranges is None:
+        return full
+    if not ranges:
+        return RangePlan(416, 0, content_range=b"bytes */%d" % size)
+    if len(ranges) == 1:
+        r = ranges[0]
+        return RangePlan(
+            206,
+            len(r),
+            content_range=b"bytes %d-%d/%d" % (r.start, r.stop - 1, size),
+            parts=((b"", r.start, r.stop),),
+        )
+    from .byteranges import ByteRanges  # imports this module
+
+    body = ByteRanges(ranges, size, content_type, boundary)
+    return RangePlan(
+        206,
+        body.content_length,
+        boundary=body.boundary,
+        content_type=body.content_type.to_bytes(),
+        parts=tuple((head, r.start, r.stop) for head, r in body.parts),
+        tail=body.tail,
+    )
@@ -1,8 +1,9 @@
 from io import StringIO
+import sys
 from typing import TYPE_CHECKING, ClassVar, Self
-from pydantic import BaseModel, model_validator
+from pydantic import model_validator
 import re
-from .helper import qstring
+from .helper import BytesLike, HeaderModel, cached_parse, construct, latin1, qstring
 
 # RegExp to match *( ";" parameter ) in RFC 7231 sec 3.1.1.1
 PARAM_REGEXP = re.compile(
@@ -18,10 +19,20 @@ TYPE_REGEXP = re.compile(
     r"""^[!#$%&'*+.^_`|~0-9A-Za-z-]+/[!#$%&'*+.^_`|~0-9A-Za-z-]+$"""
 )
 
+# Byte-level counterparts used by parse_bytes
+B_PARAM_REGEXP = re.compile(
+    rb"""; *([!#$%&'*+.^_`|~0-9A-Za-z-]+) *= *("(?:[\x0b\x20\x21\x23-\x5b\x5d-\x7e\x80-\xff]|\\[\x0b\x20-\xff])*"|[!#$%&'*+.^_`|~0-9A-Za-z-]+) *"""
+)
+B_QESC_REGEXP = re.compile(rb"""\\([\x0b\x20-\xff])""")
+# Same whitespace set str.strip() removes from a latin-1 string
+B_TYPE_REGEXP = re.compile(
+    rb"""[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0]*([!#$%&'*+.^_`|~0-9A-Za-z-]+/[!#$%&'*+.^_`|~0-9A-Za-z-]+)[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0]*(?=;|\Z)"""
+)
+
 MULTIPART_TYPE = "multipart/byteranges"
 
 
-class ContentType(BaseModel, extra="allow"):
+class ContentType(HeaderModel, extra="allow"):
     HEADER_NAME: ClassVar[str] = "Content-Type"
     type: str
     if TYPE_CHECKING:
@@ -40,22 +51,25 @@ class ContentType(BaseModel, extra="allow"):
 
     @classmethod
     def multipart(cls, boundary: str) -> Self:
-        return cls(type=MULTIPART_TYPE, boundary=boundary)
+        if not isinstance(boundary, str):
+            return cls(type=MULTIPART_TYPE, boundary=boundary)
+        return construct(cls, {"type": MULTIPART_TYPE}, {"boundary": boundary})
 
     @classmethod
+    @cached_parse
     def parse(cls, text: str) -> Self:
         index = text.find(";")
         type = text[:index].strip() if index != -1 else text.strip()
         if TYPE_REGEXP.search(type) is None:
             raise ValueError("invalid media type")
         params = {}
-        type = type.lower()
+        type = sys.intern(type.lower())
         if index != -1:
             while m := PARAM_REGEXP.search(text, index):
                 if m.start() != index:
                     raise ValueError("invalid parameter format")
                 index += len(m.group(0))
-                key = m.group(1).lower()
+                key = sys.intern(m.group(1).lower())
                 value = m.group(2)
                 if ord(value[0]) == 0x22:  # "
                     value = value[1:-1]
@@ -65,7 +79,29 @@ class ContentType(BaseModel, extra="allow"):
 
             if index != len(text):
                 raise ValueError("invalid parameter format")
-        return cls(type=type, **params)
+        return construct(cls, {"type": type}, params)
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike) -> Self:
+        m = B_TYPE_REGEXP.match(data)
+        if m is None:
+            raise ValueError("invalid media type")
+        type = sys.intern(latin1(m.group(1).lower()))
+        index = m.end()
+        params = {}
+        while index != len(data):
+            m = B_PARAM_REGEXP.match(data, index)
+            if m is None:
+                raise ValueError("invalid parameter format")
+            index = m.end()
+            value = m.group(2)
+            if value[0] == 0x22:  # "
+                value = value[1:-1]
+                if value.find(b"\\") != -1:
+                    value = B_QESC_REGEXP.sub(lambda x: x.group(1), value)
+            params[sys.intern(latin1(m.group(1).lower()))] = latin1(value)
+        return construct(cls, {"type": type}, params)
 
     @property
     def parameters(self):
@@ -74,6 +110,17 @@ class ContentType(BaseModel, extra="allow"):
             ret.update(self.__pydantic_extra__)
         return ret
 
+    def _render(self, buf: bytearray) -> None:
+        buf += self.type.encode("latin-1")
+        if extra := self.__pydantic_extra__:
+            for k, v in sorted(extra.items()):
+                buf += b"; "
+                buf += k.encode("latin-1")
+                buf += b"="
+                if not TOKEN_REGEXP.search(v):
+                    v = qstring(v)
+                buf += v.encode("latin-1")
+
     def __str__(self) -> str:
         io = StringIO()
         io.write(self.type)
@@ -85,3 +132,31 @@ class ContentType(BaseModel, extra="allow"):
                 v = qstring(v)
             io.write(v)
         return io.getvalue()
+
+
+# Interned so that parsing or building one of these returns a shared instance
+COMMON_CONTENT_TYPES = (
+    "application/json",
+    "application/json; charset=utf-8",
+    "application/octet-stream",
+    "application/x-www-form-urlencoded",
+    "application/xml",
+    "application/javascript",
+    "application/pdf",
+    "text/html",
+    "text/html; charset=utf-8",
+    "text/plain",
+    "text/plain; charset=utf-8",
+    "text/css",
+    "text/css; charset=utf-8",
+    "text/javascript",
+    "text/javascript; charset=utf-8",
+    "text/xml",
+    "image/png",
+    "image/jpeg",
+    "image/gif",
+    "image/webp",
+    "image/svg+xml",
+)
+for _value in COMMON_CONTENT_TYPES:
+    ContentType.intern(ContentType.parse(_value))
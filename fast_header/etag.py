@@ -1,17 +1,111 @@
-from typing import ClassVar, Self
-from pydantic import BaseModel
+from hashlib import blake2b
+import mmap
+import os
+from typing import ClassVar, Self, Tuple
 
+from .cache import LRUCache
+from .helper import BytesLike, HeaderModel, cached_parse, construct, latin1
 
-class ETag(BaseModel):
+CHUNK_SIZE = 1 << 16
+# smaller files are cheaper to read than to map
+MMAP_THRESHOLD = 1 << 20
+
+# (st_dev, st_ino, st_mtime_ns, st_size) -> content digest
+DIGEST_CACHE: LRUCache[Tuple[int, int, int, int], str] = LRUCache(4096)
+
+
+def _digest(fd: int, size: int, chunk_size: int) -> str:
+    h = blake2b(digest_size=16)
+    if size >= MMAP_THRESHOLD:
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as m, memoryview(m) as view:
+            for offset in range(0, size, chunk_size):
+                h.update(view[offset : offset + chunk_size])
+    elif hasattr(os, "pread"):
+        # positional reads leave the caller's file offset alone
+        offset = 0
+        while data := os.pread(fd, chunk_size, offset):
+            h.update(data)
+            offset += len(data)
+    else:
+        pos = os.lseek(fd, 0, os.SEEK_CUR)
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            while data := os.read(fd, chunk_size):
+                h.update(data)
+        finally:
+            os.lseek(fd, pos, os.SEEK_SET)
+    return h.hexdigest()
+
+
+class ETag(HeaderModel):
     HEADER_NAME: ClassVar[str] = "ETag"
     weak: bool = False
     value: str
 
     @classmethod
+    @cached_parse
     def parse(cls, text: str) -> Self:
         if text.startswith("W/"):
-            return cls(weak=True, value=text[2:].strip('"'))
-        return cls(value=text.strip('"'))
+            return construct(cls, {"weak": True, "value": text[2:].strip('"')})
+        return construct(cls, {"value": text.strip('"')})
+
+    @classmethod
+    @cached_parse
+    def parse_bytes(cls, data: BytesLike) -> Self:
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        if data.startswith(b"W/"):
+            return construct(cls, {"weak": True, "value": latin1(data[2:].strip(b'"'))})
+        return construct(cls, {"value": latin1(data.strip(b'"'))})
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> Self:
+        """Weak tag from file metadata; the file is not read."""
+        return construct(
+            cls,
+            {
+                "weak": True,
+                "value": f"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}",
+            },
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        file: str | os.PathLike[str] | int,
+        *,
+        weak: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Self:
+        """Tag for a path or an open file descriptor.
+
+        Strong tags hash the content in ``chunk_size`` pieces and are cached
+        per (device, inode, mtime, size), so an unchanged file is hashed once.
+        """
+        if isinstance(file, int):
+            return cls._from_fd(file, weak, chunk_size)
+        fd = os.open(file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            return cls._from_fd(fd, weak, chunk_size)
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def _from_fd(cls, fd: int, weak: bool, chunk_size: int) -> Self:
+        st = os.fstat(fd)
+        if weak:
+            return cls.from_stat(st)
+        key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        value = DIGEST_CACHE.get_or_compute(key, _digest, fd, st.st_size, chunk_size)
+        return construct(cls, {"value": value})
+
+    def _render(self, buf: bytearray) -> None:
+        # the wire form is always quoted, unlike ``str()`` of a strong tag
+        if self.weak:
+            buf += b"W/"
+        buf += b'"'
+        buf += self.value.encode("latin-1")
+        buf += b'"'
 
     def __str__(self) -> str:
         if self.weak:
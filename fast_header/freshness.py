@@ -0,0 +1,383 @@
+"""Freshness of stored responses (RFC 9111 sec 4.2) and the stale-serving
+windows of ``stale-while-revalidate``/``stale-if-error`` (RFC 5861).
+
+Times are whole seconds since the epoch. ``freshness`` evaluates one stored
+response; ``freshness_columns`` and ``freshness_numpy`` evaluate columns of
+them, as produced by ``fast_header.columnar.cache_control_columns``, without
+building a model per entry.
+"""
+
+from array import array
+from typing import Any, Iterator, NamedTuple, Sequence
+
+from .cache_control import DELTA_SECONDS_MAX, FLAG_BITS, UNSET, CacheControl
+from .columnar import CacheControlColumns
+from .helper import BytesLike, import_numpy, parse_http_date
+
+# RFC 9111 sec 4.2.2: a typical heuristic is 10% of the time since Last-Modified
+HEURISTIC_FRACTION = 0.1
+
+Time = int | str | BytesLike | None
+
+
+def _time(value: Time) -> int | None:
+    if value is None or isinstance(value, int):
+        return value
+    return parse_http_date(value)
+
+
+def _seconds(value: int | None) -> int | None:
+    return None if value is None else min(max(value, 0), DELTA_SECONDS_MAX)
+
+
+def _no_reuse_mask(shared: bool) -> int:
+    """Directives forbidding reuse without validation."""
+    mask = FLAG_BITS["no_cache"] | FLAG_BITS["no_store"]
+    return mask | FLAG_BITS["private"] if shared else mask
+
+
+def _no_stale_mask(shared: bool) -> int:
+    """Directives forbidding stale responses (RFC 9111 sec 4.2.4)."""
+    mask = _no_reuse_mask(shared) | FLAG_BITS["must_revalidate"]
+    return mask | FLAG_BITS["proxy_revalidate"] if shared else mask
+
+
+def _flags(cc: CacheControl) -> int:
+    values = cc.__dict__
+    return sum(bit for field, bit in FLAG_BITS.items() if values[field] is True)
+
+
+class Freshness(NamedTuple):
+    """Freshness of one stored response at one point in time, in seconds."""
+
+    lifetime: int
+    age: int
+    # how long past ``lifetime`` a stale response may still be served
+    stale_while_revalidate: int = 0
+    stale_if_error: int = 0
+
+    @property
+    def ttl(self) -> int:
+        """Seconds left until the response is stale; zero or less once stale."""
+        return self.lifetime - self.age
+
+    @property
+    def fresh(self) -> bool:
+        return self.lifetime > self.age
+
+    @property
+    def usable_while_revalidating(self) -> bool:
+        """Stale, but may be served while revalidating in the background."""
+        return -self.stale_while_revalidate < self.ttl <= 0
+
+    @property
+    def usable_on_error(self) -> bool:
+        """Stale, but may be served when revalidation fails."""
+        return -self.stale_if_error < self.ttl <= 0
+
+
+def freshness_lifetime(
+    cc: CacheControl,
+    *,
+    shared: bool = False,
+    date: Time = None,
+    expires: Time = None,
+    last_modified: Time = None,
+) -> int:
+    """Freshness lifetime of a response (RFC 9111 sec 4.2.1).
+
+    ``s-maxage`` only applies to shared caches; then ``max-age``, then
+    ``Expires`` relative to ``Date``. An invalid ``Expires`` is in the past.
+    The heuristic lifetime is only used when ``last_modified`` is given, so
+    pass it only for responses that allow one (sec 4.2.2). The lifetime is 0
+    when the response may not be reused without validation.
+    """
+    if _flags(cc) & _no_reuse_mask(shared):
+        return 0
+    lifetime = _seconds(cc.s_maxage) if shared else None
+    if lifetime is None:
+        lifetime = _seconds(cc.max_age)
+    if lifetime is not None:
+        return lifetime
+    date = _time(date)
+    if expires is not None:
+        expires = _time(expires) or 0
+        if date is None:
+            return 0
+        return min(max(expires - date, 0), DELTA_SECONDS_MAX)
+    last_modified = _time(last_modified)
+    if date is not None and last_modified is not None and date > last_modified:
+        return min(int((date - last_modified) * HEURISTIC_FRACTION), DELTA_SECONDS_MAX)
+    return 0
+
+
+def current_age(
+    now: int,
+    response_time: int,
+    *,
+    request_time: int | None = None,
+    date: Time = None,
+    age: int | str | None = None,
+) -> int:
+    """Current age of a stored response (RFC 9111 sec 4.2.3).
+
+    ``request_time`` and ``response_time`` are when the request was sent and
+    the response received, ``date`` and ``age`` the response headers.
+    """
+    date = _time(date)
+    if isinstance(age, str):
+        age = int(age) if age.isdigit() else None
+    apparent_age = max(0, response_time - date) if date is not None else 0
+    response_delay = 0 if request_time is None else response_time - request_time
+    corrected_age_value = (age or 0) + response_delay
+    return max(apparent_age, corrected_age_value) + now - response_time
+
+
+def freshness(
+    cc: CacheControl,
+    now: int,
+    response_time: int | None = None,
+    *,
+    shared: bool = False,
+    request_time: int | None = None,
+    date: Time = None,
+    expires: Time = None,
+    age: int | str | None = None,
+    last_modified: Time = None,
+) -> Freshness:
+    """Freshness at ``now`` of a response received at ``response_time``.
+
+    ``shared`` selects the rules of a shared cache: ``s-maxage`` and
+    ``proxy-revalidate`` apply and ``private`` responses are not reusable.
+    The stale windows are 0 when a directive forbids serving stale responses.
+    """
+    if response_time is None:
+        response_time = now
+    # a missing Date is the time the response was received
+    date = _time(date)
+    if date is None:
+        date = response_time
+    lifetime = freshness_lifetime(
+        cc, shared=shared, date=date, expires=expires, last_modified=last_modified
+    )
+    age = current_age(now, response_time, request_time=request_time, date=date, age=age)
+    if _flags(cc) & _no_stale_mask(shared) or (shared and cc.s_maxage is not None):
+        return Freshness(lifetime, age)
+    return Freshness(
+        lifetime,
+        age,
+        _seconds(cc.stale_while_revalidate) or 0,
+        _seconds(cc.stale_if_error) or 0,
+    )
+
+
+class FreshnessColumns:
+    """``Freshness`` of many responses, one array per field."""
+
+    __slots__ = ("lifetime", "age", "stale_while_revalidate", "stale_if_error")
+
+    def __init__(self) -> None:
+        self.lifetime = array("i")
+        self.age = array("q")
+        self.stale_while_revalidate = array("i")
+        self.stale_if_error = array("i")
+
+    def __len__(self) -> int:
+        return len(self.lifetime)
+
+    def __getitem__(self, i: int) -> Freshness:
+        return Freshness(
+            self.lifetime[i],
+            self.age[i],
+            self.stale_while_revalidate[i],
+            self.stale_if_error[i],
+        )
+
+    def __iter__(self) -> Iterator[Freshness]:
+        return map(
+            Freshness,
+            self.lifetime,
+            self.age,
+            self.stale_while_revalidate,
+            self.stale_if_error,
+        )
+
+    def fresh(self) -> list[bool]:
+        return [lifetime > age for lifetime, age in zip(self.lifetime, self.age)]
+
+    def to_numpy(self) -> Any:
+        np = import_numpy()
+        ret = np.empty(len(self), dtype=FRESHNESS_DTYPE)
+        for field in self.__slots__:
+            column = getattr(self, field)
+            ret[field] = np.frombuffer(column, dtype=column.typecode)
+        return ret
+
+
+FRESHNESS_DTYPE = [
+    ("lifetime", "i4"),
+    ("age", "i8"),
+    ("stale_while_revalidate", "i4"),
+    ("stale_if_error", "i4"),
+]
+
+
+def _unset(n: int, values: Sequence[int] | None) -> Sequence[int]:
+    return array("q", [UNSET]) * n if values is None else values
+
+
+def freshness_columns(
+    cols: CacheControlColumns,
+    now: int,
+    response_time: Sequence[int],
+    *,
+    shared: bool = False,
+    request_time: Sequence[int] | None = None,
+    date: Sequence[int] | None = None,
+    expires: Sequence[int] | None = None,
+    age: Sequence[int] | None = None,
+    last_modified: Sequence[int] | None = None,
+) -> FreshnessColumns:
+    """``freshness`` of every row of ``cols``.
+
+    The other columns hold seconds since the epoch (``age`` seconds), with
+    ``UNSET`` where the header is missing; an invalid ``Expires`` is 0.
+    """
+    n = len(cols)
+    if len(response_time) != n:
+        raise ValueError("columns differ in length")
+    ints = cols.ints
+    no_reuse = _no_reuse_mask(shared)
+    no_stale = _no_stale_mask(shared)
+    ret = FreshnessColumns()
+    lifetimes = []
+    ages = []
+    swrs = []
+    sies = []
+    for (
+        flags,
+        max_age,
+        s_maxage,
+        swr,
+        sie,
+        received,
+        sent,
+        date_value,
+        expires_value,
+        age_value,
+        last_modified_value,
+    ) in zip(
+        cols.flags,
+        ints["max_age"],
+        ints["s_maxage"] if shared else _unset(n, None),
+        ints["stale_while_revalidate"],
+        ints["stale_if_error"],
+        response_time,
+        _unset(n, request_time),
+        _unset(n, date),
+        _unset(n, expires),
+        _unset(n, age),
+        _unset(n, last_modified),
+        strict=True,
+    ):
+        if date_value == UNSET:
+            date_value = received
+        if flags & no_reuse:
+            lifetime = 0
+        elif s_maxage != UNSET:
+            lifetime = s_maxage
+        elif max_age != UNSET:
+            lifetime = max_age
+        elif expires_value != UNSET:
+            lifetime = min(max(expires_value - date_value, 0), DELTA_SECONDS_MAX)
+        elif last_modified_value != UNSET and date_value > last_modified_value:
+            lifetime = min(
+                int((date_value - last_modified_value) * HEURISTIC_FRACTION),
+                DELTA_SECONDS_MAX,
+            )
+        else:
+            lifetime = 0
+        corrected_age_value = 0 if age_value == UNSET else age_value
+        if sent != UNSET:
+            corrected_age_value += received - sent
+        lifetimes.append(lifetime)
+        ages.append(max(received - date_value, corrected_age_value, 0) + now - received)
+        if flags & no_stale or s_maxage != UNSET:
+            swrs.append(0)
+            sies.append(0)
+        else:
+            swrs.append(0 if swr == UNSET else swr)
+            sies.append(0 if sie == UNSET else sie)
+    ret.lifetime = array("i", lifetimes)
+    ret.age = array("q", ages)
+    ret.stale_while_revalidate = array("i", swrs)
+    ret.stale_if_error = array("i", sies)
+    return ret
+
+
+def freshness_numpy(
+    table: Any,
+    now: int,
+    response_time: Any,
+    *,
+    shared: bool = False,
+    request_time: Any = None,
+    date: Any = None,
+    expires: Any = None,
+    age: Any = None,
+    last_modified: Any = None,
+) -> Any:
+    """``freshness_columns`` over NumPy arrays, vectorized.
+
+    ``table`` is the structured array of ``CacheControlColumns.to_numpy()``;
+    the result has the fields of ``Freshness`` (``FRESHNESS_DTYPE``).
+    """
+    np = import_numpy()
+    n = len(table)
+    flags = table["flags"]
+    received = np.asarray(response_time, dtype=np.int64)
+    if received.shape != (n,):
+        raise ValueError("columns differ in length")
+
+    def column(values: Any) -> Any:
+        if values is None:
+            return np.full(n, UNSET, dtype=np.int64)
+        return np.asarray(values, dtype=np.int64)
+
+    date_value = column(date)
+    date_value = np.where(date_value == UNSET, received, date_value)
+    s_maxage = table["s_maxage"].astype(np.int64) if shared else column(None)
+    lifetime = np.where(s_maxage != UNSET, s_maxage, table["max_age"])
+    expires_value = column(expires)
+    lifetime = np.where(
+        (lifetime == UNSET) & (expires_value != UNSET),
+        np.clip(expires_value - date_value, 0, DELTA_SECONDS_MAX),
+        lifetime,
+    )
+    last_modified_value = column(last_modified)
+    since_modified = date_value - last_modified_value
+    heuristic = (since_modified * HEURISTIC_FRACTION).astype(np.int64)
+    lifetime = np.where(
+        (lifetime == UNSET) & (last_modified_value != UNSET) & (since_modified > 0),
+        np.minimum(heuristic, DELTA_SECONDS_MAX),
+        lifetime,
+    )
+    lifetime = np.where(
+        (lifetime == UNSET) | (flags & _no_reuse_mask(shared) != 0), 0, lifetime
+    )
+
+    age_value = column(age)
+    corrected_age_value = np.where(age_value == UNSET, 0, age_value)
+    sent = column(request_time)
+    corrected_age_value += np.where(sent == UNSET, 0, received - sent)
+    apparent_age = np.maximum(received - date_value, 0)
+    current = np.maximum(apparent_age, corrected_age_value) + (now - received)
+
+    no_stale = (flags & _no_stale_mask(shared) != 0) | (s_maxage != UNSET)
+    ret = np.empty(n, dtype=FRESHNESS_DTYPE)
+    ret["lifetime"] = lifetime
+    ret["age"] = current
+    for field in ("stale_while_revalidate", "stale_if_error"):
+        window = table[field]
+        ret[field] = np.where(no_stale | (window == UNSET), 0, window)
+    return ret
@@ -0,0 +1,124 @@
+from typing import Dict, Iterator, List, Mapping, Sequence, Set, Tuple, Type, cast
+
+from .accept import Accept
+from .cache_control import CacheControl
+from .conditional import IfMatch, IfNoneMatch
+from .content_disposition import ContentDisposition
+from .content_range import ContentRange
+from .content_type import ContentType
+from .etag import ETag
+from .helper import HeaderModel
+
+RawHeaders = Sequence[Tuple[bytes, bytes]]
+
+# lower-cased header name -> model parsing it
+HEADER_MODELS: Dict[bytes, Type[HeaderModel]] = {}
+# headers whose repeated field lines form one comma-separated list
+LIST_HEADERS: Set[bytes] = set()
+
+
+def register_header_model(cls: Type[HeaderModel], list_header: bool = False) -> None:
+    name = cls.HEADER_NAME.lower().encode("latin-1")
+    HEADER_MODELS[name] = cls
+    if list_header:
+        LIST_HEADERS.add(name)
+
+
+register_header_model(ContentType)
+register_header_model(ContentDisposition)
+register_header_model(ContentRange)
+register_header_model(CacheControl, list_header=True)
+register_header_model(ETag)
+register_header_model(Accept, list_header=True)
+register_header_model(IfMatch, list_header=True)
+register_header_model(IfNoneMatch, list_header=True)
+
+
+class Headers(Mapping[str, HeaderModel]):
+    """Typed view over raw ASGI headers that parses a header on first access.
+
+    Keys are the names of registered header models, case-insensitive. A
+    missing or malformed header is absent from the mapping; the raw pairs stay
+    available as ``raw``. Raw names must be lower-cased, as ASGI requires.
+    """
+
+    __slots__ = ("raw", "_parsed")
+
+    def __init__(self, raw: RawHeaders):
+        self.raw = raw
+        self._parsed: Dict[bytes, HeaderModel | None] | None = None
+
+    def get_raw(self, name: str | bytes) -> bytes | None:
+        if isinstance(name, str):
+            name = name.lower().encode("latin-1")
+        values: List[bytes] = [v for k, v in self.raw if k == name]
+        if not values:
+            return None
+        if len(values) == 1 or name not in LIST_HEADERS:
+            return values[0]
+        return b", ".join(values)
+
+    def _get(self, name: bytes) -> HeaderModel | None:
+        parsed = self._parsed
+        if parsed is None:
+            parsed = self._parsed = {}
+        elif name in parsed:
+            return parsed[name]
+        model = None
+        cls = HEADER_MODELS.get(name)
+        if cls is not None and (value := self.get_raw(name)) is not None:
+            try:
+                model = cls.parse_bytes(value)
+            except ValueError:
+                pass
+        parsed[name] = model
+        return model
+
+    def __getitem__(self, name: str) -> HeaderModel:
+        model = self._get(name.lower().encode("latin-1"))
+        if model is None:
+            raise KeyError(name)
+        return model
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        for k, _ in self.raw:
+            if k in HEADER_MODELS and k not in seen:
+                seen.add(k)
+                if self._get(k) is not None:
+                    yield HEADER_MODELS[k].HEADER_NAME
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def accept(self) -> Accept | None:
+        return cast(Accept | None, self._get(b"accept"))
+
+    @property
+    def content_type(self) -> ContentType | None:
+        return cast(ContentType | None, self._get(b"content-type"))
+
+    @property
+    def content_disposition(self) -> ContentDisposition | None:
+        return cast(ContentDisposition | None, self._get(b"content-disposition"))
+
+    @property
+    def content_range(self) -> ContentRange | None:
+        return cast(ContentRange | None, self._get(b"content-range"))
+
+    @property
+    def cache_control(self) -> CacheControl | None:
+        return cast(CacheControl | None, self._get(b"cache-control"))
+
+    @property
+    def etag(self) -> ETag | None:
+        return cast(ETag | None, self._get(b"etag"))
+
+    @property
+    def if_match(self) -> IfMatch | None:
+        return cast(IfMatch | None, self._get(b"if-match"))
+
+    @property
+    def if_none_match(self) -> IfNoneMatch | None:
+        return cast(IfNoneMatch | None, self._get(b"if-none-match"))
@@ -1,10 +1,29 @@
 from collections.abc import Callable
+from email.utils import mktime_tz, parsedate_tz
+from functools import cached_property, wraps
+from itertools import chain
 import re
-from typing import Any, List, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Self,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
-from pydantic import BaseModel, ValidationError, WrapValidator
+from pydantic import BaseModel, ConfigDict, ValidationError, WrapValidator
 from pydantic.fields import FieldInfo
 
+from .cache import LRUCache
+
 
 def invalid_to_none(v: Any, handler: Callable[[Any], Any]) -> Any:
     try:
@@ -15,8 +34,260 @@ def invalid_to_none(v: Any, handler: Callable[[Any], Any]) -> Any:
 
 Invalid2None = WrapValidator(invalid_to_none)
 
+# Raw header values as handed over by ASGI servers
+BytesLike = bytes | bytearray | memoryview
+
+
+M = TypeVar("M", bound=BaseModel)
+
+_object_setattr = object.__setattr__
+
+
+_DEFAULTS: Dict[type, Tuple[Dict[str, Any], bool]] = {}
+
+
+def _construct_defaults(cls: Type[BaseModel]) -> Tuple[Dict[str, Any], bool]:
+    if (ret := _DEFAULTS.get(cls)) is None:
+        defaults = {
+            k: None if info.is_required() else info.default
+            for k, info in cls.model_fields.items()
+        }
+        ret = _DEFAULTS[cls] = defaults, cls.model_config.get("extra") == "allow"
+    return ret
+
+
+_MISSING = object()
+
+
+def _intern_key(
+    defaults: Dict[str, Any], items: Iterable[Tuple[str, Any]]
+) -> Tuple[Any, ...]:
+    # non-default values only, typed so that True and 1 (or False and 0) stay apart
+    return tuple(
+        sorted(
+            (k, v.__class__, v)
+            for k, v in items
+            if (d := defaults.get(k, _MISSING)) != v or d.__class__ is not v.__class__
+        )
+    )
+
+
+def _interned(cls: Type[M], registry: Dict[Any, Any], items: Iterable) -> M | None:
+    try:
+        return registry.get(_intern_key(_construct_defaults(cls)[0], items))
+    except TypeError:  # unhashable value
+        return None
+
+
+def construct(
+    cls: Type[M], fields: Dict[str, Any], extra: Dict[str, Any] | None = None
+) -> M:
+    """Build a model from values the parser already checked, skipping validation.
+
+    Unlike ``model_construct`` this does no per-field work beyond copying the
+    defaults, so it is only safe for values of the right type. The interned
+    instance is returned instead when one matches.
+    """
+    if registry := getattr(cls, "__interned__", None):
+        items = chain(fields.items(), extra.items()) if extra else fields.items()
+        if (obj := _interned(cls, registry, items)) is not None:
+            return obj
+    defaults, allow_extra = _construct_defaults(cls)
+    values = defaults.copy()
+    values.update(fields)
+    obj = object.__new__(cls)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__pydantic_fields_set__", set(fields))
+    _object_setattr(obj, "__pydantic_extra__", (extra or {}) if allow_extra else None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+P = TypeVar("P", bound=Callable[..., Any])
+
+
+def cached_parse(fn: P) -> P:
+    """Route a ``parse``-style classmethod through the class's parse cache."""
+
+    @wraps(fn)
+    def wrapper(cls, value):
+        cache = cls.__parse_cache__
+        if cache is None:
+            return fn(cls, value)
+        # bytearray and memoryview are not hashable
+        key = (
+            value if isinstance(value, (str, bytes)) or value is None else bytes(value)
+        )
+        return cache.get_or_compute(key, fn, cls, key)
+
+    return cast(P, wrapper)
+
+
+T = TypeVar("T")
+
+
+class _InterningMetaclass(type(BaseModel)):
+    # typed as returning an instance of cls, so type checkers still see the
+    # signature of each model's own __init__
+    def __call__(cls: Type[T], **data: Any) -> T:
+        model = cast(Type[HeaderModel], cls)
+        registry = model.__interned__
+        if not registry:
+            return super().__call__(**data)
+        if (obj := _interned(model, registry, data.items())) is not None:
+            return cast(T, obj)
+        # other spellings of a value ("1" for 1) only match once validated
+        obj = super().__call__(**data)
+        return cast(T, _interned(model, registry, _model_items(obj)) or obj)
+
+
+def _model_items(obj: BaseModel) -> Iterable[Tuple[str, Any]]:
+    # __dict__ may also hold cached properties
+    values = obj.__dict__
+    items = [(k, values[k]) for k in obj.__class__.model_fields]
+    if obj.__pydantic_extra__:
+        items.extend(obj.__pydantic_extra__.items())
+    return items
+
+
+def value_key(obj: BaseModel) -> Tuple[Any, ...]:
+    """Hashable key of a model's value for memo caches.
+
+    Unlike the model's own hash and ``==``, it keeps ``True`` and ``1`` (or
+    ``False`` and ``0``) apart.
+    """
+    return _intern_key(_construct_defaults(type(obj))[0], _model_items(obj))
+
+
+class HeaderModel(BaseModel, metaclass=_InterningMetaclass):
+    HEADER_NAME: ClassVar[str]
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
-class HeaderModel(BaseModel):
+    __parse_cache__: ClassVar[LRUCache[Any, Any] | None] = None
+    # value key -> shared instance, see intern()
+    __interned__: ClassVar[Dict[Any, Any] | None] = None
+    __alias_mapping__: ClassVar[Dict[str, str]]
+    # lower-cased HEADER_NAME, as ASGI sends it
+    __header_name__: ClassVar[bytes]
+    __serialized_names__: ClassVar[Tuple[Tuple[str, str], ...]]
+
+    @classmethod
+    def enable_parse_cache(cls, maxsize: int = 1024) -> LRUCache[Any, Self]:
+        cls.__parse_cache__ = LRUCache(maxsize)
+        return cls.__parse_cache__
+
+    @classmethod
+    def disable_parse_cache(cls) -> None:
+        cls.__parse_cache__ = None
+
+    @classmethod
+    def get_parse_cache(cls) -> LRUCache[Any, Self] | None:
+        return cls.__parse_cache__
+
+    @classmethod
+    def intern(cls, obj: Self) -> Self:
+        """Register ``obj`` as the shared instance for its value.
+
+        From then on ``parse``, ``parse_bytes`` and the constructor return the
+        shared instance for an equal value instead of a new model. Returns the
+        instance already registered for the value, if any.
+        """
+        if type(obj) is not cls:
+            raise TypeError(f"expected {cls.__name__}, got {type(obj).__name__}")
+        if cls.__interned__ is None:
+            cls.__interned__ = {}
+        return cls.__interned__.setdefault(value_key(obj), obj)
+
+    @classmethod
+    def clear_interned(cls) -> None:
+        cls.__interned__ = None
+
+    if TYPE_CHECKING:
+        # frozen, so pydantic makes models hashable
+        def __hash__(self) -> int: ...
+
+        @classmethod
+        def parse(cls, text: str) -> Self: ...
+
+        @classmethod
+        def parse_bytes(cls, data: BytesLike) -> Self: ...
+
+    @classmethod
+    def parse_many(
+        cls,
+        values: Iterable[str | BytesLike],
+        errors: List[Tuple[int, Any, ValueError]] | None = None,
+        memo_size: int = 4096,
+    ) -> Iterator[Self]:
+        """Parse a stream of raw values, yielding one model per valid value.
+
+        Invalid values are skipped; pass ``errors`` to collect them as
+        ``(index, value, exception)``. Up to ``memo_size`` distinct values are
+        parsed once and their result reused for the rest of the batch.
+        """
+        parse = cls.parse
+        parse_bytes = cls.parse_bytes
+        memo: Dict[Any, Self | ValueError] = {}
+        for index, value in enumerate(values):
+            if isinstance(value, (bytearray, memoryview)):
+                value = bytes(value)
+            ret = memo.get(value)
+            if ret is None:
+                try:
+                    if isinstance(value, bytes):
+                        ret = parse_bytes(value)
+                    else:
+                        ret = parse(value)
+                except ValueError as e:
+                    ret = e
+                if len(memo) < memo_size:
+                    memo[value] = ret
+            if isinstance(ret, ValueError):
+                if errors is not None:
+                    errors.append((index, value, ret))
+                continue
+            yield ret
+
+    def render_into(self, buf: bytearray) -> None:
+        """Append the field value, as sent on the wire, to ``buf``."""
+        buf += self.to_bytes()
+
+    def to_bytes(self) -> bytes:
+        """The field value as sent on the wire.
+
+        Raises ValueError when the value holds characters outside ISO-8859-1,
+        which a field value cannot carry; ``str()`` still renders it.
+        """
+        return self._wire
+
+    @cached_property
+    def _wire(self) -> bytes:
+        # models are frozen, so render once per instance
+        buf = bytearray()
+        try:
+            self._render(buf)
+        except UnicodeEncodeError as e:
+            raise ValueError(
+                f"{self.HEADER_NAME} value is not ISO-8859-1: {e.object!r}"
+            ) from None
+        return bytes(buf)
+
+    def _render(self, buf: bytearray) -> None:
+        buf += str(self).encode("latin-1")
+
+    def to_header(self) -> Tuple[bytes, bytes]:
+        """``(name, value)`` pair for ASGI response headers."""
+        return self.__header_name__, self._wire
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # drop cached properties computed from the old values
+        fields = self.__class__.model_fields
+        values = {k: v for k, v in copied.__dict__.items() if k in fields}
+        _object_setattr(copied, "__dict__", values)
+        return copied
 
     @classmethod
     def __field_alias__(cls, info: FieldInfo) -> List[str] | str | None:
@@ -34,23 +305,60 @@ class HeaderModel(BaseModel):
     def __pydantic_init_subclass__(cls, **kwargs):
         super().__pydantic_init_subclass__(**kwargs)
         ret = {}
+        names = []
         for k, info in cls.model_fields.items():
             alias = cls.__field_alias__(info)
             if not alias:
+                names.append((k, k))
                 continue
             if isinstance(alias, List):
                 for a in alias:
                     ret[a] = k
+                names.append((k, alias[0]))
             elif isinstance(alias, str):
                 ret[alias] = k
+                names.append((k, alias))
             else:
                 raise ValueError("alias should be str or List[str]")
         cls.__alias_mapping__ = ret
+        # (field, name on the wire) in declaration order, for serializers
+        cls.__serialized_names__ = tuple(names)
+        cls.__parse_cache__ = None
+        cls.__interned__ = None
+        if (header_name := getattr(cls, "HEADER_NAME", None)) is not None:
+            cls.__header_name__ = header_name.lower().encode("latin-1")
 
 
 # RegExp to match chars that must be quoted-pair in RFC 2616
 QUOTE_REGEXP = re.compile(r"""([\\"])""")  # g
 
 
+def latin1(data: bytes) -> str:
+    return data.decode("latin-1")
+
+
+def parse_http_date(value: str | BytesLike) -> int | None:
+    """Seconds since the epoch of an HTTP-date (RFC 9110 sec 5.6.7), or None."""
+    if not isinstance(value, str):
+        value = latin1(bytes(value))
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    try:
+        # the obsolete asctime format has no zone, but is GMT as well
+        return mktime_tz(parsed[:9] + (parsed[9] or 0,))
+    except (OverflowError, ValueError):
+        return None
+
+
+def import_numpy() -> Any:
+    """NumPy, an optional dependency of the ``to_numpy``/``*_numpy`` helpers."""
+    try:
+        import numpy  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        raise ImportError("NumPy is required for this, pip install numpy") from None
+    return numpy
+
+
 def qstring(text: str) -> str:
     return '"' + QUOTE_REGEXP.sub(lambda m: "\\" + m.group(1), text) + '"'
@@ -0,0 +1,230 @@
+"""Opt-in timing of header parsing and serialization.
+
+``install(sink)`` wraps every ``parse``/``parse_bytes`` classmethod and the
+``__str__``/``_render`` serializers of the header models; ``uninstall()`` puts
+the original functions back, so nothing is left in the call path while
+instrumentation is off.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from importlib import import_module
+from threading import Lock, local
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Protocol,
+    Tuple,
+    Type,
+    runtime_checkable,
+)
+
+from .content_range import Range
+from .helper import HeaderModel
+
+PARSE_METHODS = ("parse", "parse_bytes")
+RENDER_METHODS = ("__str__", "_render")
+SAMPLE_SIZE = 4096
+
+
+@runtime_checkable
+class Sink(Protocol):
+    def record(
+        self,
+        header: str,
+        op: str,
+        duration_ns: int,
+        size: int,
+        error: BaseException | None,
+    ) -> None: ...
+
+
+Callback = Callable[[str, str, int, int, BaseException | None], None]
+
+
+class OpStats:
+    """Counters of one operation on one header class."""
+
+    def __init__(self, sample_size: int = SAMPLE_SIZE):
+        self.count = 0
+        self.failures = 0
+        self.total_ns = 0
+        # most recent durations, for percentiles
+        self.durations: Deque[int] = deque(maxlen=sample_size)
+        # power-of-two upper bound of the input size -> calls
+        self.sizes: Dict[int, int] = {}
+
+    def add(self, duration_ns: int, size: int, failed: bool) -> None:
+        self.count += 1
+        self.failures += failed
+        self.total_ns += duration_ns
+        self.durations.append(duration_ns)
+        bucket = 1 << size.bit_length() if size else 0
+        self.sizes[bucket] = self.sizes.get(bucket, 0) + 1
+
+    def percentile(self, q: float) -> int:
+        """Duration below which ``q`` percent of the sampled calls finished."""
+        if not self.durations:
+            return 0
+        ordered = sorted(self.durations)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+    def summary(self) -> Dict[str, Any]:
+        return dict(
+            count=self.count,
+            failures=self.failures,
+            total_ns=self.total_ns,
+            p50_ns=self.percentile(50),
+            p90_ns=self.percentile(90),
+            p99_ns=self.percentile(99),
+            sizes=dict(sorted(self.sizes.items())),
+        )
+
+
+class Stats:
+    """In-process sink aggregating calls per (header class, operation)."""
+
+    def __init__(self, sample_size: int = SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self.ops: Dict[Tuple[str, str], OpStats] = {}
+        self._lock = Lock()
+
+    def record(
+        self,
+        header: str,
+        op: str,
+        duration_ns: int,
+        size: int,
+        error: BaseException | None,
+    ) -> None:
+        with self._lock:
+            stats = self.ops.get((header, op))
+            if stats is None:
+                stats = self.ops[(header, op)] = OpStats(self.sample_size)
+            stats.add(duration_ns, size, error is not None)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {f"{h}.{op}": s.summary() for (h, op), s in self.ops.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self.ops.clear()
+
+
+class _CallbackSink:
+    def __init__(self, callback: Callback):
+        # the callback itself, so recording costs no extra call
+        self.record: Callable[..., None] = callback
+
+
+# (class, attribute, original __dict__ entry) of every installed wrapper
+_installed: List[Tuple[type, str, Any]] = []
+# nested calls (parse_bytes -> parse, _render -> __str__) are part of the outer one
+_active = local()
+
+
+def _size(value: Any) -> int:
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+def _wrap(fn: Callable[..., Any], op: str, sink: Sink) -> Callable[..., Any]:
+    """Time ``fn``; the size is the input's for parsers and the output's otherwise."""
+    record = sink.record
+    clock = time.perf_counter_ns
+
+    @wraps(fn)
+    def wrapper(owner, *args, **kwargs):
+        if getattr(_active, "depth", 0):
+            return fn(owner, *args, **kwargs)
+        header = owner.__name__ if isinstance(owner, type) else type(owner).__name__
+        if op == "render":
+            size = -len(args[0])
+        else:
+            size = _size(args[0]) if args else 0
+        _active.depth = 1
+        start = clock()
+        try:
+            ret = fn(owner, *args, **kwargs)
+        except BaseException as e:
+            record(header, op, clock() - start, max(size, 0), e)
+            raise
+        finally:
+            _active.depth = 0
+        elapsed = clock() - start
+        if op == "render":
+            size += len(args[0])
+        elif op == "str":
+            size = len(ret)
+        record(header, op, elapsed, size, None)
+        return ret
+
+    return wrapper
+
+
+def _classes() -> Iterator[type]:
+    # the package imports model modules on first use; load them all, or
+    # models not used yet would be left out
+    from . import _LAZY
+
+    for module in sorted(set(_LAZY.values())):
+        import_module(f"{__package__}.{module}")
+    yield Range
+    pending: List[Type[HeaderModel]] = [HeaderModel]
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        yield cls
+
+
+def install(sink: Sink | Callback | None = None) -> Sink:
+    """Start recording every parse and serialization into ``sink``.
+
+    ``sink`` is an object with a ``record`` method or a callback taking the
+    same ``(header, op, duration_ns, size, error)`` arguments; by default a
+    new ``Stats``. Every model of the package is covered, imported or not;
+    models defined elsewhere after ``install`` are not.
+    """
+    if _installed:
+        raise RuntimeError("instrumentation is already installed")
+    if sink is None:
+        sink = Stats()
+    elif not isinstance(sink, Sink):
+        sink = _CallbackSink(sink)
+    for cls in _classes():
+        for name in PARSE_METHODS:
+            method = cls.__dict__.get(name)
+            if isinstance(method, classmethod):
+                wrapper = _wrap(method.__func__, name, sink)
+                _installed.append((cls, name, method))
+                setattr(cls, name, classmethod(wrapper))
+        for name in RENDER_METHODS:
+            if (fn := cls.__dict__.get(name)) is not None:
+                op = "str" if name == "__str__" else "render"
+                _installed.append((cls, name, fn))
+                setattr(cls, name, _wrap(fn, op, sink))
+    return sink
+
+
+def uninstall() -> None:
+    while _installed:
+        cls, name, original = _installed.pop()
+        setattr(cls, name, original)
+
+
+@contextmanager
+def instrumented(sink: Sink | Callback | None = None) -> Iterator[Sink]:
+    installed = install(sink)
+    try:
+        yield installed
+    finally:
+        uninstall()
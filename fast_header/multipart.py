@@ -0,0 +1,217 @@
+import re
+from typing import TYPE_CHECKING, List, NamedTuple, Self
+
+from .content_disposition import ContentDisposition
+from .content_type import ContentType
+from .headers import Headers
+
+if TYPE_CHECKING:
+    from .content_range import ContentRange
+
+# RFC 2046 sec 5.1.1: 1-70 bchars, not ending with a space
+BOUNDARY_CHARS = frozenset(
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'()+_,-./:=? "
+)
+MAX_HEADER_SIZE = 16 * 1024
+
+PREAMBLE, HEADERS, BODY, EPILOGUE = range(4)
+
+Buffer = bytes | bytearray | memoryview
+HEADERS_END = b"\r\n\r\n"
+HEADERS_END_REGEXP = re.compile(re.escape(HEADERS_END))
+
+
+def _find(data: Buffer, sub: bytes, pattern: re.Pattern[bytes], pos: int) -> int:
+    # memoryview has no find(); the regex scans any buffer without copying it
+    if isinstance(data, memoryview):
+        m = pattern.search(data, pos)
+        return -1 if m is None else m.start()
+    return data.find(sub, pos)
+
+
+class PartStart(NamedTuple):
+    headers: Headers
+
+
+class PartData(NamedTuple):
+    data: memoryview
+
+
+class PartEnd(NamedTuple):
+    pass
+
+
+class FormDataStart(NamedTuple):
+    headers: Headers
+    disposition: ContentDisposition
+    content_type: ContentType | None
+
+    @property
+    def name(self) -> str | None:
+        return self.disposition.parameters.get("name")
+
+    @property
+    def filename(self) -> str | None:
+        return self.disposition.filename
+
+
+class RangePartStart(NamedTuple):
+    """Part start of ``byteranges.ByteRangesParser``."""
+
+    headers: Headers
+    content_range: "ContentRange"
+    # where the part's bytes go, end-exclusive like Range.parse
+    start: int
+    stop: int
+
+
+Event = PartStart | PartData | PartEnd | FormDataStart | RangePartStart
+
+PART_END = PartEnd()
+
+
+class MultipartParser:
+    """Incremental, sans-IO parser of a ``multipart/*`` body (RFC 2046).
+
+    ``feed`` takes body chunks and returns the events they complete. Part
+    data comes out as ``memoryview`` slices of the fed chunks, so a chunk must
+    not be modified while its slices are in use. At most one delimiter's
+    worth of bytes is held back between feeds, and every byte is scanned for
+    the delimiter once.
+    """
+
+    def __init__(self, boundary: str | bytes, max_header_size: int = MAX_HEADER_SIZE):
+        if isinstance(boundary, str):
+            boundary = boundary.encode("latin-1")
+        if not 0 < len(boundary) <= 70 or not BOUNDARY_CHARS.issuperset(boundary):
+            raise ValueError("invalid boundary")
+        self.max_header_size = max_header_size
+        self._delimiter = b"\r\n--" + boundary
+        self._delimiter_regexp = re.compile(re.escape(self._delimiter))
+        self._state = PREAMBLE
+        # a possible delimiter prefix at the end of the last chunk; the first
+        # delimiter may start the body, so pretend a CRLF precedes it
+        self._tail = b"\r\n"
+        self._head = bytearray()
+
+    @classmethod
+    def from_content_type(cls, content_type: ContentType, **kwargs) -> Self:
+        boundary = content_type.parameters.get("boundary")
+        if not boundary:
+            raise ValueError("missing boundary parameter")
+        return cls(boundary, **kwargs)
+
+    @property
+    def done(self) -> bool:
+        return self._state == EPILOGUE
+
+    def feed(self, data: Buffer) -> List[Event]:
+        if isinstance(data, memoryview) and data.format != "B":
+            data = data.cast("B")
+        events: List[Event] = []
+        pos = 0
+        while pos < len(data) and self._state != EPILOGUE:
+            if self._state == HEADERS:
+                pos = self._scan_headers(data, pos, events)
+            else:
+                pos = self._scan_body(data, pos, events)
+        return events
+
+    def close(self) -> None:
+        if self._state != EPILOGUE:
+            raise ValueError("incomplete multipart body")
+
+    def _part_start(self, headers: Headers) -> Event:
+        return PartStart(headers)
+
+    def _emit(self, data: Buffer, start: int, stop: int, events: List[Event]):
+        if self._state == BODY and stop > start:
+            events.append(PartData(memoryview(data)[start:stop]))
+
+    def _scan_body(self, data: Buffer, pos: int, events: List[Event]) -> int:
+        delimiter = self._delimiter
+        if tail := self._tail:
+            window = tail + data[pos : pos + len(delimiter) - len(tail)]
+            if window == delimiter:
+                self._tail = b""
+                return self._delimited(pos + len(delimiter) - len(tail), events)
+            if delimiter.startswith(window):
+                self._tail = bytes(window)
+                return len(data)
+            self._tail = b""
+            self._emit(tail, 0, len(tail), events)
+        i = _find(data, delimiter, self._delimiter_regexp, pos)
+        if i != -1:
+            self._emit(data, pos, i, events)
+            return self._delimited(i + len(delimiter), events)
+        # the boundary holds no CR, so a delimiter prefix starts at the last one
+        stop = len(data)
+        lo = max(pos, stop - len(delimiter) + 1)
+        rest = bytes(data[lo:])  # shorter than the delimiter
+        j = rest.rfind(b"\r")
+        if j != -1 and delimiter.startswith(rest[j:]):
+            self._tail = rest[j:]
+            stop = lo + j
+        self._emit(data, pos, stop, events)
+        return len(data)
+
+    def _delimited(self, pos: int, events: List[Event]) -> int:
+        if self._state == BODY:
+            events.append(PART_END)
+        self._state = HEADERS
+        return pos
+
+    def _scan_headers(self, data: Buffer, pos: int, events: List[Event]) -> int:
+        head = self._head
+        if len(head) < 2:
+            start = bytes(head) + data[pos : pos + 2 - len(head)]
+            if start == b"--":
+                self._state = EPILOGUE
+                return len(data)
+        end = -1
+        if head:
+            # "\r\n\r\n" split between the previous chunk and this one
+            window = bytes(head[-3:]) + data[pos : pos + 3]
+            if (i := window.find(HEADERS_END)) != -1:
+                end = pos + i + 4 - len(head[-3:])
+        if end == -1 and (i := _find(data, HEADERS_END, HEADERS_END_REGEXP, pos)) != -1:
+            end = i + 4
+        stop = len(data) if end == -1 else end
+        if len(head) + stop - pos > self.max_header_size:
+            raise ValueError("part header section too large")
+        head += data[pos:stop]
+        if end == -1:
+            return stop
+        # transport padding after the delimiter, then header field lines
+        padding, *lines = bytes(head[:-4]).split(b"\r\n")
+        if padding.strip(b" \t"):
+            raise ValueError("invalid multipart delimiter line")
+        raw = []
+        for line in lines:
+            name, sep, value = line.partition(b":")
+            if not sep or not name or name != name.strip():
+                raise ValueError("invalid part header field")
+            raw.append((name.lower(), value.strip(b" \t")))
+        head.clear()
+        events.append(self._part_start(Headers(raw)))
+        self._state = BODY
+        return end
+
+
+class FormDataParser(MultipartParser):
+    """``multipart/form-data`` parser (RFC 7578).
+
+    Each part starts with a ``FormDataStart`` carrying its parsed
+    ``Content-Disposition`` and, when sent, ``Content-Type``.
+    """
+
+    def _part_start(self, headers: Headers) -> Event:
+        disposition = headers.get_raw(b"content-disposition")
+        if disposition is None:
+            raise ValueError("missing Content-Disposition in form-data part")
+        content_type = headers.get_raw(b"content-type")
+        return FormDataStart(
+            headers,
+            ContentDisposition.parse_bytes(disposition),
+            None if content_type is None else ContentType.parse_bytes(content_type),
+        )
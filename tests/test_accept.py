@@ -0,0 +1,91 @@
+import pytest
+from fast_header import Accept, ContentType, MediaRange
+from fast_header.accept import NEGOTIATION_CACHE, negotiate
+
+BROWSER = "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
+
+
+def test_parse():
+    accept = Accept.parse(BROWSER)
+    assert [r.type for r in accept.ranges] == [
+        "text/html",
+        "application/xhtml+xml",
+        "image/avif",
+        "image/webp",
+        "application/xml",
+        "*/*",
+    ]
+    assert accept.ranges[-1].q == 0.8
+
+
+def test_parse_specificity_order():
+    accept = Accept.parse("*/*, text/*, text/plain;format=flowed, text/plain")
+    assert [str(r) for r in accept.ranges] == [
+        "text/plain; format=flowed",
+        "text/plain",
+        "text/*",
+        "*/*",
+    ]
+
+
+def test_parse_params_and_ext():
+    accept = Accept.parse('TEXT/Plain; Charset="utf-8"; q=0.5; ext=1, , ')
+    assert accept.ranges == (
+        MediaRange(type="text/plain", parameters=(("charset", "utf-8"),), q=0.5),
+    )
+
+
+def test_parse_lenient():
+    accept = Accept.parse("text/html, *; q=.2")
+    assert [(r.type, r.q) for r in accept.ranges] == [("text/html", 1.0), ("*/*", 0.2)]
+    assert Accept.parse("").ranges == ()
+
+
+def test_parse_invalid():
+    for text in ["text", "*/html", "text/html;q=2", "text/html;q=x", "text/html html"]:
+        with pytest.raises(ValueError):
+            Accept.parse(text)
+
+
+def test_parse_bytes():
+    assert Accept.parse_bytes(memoryview(BROWSER.encode())) == Accept.parse(BROWSER)
+
+
+def test_negotiate():
+    accept = Accept.parse("application/json, text/*;q=0.5, */*;q=0.1")
+    offers = [ContentType(type="text/plain"), ContentType(type="application/json")]
+    assert accept.negotiate(offers) == offers[1]
+    assert accept.negotiate([ContentType(type="image/png")]) == ContentType(
+        type="image/png"
+    )
+    assert Accept.parse("text/html").negotiate(offers) is None
+
+
+def test_negotiate_most_specific_wins():
+    accept = Accept.parse("text/*;q=0.9, text/plain;q=0, */*;q=0.1")
+    offers = [ContentType(type="text/plain"), ContentType(type="text/html")]
+    assert accept.negotiate(offers) == offers[1]
+
+
+def test_negotiate_parameters():
+    accept = Accept.parse("text/plain;charset=utf-8, text/plain;q=0.1")
+    latin1 = ContentType(type="text/plain", charset="latin1")
+    utf8 = ContentType(type="text/plain", charset="utf-8")
+    assert accept.negotiate([latin1, utf8]) == utf8
+
+
+def test_negotiate_cached():
+    NEGOTIATION_CACHE.clear()
+    offers = ("application/json", "text/html")
+    ret = negotiate(BROWSER, offers)
+    assert ret == ContentType(type="text/html")
+    assert negotiate(BROWSER, offers) is ret
+    assert NEGOTIATION_CACHE.info().hits == 1
+
+
+def test_negotiate_without_header():
+    assert negotiate(None, ["application/json"]) == ContentType(type="application/json")
+    assert negotiate("text/html html", ["application/json"]) == ContentType(
+        type="application/json"
+    )
+    assert negotiate("text/html", []) is None
@@ -0,0 +1,94 @@
+import asyncio
+
+from fast_header import CacheControl, ContentType, ETag
+from fast_header.asgi import SCOPE_KEY, HeadersMiddleware, get_headers, render_headers
+
+
+def run(app, scope):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+def http_scope(headers):
+    return {"type": "http", "method": "GET", "path": "/", "headers": headers}
+
+
+def test_middleware():
+    seen = []
+
+    async def app(scope, receive, send):
+        headers = get_headers(scope)
+        seen.append(headers)
+        assert headers.content_type == ContentType(type="application/json")
+        # a second layer gets the already parsed model
+        assert get_headers(scope).content_type is headers.content_type
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    ContentType(type="text/plain", charset="utf-8"),
+                    (b"cache-control", CacheControl(no_store=True)),
+                    (b"x-raw", b"1"),
+                    ETag(value="a", weak=True),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    scope = http_scope([(b"content-type", b"application/json")])
+    sent = run(HeadersMiddleware(app), scope)
+    assert seen[0] is not None
+    # the caller's scope is left alone
+    assert SCOPE_KEY not in scope
+    assert sent[0]["headers"] == [
+        (b"content-type", b"text/plain; charset=utf-8"),
+        (b"cache-control", b"no-store"),
+        (b"x-raw", b"1"),
+        (b"etag", b'W/"a"'),
+    ]
+    assert sent[1] == {"type": "http.response.body", "body": b"ok"}
+
+
+def test_raw_headers_pass_through():
+    headers = [(b"content-length", b"2")]
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+
+    sent = run(HeadersMiddleware(app), http_scope([]))
+    assert sent[0]["headers"] is headers
+    assert render_headers(headers) is headers
+
+
+def test_render_header_iterables():
+    expected = [(b"x-raw", b"1"), (b"etag", b'"a"')]
+    assert render_headers(((b"x-raw", b"1"), ETag(value="a"))) == expected
+    assert render_headers(iter([(b"x-raw", b"1"), ETag(value="a")])) == expected
+    assert render_headers(iter([(b"x-raw", b"1")])) == [(b"x-raw", b"1")]
+
+
+def test_other_scopes():
+    async def app(scope, receive, send):
+        assert SCOPE_KEY not in scope
+        await send({"type": "lifespan.startup.complete"})
+
+    assert run(HeadersMiddleware(app), {"type": "lifespan"}) == [
+        {"type": "lifespan.startup.complete"}
+    ]
+
+
+def test_get_headers_without_middleware():
+    scope = http_scope([(b"cache-control", b"max-age=5")])
+    headers = get_headers(scope)
+    assert scope[SCOPE_KEY] is headers
+    assert get_headers(scope) is headers
+    assert headers.cache_control == CacheControl(max_age=5)
@@ -0,0 +1,223 @@
+import asyncio
+from email.parser import BytesParser
+import mmap
+import os
+import random
+import tempfile
+from typing import get_args
+
+import pytest
+
+from fast_header import ContentRange, ContentType, Range
+from fast_header.byteranges import (
+    ByteRanges,
+    ByteRangesParser,
+    ByteRangesReader,
+    FileRegion,
+    RangeFile,
+    RangePartStart,
+)
+from fast_header.multipart import PART_END, Event, PartData
+
+DATA = bytes(range(256)) * 4
+
+
+def render(body: ByteRanges, fd: int) -> bytes:
+    ret = bytearray()
+    for chunk in body.chunks(fd):
+        if isinstance(chunk, FileRegion):
+            ret += os.pread(chunk.fd, chunk.length, chunk.offset)
+        else:
+            ret += chunk
+    return bytes(ret)
+
+
+def test_body():
+    ranges = Range.parse("bytes=0-9, 500-", len(DATA)) or []
+    body = ByteRanges(ranges, len(DATA), "application/octet-stream", boundary="SEP")
+    assert str(body.content_type) == "multipart/byteranges; boundary=SEP"
+    raw = b"".join(body.chunks(DATA))
+    assert len(raw) == body.content_length
+    assert raw.startswith(
+        b"--SEP\r\nContent-Type: application/octet-stream\r\n"
+        b"Content-Range: bytes 0-9/1024\r\n\r\n"
+    )
+    assert raw.endswith(b"\r\n--SEP--\r\n")
+
+    msg = BytesParser().parsebytes(
+        f"Content-Type: {body.content_type}\r\n\r\n".encode() + raw
+    )
+    parts = [part for part in msg.walk() if part is not msg]
+    assert len(parts) == 2
+    for part, r in zip(parts, ranges):
+        cr = ContentRange.parse(part["Content-Range"])
+        assert cr.range == Range(start=r.start, stop=r.stop - 1)
+        assert cr.size == len(DATA)
+        assert part.get_payload(decode=True) == DATA[r.start : r.stop]
+
+
+def test_zero_copy_slices():
+    buf = bytearray(DATA)
+    body = ByteRanges([Range(start=1, stop=3)], len(DATA))
+    chunks = list(body.chunks(buf))
+    assert isinstance(chunks[1], memoryview)
+    buf[1] = 0xFF
+    assert chunks[1].tobytes() == b"\xff\x02"
+
+
+def test_file_descriptor_and_mmap():
+    ranges = [Range(start=0, stop=100), Range(start=200, stop=300)]
+    with tempfile.TemporaryFile() as f:
+        f.write(DATA)
+        f.flush()
+        body = ByteRanges(ranges, len(DATA), boundary="SEP")
+        regions = [c for c in body.chunks(f.fileno()) if isinstance(c, FileRegion)]
+        assert regions == [
+            FileRegion(f.fileno(), 0, 100),
+            FileRegion(f.fileno(), 200, 100),
+        ]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            from_mmap = b"".join(body.chunks(m))
+            assert render(body, f.fileno()) == from_mmap
+            assert len(from_mmap) == body.content_length
+
+
+def test_async_chunks():
+    body = ByteRanges([Range(start=0, stop=10)], len(DATA), boundary="SEP")
+
+    async def collect():
+        return [bytes(c) async for c in body.achunks(DATA)]
+
+    assert b"".join(asyncio.run(collect())) == b"".join(body.chunks(DATA))
+
+
+def test_random_boundary():
+    a = ByteRanges([Range(start=0, stop=10)], len(DATA))
+    b = ByteRanges([Range(start=0, stop=10)], len(DATA))
+    assert a.boundary != b.boundary
+
+
+def split(data: bytes, rnd: random.Random):
+    i = 0
+    while i < len(data):
+        n = rnd.randint(1, 64)
+        yield data[i : i + n]
+        i += n
+
+
+def test_parser_events():
+    body = ByteRanges([Range(start=2, stop=5)], len(DATA), boundary="SEP")
+    events = ByteRangesParser("SEP").feed(b"".join(body.chunks(DATA)))
+    assert isinstance(events[0], RangePartStart)
+    assert (events[0].start, events[0].stop) == (2, 5)
+    assert str(events[0].content_range) == "bytes 2-4/1024"
+    assert [bytes(e.data) for e in events if isinstance(e, PartData)] == [DATA[2:5]]
+    assert events[-1] is PART_END
+    assert RangePartStart in get_args(Event)
+
+
+@pytest.mark.parametrize(
+    "content_range",
+    [None, b"bytes */1024", b"bytes 5-2/1024", b"bytes 0-1024/1024", b"items 0-1/2"],
+)
+def test_parser_invalid_part(content_range):
+    head = b"--SEP\r\n"
+    if content_range is not None:
+        head += b"Content-Range: " + content_range + b"\r\n"
+    with pytest.raises(ValueError):
+        ByteRangesParser("SEP").feed(head + b"\r\nxx\r\n--SEP--")
+
+
+def test_reader_reassembles():
+    rnd = random.Random(0)
+    ranges = [
+        Range(start=0, stop=100),
+        Range(start=300, stop=301),
+        Range(start=900, stop=1024),
+    ]
+    body = ByteRanges(ranges, len(DATA), "application/octet-stream")
+    raw = b"".join(body.chunks(DATA))
+    buf = bytearray(len(DATA))
+    file = RangeFile(buf, len(DATA))
+    reader = ByteRangesReader.from_content_type(body.content_type, file)
+    for chunk in split(raw, rnd):
+        reader.feed(chunk)
+    reader.close()
+    assert reader.done
+    assert file.filled == ranges
+    for r in ranges:
+        assert buf[r.start : r.stop] == DATA[r.start : r.stop]
+    assert file.missing() == [Range(start=100, stop=300), Range(start=301, stop=900)]
+    assert file.range_header() == "bytes=100-299, 301-899"
+    assert not file.complete
+
+
+def test_reader_resume_into_file():
+    with tempfile.TemporaryFile() as f:
+        f.truncate(len(DATA))
+        file = RangeFile(f.fileno(), len(DATA))
+        first = ByteRanges(
+            Range.parse("bytes=0-9, 500-599", len(DATA)) or [], len(DATA)
+        )
+        reader = ByteRangesReader(file, first.boundary)
+        reader.feed(b"".join(first.chunks(DATA)))
+        ranges = Range.parse(file.range_header(), len(DATA)) or []
+        second = ByteRanges(ranges, len(DATA))
+        reader = ByteRangesReader(file, second.boundary)
+        reader.feed(b"".join(second.chunks(DATA)))
+        assert file.complete
+        assert file.range_header() is None
+        assert os.pread(f.fileno(), len(DATA), 0) == DATA
+
+
+def test_reader_mmap_and_truncated_body():
+    body = ByteRanges(
+        [Range(start=0, stop=10), Range(start=20, stop=30)], len(DATA), boundary="SEP"
+    )
+    raw = b"".join(body.chunks(DATA))
+    with mmap.mmap(-1, len(DATA)) as m, RangeFile(m, len(DATA)) as file:
+        reader = ByteRangesReader(file, "SEP")
+        # cut in the middle of the second part
+        reader.feed(raw[: raw.index(DATA[20:30]) + 4])
+        with pytest.raises(ValueError):
+            reader.close()
+        assert file.filled == [Range(start=0, stop=10), Range(start=20, stop=24)]
+        assert m[20:24] == DATA[20:24]
+
+
+def test_reader_part_length_mismatch():
+    part = b"--SEP\r\nContent-Range: bytes 0-3/1024\r\n\r\n"
+    reader = ByteRangesReader(RangeFile(bytearray(len(DATA)), len(DATA)), "SEP")
+    with pytest.raises(ValueError, match="longer"):
+        reader.feed(part + b"12345\r\n--SEP--")
+    reader = ByteRangesReader(RangeFile(bytearray(len(DATA)), len(DATA)), "SEP")
+    with pytest.raises(ValueError, match="shorter"):
+        reader.feed(part + b"123\r\n--SEP--")
+    reader = ByteRangesReader(RangeFile(bytearray(10), 10), "SEP")
+    with pytest.raises(ValueError, match="size"):
+        reader.feed(part)
+    with pytest.raises(ValueError):
+        ByteRangesReader.from_content_type(
+            ContentType(type="multipart/byteranges"), RangeFile(bytearray(1), 1)
+        )
+
+
+def test_range_file_intervals():
+    file = RangeFile(bytearray(100), 100, filled=[Range(start=50, stop=60)])
+    rnd = random.Random(1)
+    written = set(range(50, 60))
+    for _ in range(200):
+        start = rnd.randrange(100)
+        stop = min(100, start + rnd.randint(0, 5))
+        file.write(start, bytes(stop - start))
+        written.update(range(start, stop))
+        covered = {i for r in file.filled for i in range(r.start, r.stop)}
+        assert covered == written
+        gaps = {i for r in file.missing() for i in range(r.start, r.stop)}
+        assert gaps == set(range(100)) - written
+        # disjoint and not touching
+        assert all(a.stop < b.start for a, b in zip(file.filled, file.filled[1:]))
+    with pytest.raises(ValueError):
+        file.write(99, b"ab")
+    with pytest.raises(ValueError):
+        RangeFile(bytearray(10), 11)
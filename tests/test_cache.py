@@ -0,0 +1,75 @@
+from pydantic import ValidationError
+import pytest
+from fast_header import CacheControl, ContentDisposition, ContentType, ETag
+from fast_header.cache import LRUCache
+
+
+def test_lru_eviction():
+    cache: LRUCache[str, str] = LRUCache(2)
+    assert cache.get_or_compute("a", str.upper, "a") == "A"
+    assert cache.get_or_compute("b", str.upper, "b") == "B"
+    assert cache.get_or_compute("a", str.upper, "x") == "A"
+    assert cache.get_or_compute("c", str.upper, "c") == "C"
+    assert "a" in cache
+    assert "b" not in cache
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions) == (1, 3, 1)
+    assert (info.maxsize, info.currsize) == (2, 2)
+
+
+def test_lru_clear():
+    cache: LRUCache[str, str] = LRUCache(2)
+    cache.get_or_compute("a", str.upper, "a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info().misses == 0
+
+
+def test_lru_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_parse_cache_disabled_by_default():
+    assert ContentType.get_parse_cache() is None
+    assert ContentType.parse("text/x-a") is not ContentType.parse("text/x-a")
+
+
+def test_parse_cache():
+    cache = ContentType.enable_parse_cache(maxsize=2)
+    try:
+        ct = ContentType.parse("application/json; charset=utf-8")
+        assert ContentType.parse("application/json; charset=utf-8") is ct
+        assert ContentType.parse_bytes(b"text/html") is ContentType.parse_bytes(
+            memoryview(b"text/html")
+        )
+        ContentType.parse("text/plain")
+        assert cache.info().hits == 2
+        assert cache.info().misses == 3
+        assert cache.info().evictions == 1
+        assert ContentType.get_parse_cache() is cache
+        # each class has its own cache
+        assert CacheControl.get_parse_cache() is None
+    finally:
+        ContentType.disable_parse_cache()
+    assert ContentType.get_parse_cache() is None
+
+
+def test_parse_cache_errors_not_cached():
+    cache = ContentDisposition.enable_parse_cache()
+    try:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                ContentDisposition.parse('"attachment"')
+        assert len(cache) == 0
+    finally:
+        ContentDisposition.disable_parse_cache()
+
+
+def test_frozen():
+    cc = CacheControl.parse("no-cache")
+    with pytest.raises(ValidationError):
+        cc.no_cache = False
+    with pytest.raises(ValidationError):
+        ETag.parse('"a"').value = "b"
+    assert hash(cc) == hash(CacheControl(no_cache=True))
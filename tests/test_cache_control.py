@@ -1,4 +1,16 @@
-from fast_header.cache_control import CacheControl
+import pickle
+import random
+import sys
+
+import pytest
+
+from fast_header.cache_control import (
+    HEADER_REGEXP,
+    CacheControl,
+    CacheControlPolicy,
+    CompactCacheControl,
+    combine,
+)
 
 
 def test_empty_header():
@@ -118,3 +130,197 @@ def test_zero_duration_values():
         str(cc)
         == "max-age=0, max-stale=0, min-fresh=0, s-maxage=0, public, stale-while-revalidate=0, stale-if-error=0"
     )
+
+
+def test_parse_bytes():
+    cc = CacheControl.parse_bytes(b"public, max-age=31536000, immutable")
+    assert cc == CacheControl.parse("public, max-age=31536000, immutable")
+    assert cc.public
+    assert cc.max_age == 31_536_000
+
+
+def test_parse_bytes_buffers():
+    assert CacheControl.parse_bytes(memoryview(b"no-cache")).no_cache
+    assert CacheControl.parse_bytes(bytearray(b"max-stale=24")).max_stale == 24
+    assert str(CacheControl.parse_bytes(b"")) == ""
+    assert str(CacheControl.parse_bytes(None)) == ""
+
+
+def test_parse_matches_validation():
+    for text in [
+        "public, max-age=31536000, immutable",
+        "max-stale, min-fresh=5, no-cache=yes, private=off",
+        "max-age=abc, s-maxage=-1, max-stale=true",
+    ]:
+        values = {
+            CacheControl.__alias_mapping__.get(
+                m.group(1), m.group(1)
+            ): CacheControl.parse_value(m.group(0))
+            for m in HEADER_REGEXP.finditer(text)
+        }
+        assert CacheControl.parse(text) == CacheControl.model_validate(values)
+
+
+def test_quoted_values():
+    cc = CacheControl.parse('max-age="60", s-maxage="120"')
+    assert cc.max_age == 60
+    assert cc.s_maxage == 120
+
+
+def test_case_insensitive_directives():
+    cc = CacheControl.parse("Max-Age=60, No-Cache")
+    assert cc.max_age == 60
+    assert cc.no_cache
+    assert CacheControl.parse_bytes(b"MAX-AGE=60").max_age == 60
+
+
+def test_round_trip():
+    text = "max-age=60, s-maxage=120, public, stale-while-revalidate=30, stale-if-error=86400"
+    assert str(CacheControl.parse(text)) == text
+    assert str(CacheControl.parse_bytes(text.encode())) == text
+
+
+def test_compact_matches_model():
+    names = ["max-age", "s-maxage", "max-stale", "min-fresh", "no-cache", "public"]
+    values = ["=1", "=0", "=abc", '="7"', "", "=yes", "=off"]
+    rnd = random.Random(0)
+    for _ in range(500):
+        text = ", ".join(
+            rnd.choice(names) + rnd.choice(values) for _ in range(rnd.randint(0, 4))
+        )
+        cc = CacheControl.parse(text)
+        compact = CompactCacheControl.parse(text)
+        assert str(compact) == str(cc), text
+        assert compact == CompactCacheControl.parse_bytes(text.encode())
+        assert compact == CompactCacheControl.from_model(cc)
+        assert str(compact.to_model()) == str(cc)
+
+
+def test_compact_fields():
+    compact = CompactCacheControl.parse("max-age=60, max-stale, no-store, min-fresh=-5")
+    assert compact.max_age == 60
+    assert compact.max_stale is True
+    assert compact.no_store is True
+    assert compact.public is False
+    assert compact.s_maxage is None
+    assert compact.min_fresh == 0
+    assert CompactCacheControl.parse("max-stale=7").max_stale == 7
+    with pytest.raises(AttributeError):
+        compact.unknown
+    with pytest.raises(AttributeError):
+        compact.flags = 0
+    assert repr(compact) == (
+        "CompactCacheControl.parse('max-age=60, max-stale, min-fresh=0, no-store')"
+    )
+    assert pickle.loads(pickle.dumps(compact)) == compact
+    assert sys.getsizeof(compact) + sys.getsizeof(compact._ints) < 128
+
+
+def test_compact_operators():
+    a = CompactCacheControl.parse("public, max-age=60")
+    b = CompactCacheControl.parse("no-store, max-age=30, s-maxage=10")
+    assert str(a | b) == "max-age=30, s-maxage=10, no-store, public"
+    assert str(a & b) == "max-age=60"
+    assert a & b <= a <= a | b
+    assert a < a | b
+    assert not a <= b and not b <= a
+    assert a | b >= b
+    assert {a, CompactCacheControl.parse("max-age=60, public")} == {a}
+    assert a != CacheControl.parse("public, max-age=60")
+
+
+def test_compact_parse_cache():
+    CompactCacheControl.enable_parse_cache()
+    try:
+        assert CompactCacheControl.parse("max-age=1") is CompactCacheControl.parse(
+            "max-age=1"
+        )
+    finally:
+        CompactCacheControl.disable_parse_cache()
+    assert CompactCacheControl.parse("max-age=1") is not CompactCacheControl.parse(
+        "max-age=1"
+    )
+
+
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        ("max-age=60", "max-age=30", "max-age=30"),
+        ("max-age=60", "", "max-age=60"),
+        ("public, max-age=60", "private", "max-age=60, private"),
+        (
+            "public, s-maxage=600",
+            "s-maxage=60, no-transform",
+            "s-maxage=60, no-transform, public",
+        ),
+        ("immutable, max-age=60", "no-cache", "max-age=60, no-cache"),
+        (
+            "immutable, max-age=60",
+            "must-revalidate",
+            "max-age=60, must-revalidate, immutable",
+        ),
+        ("max-stale", "max-stale=10", "max-stale=10"),
+        ("max-stale=5", "max-stale=10, min-fresh=5", "max-stale=5, min-fresh=5"),
+        ("min-fresh=1", "min-fresh=5", "min-fresh=5"),
+        (
+            "stale-if-error=600",
+            "stale-if-error=60, stale-while-revalidate=5",
+            "stale-while-revalidate=5, stale-if-error=60",
+        ),
+        ("max-age=0, no-store", "public, max-age=60", "max-age=0, no-store, public"),
+    ],
+)
+def test_combine(a, b, expected):
+    a = CacheControl.parse(a)
+    b = CacheControl.parse(b)
+    assert str(combine(a, b)) == expected
+    assert combine(b, a) == combine(a, b)
+    assert a.combine(b) == combine(a, b)
+
+
+def test_combine_memoized():
+    a = CacheControl.parse("public, max-age=7")
+    b = CacheControl.parse("private, max-age=3")
+    assert a.combine(b) is a.combine(b)
+
+
+def test_combine_memo_keeps_bool_and_int_apart():
+    # max-stale (no limit) == max-stale=1 and CacheControl() == max-stale=0
+    # to pydantic, but they combine differently
+    limit = CacheControl.parse("max-stale=100")
+    assert str(CacheControl.parse("max-stale").combine(limit)) == "max-stale=100"
+    assert str(CacheControl.parse("max-stale=1").combine(limit)) == "max-stale=1"
+    assert str(CacheControl().combine(limit)) == "max-stale=100"
+    assert str(CacheControl.parse("max-stale=0").combine(limit)) == "max-stale=0"
+    policy = CacheControlPolicy("max-stale=100")
+    assert str(policy.apply(CacheControl.parse("max-stale"))) == "max-stale=100"
+    assert str(policy.apply(CacheControl.parse("max-stale=1"))) == "max-stale=1"
+
+
+def test_override():
+    cc = CacheControl.parse("public, max-age=60, immutable")
+    assert str(cc.override(immutable=False, max_age=10)) == "max-age=10, public"
+    assert cc.override(public=False, immutable=False, max_age=None) == CacheControl()
+    # interned values are returned as such
+    no_cache = CacheControl.parse("public, no-cache").override(public=False)
+    assert no_cache is CacheControl.parse("no-cache")
+    assert cc.override() == cc
+    with pytest.raises(TypeError):
+        cc.override(max_agee=1)
+
+
+def test_policy():
+    policy = CacheControlPolicy("private, max-age=300", immutable=False)
+    origin = "public, max-age=31536000, immutable, stale-if-error=60"
+    expected = "max-age=300, private, stale-if-error=60"
+    assert str(policy.apply(CacheControl.parse(origin))) == expected
+    assert policy.apply_value(origin) == expected.encode()
+    assert policy.apply_value(memoryview(origin.encode())) == expected.encode()
+    assert policy.apply_value(origin.encode()) is policy.apply_value(origin.encode())
+    assert policy.apply_value(None) == b"max-age=300, private"
+    assert policy.value_cache.hits >= 1
+    assert CacheControlPolicy(no_store=True).apply_value("max-age=5") == (
+        b"max-age=5, no-store"
+    )
+    with pytest.raises(TypeError):
+        CacheControlPolicy(privat=True)
@@ -0,0 +1,93 @@
+import random
+import sys
+
+import pytest
+
+from fast_header import CacheControl
+from fast_header.cache_control import FLAG_BITS, UNSET
+from fast_header.columnar import (
+    INVALID,
+    MISSING,
+    cache_control_columns,
+    content_type_columns,
+)
+
+
+def test_content_type_columns():
+    cols = content_type_columns(
+        [
+            "text/html; charset=UTF-8",
+            b"application/json",
+            None,
+            "bad",
+            memoryview(b"multipart/form-data; boundary=xYzZY"),
+            "text/html; charset=utf-8",
+        ]
+    )
+    assert len(cols) == 6
+    assert cols.types == ["text/html", "application/json", "multipart/form-data"]
+    assert list(cols.type_codes) == [0, 1, MISSING, INVALID, 2, 0]
+    assert cols.charsets == ["utf-8"]
+    assert list(cols.charset_codes) == [0, MISSING, MISSING, MISSING, MISSING, 0]
+    assert cols.boundaries == [None, None, None, None, "xYzZY", None]
+    assert cols.type(0) == "text/html"
+    assert cols.type(2) is None
+    assert cols.charset(5) == "utf-8"
+
+
+def test_cache_control_columns():
+    cols = cache_control_columns(
+        [
+            "public, max-age=60",
+            b"no-store, max-stale",
+            "",
+            "max-stale=5, s-maxage=-3, max-age=99999999999999999999",
+            "public, max-age=60",
+        ]
+    )
+    assert len(cols) == 5
+    assert list(cols.flags) == [
+        FLAG_BITS["public"],
+        FLAG_BITS["no_store"] | FLAG_BITS["max_stale"],
+        0,
+        FLAG_BITS["max_stale"],
+        FLAG_BITS["public"],
+    ]
+    assert list(cols.ints["max_age"]) == [60, UNSET, UNSET, 2**31 - 1, 60]
+    assert list(cols.ints["max_stale"]) == [UNSET, UNSET, UNSET, 5, UNSET]
+    assert list(cols.ints["s_maxage"]) == [UNSET, UNSET, UNSET, 0, UNSET]
+    assert cols.has("public") == [True, False, False, False, True]
+    assert cols.row(1) == CacheControl(no_store=True, max_stale=True)
+
+
+def test_cache_control_rows_match_parse():
+    names = ["max-age", "s-maxage", "max-stale", "no-cache", "private", "x-y"]
+    values = ["=1", "=0", "=abc", '="7"', ""]
+    rnd = random.Random(0)
+    texts = [
+        ", ".join(
+            rnd.choice(names) + rnd.choice(values) for _ in range(rnd.randint(0, 4))
+        )
+        for _ in range(500)
+    ]
+    cols = cache_control_columns(texts, memo_size=10)
+    for i, text in enumerate(texts):
+        # columns hold no None (invalid value) apart from unset
+        assert str(cols.row(i)) == str(CacheControl.parse(text)), text
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    arr = cache_control_columns(["max-age=5, public", None]).to_numpy()
+    assert arr["max_age"].tolist() == [5, UNSET]
+    assert arr["flags"].tolist() == [FLAG_BITS["public"], 0]
+    arr = content_type_columns(["text/plain; charset=utf-8", "bad"]).to_numpy()
+    assert arr["type_code"].tolist() == [0, INVALID]
+    assert arr.dtype.names == ("type_code", "charset_code", "boundary")
+    assert np is not None
+
+
+def test_to_numpy_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="NumPy is required"):
+        cache_control_columns(["max-age=5"]).to_numpy()
@@ -0,0 +1,81 @@
+import pytest
+from fast_header import ETag, IfMatch, IfNoneMatch
+from fast_header.conditional import if_match, if_none_match
+
+
+def test_parse_list():
+    inm = IfNoneMatch.parse('"c", W/"b",  "a" ,')
+    assert not inm.any
+    assert inm.strong == {"a", "c"}
+    assert inm.weak == {"b"}
+    assert inm.etags == (
+        ETag(value="a"),
+        ETag(value="c"),
+        ETag(value="b", weak=True),
+    )
+    assert str(inm) == '"a", "c", W/"b"'
+
+
+def test_parse_any():
+    assert IfMatch.parse("*").any
+    assert IfMatch.parse(" * ").any
+    assert str(IfMatch.parse("*")) == "*"
+
+
+def test_parse_unquoted():
+    inm = IfNoneMatch.parse("abc, W/def")
+    assert inm.strong == {"abc"}
+    assert inm.weak == {"def"}
+
+
+def test_parse_invalid():
+    for text in ['"a" "b"', '"a', 'W/"a" x', '"€"', '*, "a"']:
+        with pytest.raises(ValueError):
+            IfNoneMatch.parse(text)
+
+
+def test_parse_bytes():
+    assert IfNoneMatch.parse_bytes(b'W/"a"') == IfNoneMatch.parse('W/"a"')
+
+
+def test_if_none_match_weak_comparison():
+    inm = IfNoneMatch.parse('W/"a", "b"')
+    assert not inm.evaluate(ETag(value="a"))
+    assert not inm.evaluate(ETag(value="a", weak=True))
+    assert not inm.evaluate(ETag(value="b", weak=True))
+    assert inm.evaluate(ETag(value="c"))
+    assert inm.evaluate(None)
+    assert not IfNoneMatch.parse("*").evaluate(ETag(value="x"))
+    assert IfNoneMatch.parse("*").evaluate(None)
+
+
+def test_if_match_strong_comparison():
+    im = IfMatch.parse('W/"a", "b"')
+    assert not im.evaluate(ETag(value="a"))
+    assert im.evaluate(ETag(value="b"))
+    assert not im.evaluate(ETag(value="b", weak=True))
+    assert not im.evaluate(None)
+    assert IfMatch.parse("*").evaluate(ETag(value="x", weak=True))
+    assert not IfMatch.parse("*").evaluate(None)
+
+
+def test_functions():
+    assert if_match(None, None)
+    assert if_none_match(None, ETag(value="a"))
+    assert not if_none_match('"x", "a"', ETag(value="a"))
+    assert if_match('"a"', ETag(value="a"))
+
+
+def test_long_list():
+    inm = IfNoneMatch.parse(", ".join(f'"{i}"' for i in range(10_000)))
+    assert not inm.evaluate(ETag(value="9999"))
+    assert inm.evaluate(ETag(value="10000"))
+
+
+def test_invalid_long_list_is_linear():
+    # an ambiguous grammar backtracked exponentially on the failing tail
+    for tag in ["W/x", "x", '"x"', 'W/"x"']:
+        with pytest.raises(ValueError):
+            IfNoneMatch.parse(", ".join([tag] * 5_000) + ', "')
+        with pytest.raises(ValueError):
+            IfMatch.parse_bytes((", ".join([tag] * 5_000) + ', "').encode())
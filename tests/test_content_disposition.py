@@ -837,3 +837,79 @@ def test_parse_75():
     )
     assert cd.type == "attachment"
     assert cd.parameters == {"filename": "=?ISO-8859-1?Q?foo-=E4.html?="}
+
+
+def test_parse_bytes():
+    cd = ContentDisposition.parse_bytes(
+        b"attachment; filename=\"EURO rates.pdf\"; filename*=UTF-8''%E2%82%AC%20rates.pdf"
+    )
+    assert cd.type == "attachment"
+    assert cd.filename == "€ rates.pdf"
+
+
+def test_parse_bytes_buffers():
+    for data in [
+        bytearray(b'INLINE; filename="the \\"plans\\".pdf"'),
+        memoryview(b'INLINE; filename="the \\"plans\\".pdf"'),
+    ]:
+        cd = ContentDisposition.parse_bytes(data)
+        assert cd.type == "inline"
+        assert cd.filename == 'the "plans".pdf'
+
+
+def test_parse_bytes_same_as_parse():
+    for text in [
+        "form-data; name=upload; filename=plans.pdf",
+        'attachment; filename="£ rates.pdf"',
+        "attachment; filename*=ISO-8859-1''%A3%20rates.pdf",
+        'attachment; foobar=x; filename="foo.html"',
+    ]:
+        assert ContentDisposition.parse_bytes(
+            text.encode("latin-1")
+        ) == ContentDisposition.parse(text)
+
+
+def test_parse_bytes_invalid():
+    for data in [
+        b"attachment; filename*=\"UTF-8''%E2%82%AC%20rates.pdf\"",
+        b'attachment; filename="foo.html"; filename="bar.html"',
+        b"attachment; filename==?ISO-8859-1?Q?foo-=E4.html?=",
+        b'"attachment"',
+    ]:
+        with pytest.raises(ValueError):
+            ContentDisposition.parse_bytes(data)
+
+
+def test_parse_matches_validation():
+    cd = ContentDisposition.parse('attachment; filename="/etc/passwd"; foo=bar')
+    assert cd == ContentDisposition(filename="passwd", foo="bar")
+    assert cd.filename == "passwd"
+    cd = ContentDisposition.parse('inline; fallback="plans.pdf"')
+    assert cd.fallback == "plans.pdf"
+    with pytest.raises(ValueError):
+        ContentDisposition.parse("attachment; fallback*=UTF-8''%E2%82%AC.pdf")
+
+
+@pytest.mark.parametrize("text", ["foo", "foo; filename=a.txt", "attachments"])
+def test_parse_invalid_type(text):
+    with pytest.raises(ValueError):
+        ContentDisposition.parse(text)
+    with pytest.raises(ValueError):
+        ContentDisposition.parse_bytes(text.encode())
+    assert ContentDisposition.parse("INLINE").type == "inline"
+
+
+def test_render_cached():
+    cd = ContentDisposition(filename="€ rates.txt")
+    assert cd.to_bytes() == (
+        b"attachment; filename=\"? rates.txt\"; filename*=UTF-8''%E2%82%AC%20rates.txt"
+    )
+    assert cd._parameters_text is cd._parameters_text
+    assert str(cd) == cd.to_bytes().decode("latin-1")
+    # the cache is not part of the value
+    assert cd == ContentDisposition(filename="€ rates.txt")
+    assert cd.model_dump() == {
+        "type": "attachment",
+        "filename": "€ rates.txt",
+        "fallback": True,
+    }
@@ -1,4 +1,14 @@
+import pytest
 from fast_header import ContentRange, Range
+from fast_header import ETag
+from fast_header.content_range import (
+    MAX_RANGES,
+    RangePlan,
+    TooManyRanges,
+    coalesce_ranges,
+    if_range_holds,
+    plan_range,
+)
 
 
 def test_base():
@@ -49,3 +59,153 @@ def test_parse_empty_range():
     assert cr.unit == "bytes"
     assert cr.range is None
     assert cr.size == 30
+
+
+def test_parse_bytes():
+    cr = ContentRange.parse_bytes(b"bytes 0-20/30")
+    assert cr == ContentRange.parse("bytes 0-20/30")
+    cr = ContentRange.parse_bytes(memoryview(b"bytes */30"))
+    assert cr.range is None
+    assert cr.size == 30
+
+
+def test_range_parse_bytes():
+    assert Range.parse_bytes(b"bytes=0-9, 20-", 30) == Range.parse("bytes=0-9, 20-", 30)
+    assert Range.parse_bytes(memoryview(b"bytes=-5"), 30) == [Range(start=25, stop=30)]
+    assert Range.parse_bytes(b"items=0-1", 30) is None
+
+
+def test_parse_matches_validation():
+    cr = ContentRange.parse("bytes 0-20/30")
+    assert cr == ContentRange(range=Range(start=0, stop=20), size=30)
+    assert Range.parse("bytes=0-9", 30) == [Range(start=0, stop=10)]
+
+
+def test_range_coalesce():
+    ranges = Range.parse("bytes=50-59, 0-9, 5-19, 20-29, 100-", 120, coalesce=True)
+    assert ranges == [
+        Range(start=0, stop=30),
+        Range(start=50, stop=60),
+        Range(start=100, stop=120),
+    ]
+
+
+def test_range_coalesce_overlapping_total():
+    # without coalescing, overlapping specs larger than the body are refused
+    assert Range.parse("bytes=0-99, 0-99", 100) == []
+    assert Range.parse("bytes=0-99, 0-99", 100, coalesce=True) == [
+        Range(start=0, stop=100)
+    ]
+
+
+def test_coalesce_ranges():
+    assert coalesce_ranges([]) == []
+    assert coalesce_ranges([Range(start=10, stop=20), Range(start=0, stop=30)]) == [
+        Range(start=0, stop=30)
+    ]
+
+
+def test_range_max_ranges():
+    header = "bytes=" + ", ".join(f"{i}-{i}" for i in range(10))
+    assert len(Range.parse(header, 100, max_ranges=10) or []) == 10
+    with pytest.raises(TooManyRanges):
+        Range.parse(header, 100, max_ranges=9)
+    with pytest.raises(TooManyRanges):
+        Range.parse_bytes(header.encode(), 100, max_ranges=9)
+    assert Range.parse_bytes(header.encode(), 100, max_ranges=10, coalesce=True) == [
+        Range(start=0, stop=10)
+    ]
+
+
+def test_range_max_ranges_adversarial():
+    header = "bytes=" + "0-0," * 1_000_000
+    with pytest.raises(TooManyRanges):
+        Range.parse(header, 100, max_ranges=MAX_RANGES)
+
+
+DATE = "Sun, 06 Nov 1994 08:49:37 GMT"
+MTIME = 784111777
+
+
+@pytest.mark.parametrize(
+    "if_range,holds",
+    [
+        (None, True),
+        ('"abc"', True),
+        (b' "abc" ', True),
+        ('W/"abc"', False),
+        ('"abd"', False),
+        ('"abc", "abd"', False),
+        ("*", False),
+        (DATE, True),
+        ("Sun, 06 Nov 1994 08:49:38 GMT", False),
+        ("garbage", False),
+    ],
+)
+def test_if_range_holds(if_range, holds):
+    assert if_range_holds(if_range, ETag(value="abc"), MTIME + 0.5) is holds
+
+
+def test_if_range_weak_or_missing_validator():
+    assert not if_range_holds('"abc"', ETag(value="abc", weak=True))
+    assert not if_range_holds('"abc"', None)
+    assert if_range_holds('"abc"', '"abc"')
+    assert not if_range_holds(DATE, None)
+
+
+def test_plan_full():
+    full = RangePlan(200, 100, parts=((b"", 0, 100),))
+    assert plan_range(None, 100) == full
+    assert plan_range("items=0-9", 100) == full
+    assert plan_range("bytes=0-9", 100, if_range='"old"', etag="new") == full
+    assert plan_range("bytes=" + "0-0," * 5 + "0-0", 100, max_ranges=5) == full
+    assert full.headers() == [(b"content-length", b"100")]
+
+
+@pytest.mark.parametrize(
+    "http_range",
+    ["bytes=abc-", "bytes=0-x", "bytes=-y", b"bytes=x-5", b"bytes=0-1, z-9"],
+)
+def test_plan_malformed(http_range):
+    assert plan_range(http_range, 100) == RangePlan(200, 100, parts=((b"", 0, 100),))
+
+
+def test_plan_single():
+    plan = plan_range(b"bytes=10-19, 15-24", 100, if_range='"v"', etag=ETag(value="v"))
+    assert plan.status == 206
+    assert plan.content_length == 15
+    assert plan.parts == ((b"", 10, 25),)
+    assert plan.headers() == [
+        (b"content-length", b"15"),
+        (b"content-range", b"bytes 10-24/100"),
+    ]
+    assert plan_range("bytes=-10", 100).content_range == b"bytes 90-99/100"
+
+
+def test_plan_unsatisfiable():
+    plan = plan_range("bytes=100-", 100)
+    assert plan.status == 416
+    assert plan.parts == ()
+    assert plan.headers() == [
+        (b"content-length", b"0"),
+        (b"content-range", b"bytes */100"),
+    ]
+
+
+def test_plan_multipart():
+    data = bytes(range(100))
+    plan = plan_range(
+        "bytes=50-59, 0-9", len(data), content_type="text/plain", boundary="SEP"
+    )
+    assert plan.status == 206
+    assert plan.boundary == "SEP"
+    assert plan.content_type == b"multipart/byteranges; boundary=SEP"
+    body = b"".join(head + data[start:stop] for head, start, stop in plan.parts)
+    body += plan.tail
+    assert len(body) == plan.content_length
+    assert body.startswith(
+        b"--SEP\r\nContent-Type: text/plain\r\nContent-Range: bytes 0-9/100\r\n\r\n"
+        + data[:10]
+    )
+    assert [(start, stop) for _, start, stop in plan.parts] == [(0, 10), (50, 60)]
+    assert (b"content-type", plan.content_type) in plan.headers()
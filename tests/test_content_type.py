@@ -116,3 +116,48 @@ def test_empty():
 def test_multiple_params():
     ct = ContentType(type="text/html", charset="utf-8", foo="bar", bar="baz")
     assert str(ct) == "text/html; bar=baz; charset=utf-8; foo=bar"
+
+
+def test_parse_bytes():
+    ct = ContentType.parse_bytes(b'text/html; charset="UT\\F-8"; foo=bar')
+    assert ct.type == "text/html"
+    assert ct.parameters == {"charset": "UTF-8", "foo": "bar"}
+
+
+def test_parse_bytes_buffers():
+    for data in [
+        bytearray(b" TEXT/HTML ; Charset=utf-8"),
+        memoryview(b" TEXT/HTML ; Charset=utf-8"),
+    ]:
+        ct = ContentType.parse_bytes(data)
+        assert ct.type == "text/html"
+        assert ct.parameters == {"charset": "utf-8"}
+
+
+def test_parse_bytes_latin1():
+    ct = ContentType.parse_bytes('text/plain; foo="£"'.encode("latin-1"))
+    assert ct.parameters == {"foo": "£"}
+
+
+def test_parse_bytes_invalid():
+    for t in invalidTypes:
+        with pytest.raises(ValueError):
+            ContentType.parse_bytes(t.encode("utf-8"))
+    with pytest.raises(ValueError):
+        ContentType.parse_bytes(b'text/plain; foo="bar')
+    with pytest.raises(ValueError):
+        ContentType.parse_bytes(b"text/plain; profile=http://localhost")
+
+
+def test_parse_matches_constructor():
+    ct = ContentType.parse("text/html; charset=utf-8; foo=bar")
+    assert ct == ContentType(type="text/html", charset="utf-8", foo="bar")
+    assert ct.model_dump() == {"type": "text/html", "charset": "utf-8", "foo": "bar"}
+    assert ct.model_fields_set == {"type"}
+
+
+def test_parse_type_parameter():
+    ct = ContentType.parse('multipart/related; type="text/xml"')
+    assert ct.type == "multipart/related"
+    assert ct.parameters == {"type": "text/xml"}
+    assert str(ct) == 'multipart/related; type="text/xml"'
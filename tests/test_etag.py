@@ -1,3 +1,10 @@
+import hashlib
+import os
+
+import pytest
+
+from fast_header import etag
+from fast_header.cache import LRUCache
 from fast_header.etag import ETag
 
 
@@ -7,3 +14,82 @@ def test_strong():
 
 def test_week():
     assert str(ETag(value="a", weak=True)) == f'W/"a"'
+
+
+def test_to_header():
+    assert ETag(value="abc").to_header() == (b"etag", b'"abc"')
+    assert ETag(value="abc", weak=True).to_bytes() == b'W/"abc"'
+    assert ETag.parse_bytes(ETag(value="abc").to_bytes()) == ETag(value="abc")
+
+
+def test_parse_bytes():
+    assert ETag.parse_bytes(b'"a"') == ETag(value="a")
+    assert ETag.parse_bytes(memoryview(b'W/"a"')) == ETag(value="a", weak=True)
+
+
+def test_parse_matches_validation():
+    assert ETag.parse('W/"a"') == ETag(value="a", weak=True)
+    assert ETag.parse('"a"').model_dump() == {"weak": False, "value": "a"}
+
+
+def test_from_stat(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    st = os.stat(path)
+    etag = ETag.from_stat(st)
+    assert etag.weak
+    assert etag.value == f"{st.st_ino:x}-5-{st.st_mtime_ns:x}"
+    assert ETag.from_file(path, weak=True) == etag
+
+
+def test_from_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(etag, "DIGEST_CACHE", LRUCache(8))
+    path = tmp_path / "a.bin"
+    data = os.urandom(3000)
+    path.write_bytes(data)
+    tag = ETag.from_file(path, chunk_size=1024)
+    assert not tag.weak
+    assert tag.value == hashlib.blake2b(data, digest_size=16).hexdigest()
+    assert tag.to_bytes() == b'"' + tag.value.encode() + b'"'
+    with open(path, "rb") as f:
+        f.read(10)
+        assert ETag.from_file(f.fileno()) == tag
+    assert etag.DIGEST_CACHE.info()[:2] == (1, 1)
+
+    # a changed file gets a new key and is hashed again
+    path.write_bytes(data + b"!")
+    assert ETag.from_file(path) != tag
+    assert etag.DIGEST_CACHE.misses == 2
+
+
+@pytest.mark.parametrize("pread", [True, False])
+def test_from_file_keeps_offset(tmp_path, monkeypatch, pread):
+    monkeypatch.setattr(etag, "DIGEST_CACHE", LRUCache(8))
+    if not pread:
+        monkeypatch.delattr(os, "pread", raising=False)
+    path = tmp_path / "a.bin"
+    data = os.urandom(3000)
+    path.write_bytes(data)
+    with open(path, "rb", buffering=0) as f:
+        f.seek(100)
+        tag = ETag.from_file(f.fileno(), chunk_size=1024)
+        assert f.tell() == 100
+        assert f.read(10) == data[100:110]
+    assert tag.value == hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def test_from_file_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(etag, "DIGEST_CACHE", LRUCache(8))
+    monkeypatch.setattr(etag, "MMAP_THRESHOLD", 1)
+    path = tmp_path / "a.bin"
+    data = os.urandom(5000)
+    path.write_bytes(data)
+    expected = hashlib.blake2b(data, digest_size=16).hexdigest()
+    assert ETag.from_file(path, chunk_size=1000).value == expected
+
+
+def test_from_file_empty(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    expected = hashlib.blake2b(b"", digest_size=16).hexdigest()
+    assert ETag.from_file(path).value == expected
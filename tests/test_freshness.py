@@ -0,0 +1,179 @@
+import random
+import sys
+
+import pytest
+
+from fast_header import CacheControl
+from fast_header.cache_control import UNSET
+from fast_header.columnar import cache_control_columns
+from fast_header.freshness import (
+    Freshness,
+    current_age,
+    freshness,
+    freshness_columns,
+    freshness_lifetime,
+    freshness_numpy,
+    parse_http_date,
+)
+
+DATE = "Sun, 06 Nov 1994 08:49:37 GMT"
+T = 784111777
+
+
+def test_parse_http_date():
+    assert parse_http_date(DATE) == T
+    assert parse_http_date(b"Sunday, 06-Nov-94 08:49:37 GMT") == T
+    assert parse_http_date("Sun Nov  6 08:49:37 1994") == T
+    assert parse_http_date("0") is None
+    assert parse_http_date("") is None
+
+
+@pytest.mark.parametrize(
+    "text,shared,kwargs,lifetime",
+    [
+        ("max-age=60", False, {}, 60),
+        ("max-age=60, s-maxage=600", False, {}, 60),
+        ("max-age=60, s-maxage=600", True, {}, 600),
+        ("max-age=-5", False, {}, 0),
+        ("public", False, dict(date=T, expires=T + 30), 30),
+        ("max-age=10", False, dict(date=T, expires=T + 30), 10),
+        ("", False, dict(date=DATE, expires="Sun, 06 Nov 1994 08:50:37 GMT"), 60),
+        ("", False, dict(date=T, expires="0"), 0),
+        ("", False, dict(date=T, expires=T - 30), 0),
+        ("", False, dict(date=T, last_modified=T - 1000), 100),
+        ("", False, {}, 0),
+        ("no-cache, max-age=60", False, {}, 0),
+        ("no-store, max-age=60", False, {}, 0),
+        ("private, max-age=60", False, {}, 60),
+        ("private, max-age=60", True, {}, 0),
+    ],
+)
+def test_freshness_lifetime(text, shared, kwargs, lifetime):
+    cc = CacheControl.parse(text)
+    assert freshness_lifetime(cc, shared=shared, **kwargs) == lifetime
+
+
+def test_current_age():
+    # received 2s after sending, 5s after Date, with Age: 10; now 100s later
+    assert current_age(T + 105, T + 5, request_time=T + 3, date=T, age=10) == 112
+    assert current_age(T + 105, T + 5, date=T) == 105
+    assert current_age(T + 105, T + 5, date=T, age="20") == 120
+    assert current_age(T + 105, T + 5, date=T + 50, age="bad") == 100
+
+
+def test_freshness():
+    cc = CacheControl.parse("max-age=60, stale-while-revalidate=30, stale-if-error=600")
+    assert freshness(cc, T + 10, T, date=T) == Freshness(60, 10, 30, 600)
+    f = freshness(cc, T + 70, T, date=T)
+    assert f.ttl == -10
+    assert not f.fresh
+    assert f.usable_while_revalidating
+    assert f.usable_on_error
+    f = freshness(cc, T + 100, T)
+    assert not f.usable_while_revalidating
+    assert f.usable_on_error
+    fresh = freshness(cc, T + 10, T)
+    assert fresh.fresh
+    assert not fresh.usable_while_revalidating
+
+
+@pytest.mark.parametrize(
+    "text,shared",
+    [
+        ("max-age=60, must-revalidate, stale-if-error=60", False),
+        ("max-age=60, no-cache, stale-if-error=60", False),
+        ("max-age=60, proxy-revalidate, stale-if-error=60", True),
+        ("s-maxage=60, stale-if-error=60", True),
+    ],
+)
+def test_no_stale(text, shared):
+    f = freshness(CacheControl.parse(text), T + 90, T, shared=shared)
+    assert (f.stale_while_revalidate, f.stale_if_error) == (0, 0)
+    assert not f.usable_on_error
+
+
+def test_shared_windows():
+    cc = CacheControl.parse("max-age=60, proxy-revalidate, stale-if-error=60")
+    assert freshness(cc, T, T).stale_if_error == 60
+    assert freshness(cc, T, T, shared=True).stale_if_error == 0
+
+
+def _entries(n):
+    rnd = random.Random(0)
+    directives = [
+        "max-age=60",
+        "max-age=0",
+        "s-maxage=300",
+        "no-cache",
+        "no-store",
+        "private",
+        "public",
+        "must-revalidate",
+        "proxy-revalidate",
+        "stale-while-revalidate=30",
+        "stale-if-error=3600",
+    ]
+    texts = [", ".join(rnd.sample(directives, rnd.randint(0, 3))) for _ in range(n)]
+
+    def maybe(value):
+        return value if rnd.random() < 0.5 else UNSET
+
+    received = [T + rnd.randint(0, 1000) for _ in range(n)]
+    return texts, dict(
+        response_time=received,
+        request_time=[maybe(t - rnd.randint(0, 3)) for t in received],
+        date=[maybe(t - rnd.randint(-5, 20)) for t in received],
+        expires=[maybe(t + rnd.randint(-100, 100)) for t in received],
+        age=[maybe(rnd.randint(0, 50)) for _ in received],
+        last_modified=[maybe(t - rnd.randint(0, 10000)) for t in received],
+    )
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_freshness_columns(shared):
+    texts, entries = _entries(500)
+    now = T + 1200
+    cols = freshness_columns(
+        cache_control_columns(texts), now, shared=shared, **entries
+    )
+    assert len(cols) == len(texts)
+    for i, text in enumerate(texts):
+        kwargs = {
+            k: None if v[i] == UNSET else v[i]
+            for k, v in entries.items()
+            if k != "response_time"
+        }
+        expected = freshness(
+            CacheControl.parse(text),
+            now,
+            entries["response_time"][i],
+            shared=shared,
+            **kwargs,
+        )
+        assert cols[i] == expected, text
+    assert cols.fresh() == [cols[i].fresh for i in range(len(cols))]
+
+
+def test_freshness_columns_defaults():
+    cols = freshness_columns(cache_control_columns(["max-age=10", None]), T + 5, [T, T])
+    assert list(cols) == [Freshness(10, 5), Freshness(0, 5)]
+    with pytest.raises(ValueError):
+        freshness_columns(cache_control_columns(["max-age=10"]), T, [T, T])
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_freshness_numpy(shared):
+    np = pytest.importorskip("numpy")
+    texts, entries = _entries(500)
+    cc = cache_control_columns(texts)
+    now = T + 1200
+    expected = freshness_columns(cc, now, shared=shared, **entries).to_numpy()
+    arrays = {k: np.array(v) for k, v in entries.items()}
+    got = freshness_numpy(cc.to_numpy(), now, shared=shared, **arrays)
+    assert got.tolist() == expected.tolist()
+
+
+def test_freshness_numpy_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="NumPy is required"):
+        freshness_numpy(None, T, [T])
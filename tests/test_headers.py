@@ -0,0 +1,61 @@
+import pytest
+from fast_header import CacheControl, ContentType, ETag
+from fast_header.headers import Headers
+
+RAW = [
+    (b"host", b"example.com"),
+    (b"content-type", b"application/json; charset=utf-8"),
+    (b"cache-control", b"no-cache"),
+    (b"cache-control", b"max-age=0"),
+    (b"etag", b'W/"a"'),
+    (b"content-disposition", b'"broken"'),
+]
+
+
+def test_lazy_parse():
+    headers = Headers(RAW)
+    assert headers._parsed is None
+    ct = headers.content_type
+    assert ct == ContentType(type="application/json", charset="utf-8")
+    assert headers._parsed is not None
+    assert list(headers._parsed) == [b"content-type"]
+    # memoized
+    assert headers["Content-Type"] is ct
+
+
+def test_list_header():
+    headers = Headers(RAW)
+    assert headers.cache_control == CacheControl(no_cache=True, max_age=0)
+    assert headers.get_raw("Cache-Control") == b"no-cache, max-age=0"
+
+
+def test_missing_and_invalid():
+    headers = Headers(RAW)
+    assert headers.content_range is None
+    assert headers.content_disposition is None
+    assert headers.get("content-disposition") is None
+    with pytest.raises(KeyError):
+        headers["host"]
+    assert headers.get_raw("host") == b"example.com"
+    assert headers.get_raw(b"missing") is None
+
+
+def test_mapping():
+    headers = Headers(RAW)
+    assert list(headers) == ["Content-Type", "Cache-Control", "ETag"]
+    assert len(headers) == 3
+    assert "etag" in headers
+    assert headers.etag == ETag(value="a", weak=True)
+
+
+def test_accept():
+    headers = Headers([(b"accept", b"text/html"), (b"accept", b"*/*;q=0.1")])
+    assert headers.accept is not None
+    assert [r.type for r in headers.accept.ranges] == ["text/html", "*/*"]
+
+
+def test_conditional():
+    headers = Headers([(b"if-none-match", b'"a"'), (b"if-none-match", b'W/"b"')])
+    assert headers.if_none_match is not None
+    assert not headers.if_none_match.evaluate(ETag(value="b"))
+    assert headers.if_match is None
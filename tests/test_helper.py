@@ -0,0 +1,154 @@
+import itertools
+
+import pytest
+
+from fast_header import (
+    Accept,
+    CacheControl,
+    ContentDisposition,
+    ContentRange,
+    ContentType,
+    ETag,
+    IfNoneMatch,
+)
+from fast_header.helper import construct
+
+
+def test_construct():
+    ct = construct(ContentType, {"type": "text/html"}, {"charset": "utf-8"})
+    assert ct == ContentType(type="text/html", charset="utf-8")
+    etag = construct(ETag, {"value": "a"})
+    assert etag == ETag(value="a")
+    assert etag.weak is False
+
+
+def test_parse_many():
+    values = ["text/html", b"application/json", "text/html", "bad", "text/html"]
+    errors = []
+    ret = list(ContentType.parse_many(values, errors))
+    assert [ct.type for ct in ret] == [
+        "text/html",
+        "application/json",
+        "text/html",
+        "text/html",
+    ]
+    # identical inputs share one result
+    assert ret[0] is ret[2] is ret[3]
+    assert len(errors) == 1
+    index, value, e = errors[0]
+    assert (index, value) == (3, "bad")
+    assert isinstance(e, ValueError)
+
+
+def test_parse_many_streams():
+    it = CacheControl.parse_many(itertools.cycle(["no-cache", "max-age=0"]))
+    assert next(it).no_cache
+    assert next(it).max_age == 0
+    assert next(it).no_cache
+
+
+def test_parse_many_memo_size():
+    ret = list(ETag.parse_many(['"a"', '"b"', '"a"', '"b"'], memo_size=1))
+    assert ret[0] is ret[2]
+    assert ret[1] is not ret[3]
+    assert ret[1] == ret[3]
+
+
+def test_parse_many_buffers():
+    ret = list(ETag.parse_many([bytearray(b'W/"a"'), memoryview(b'W/"a"')]))
+    assert ret[0] is ret[1]
+    assert ret[0] == ETag(value="a", weak=True)
+
+
+def test_interned():
+    ct = ContentType.parse("application/json")
+    assert ct is ContentType.parse_bytes(b"Application/JSON")
+    assert ct is ContentType(type="application/json")
+    assert ContentType.parse("text/html; charset=utf-8") is ContentType(
+        type="text/html", charset="utf-8"
+    )
+    assert ContentType.parse("text/x-a") is not ContentType.parse("text/x-a")
+
+    cc = CacheControl(no_cache=True)
+    assert cc is CacheControl.parse("no-cache")
+    assert cc is CacheControl.parse_bytes(b"No-Cache")
+    # other spellings of a value are matched after validation
+    assert cc is CacheControl(no_cache="true")
+    assert CacheControl.parse("max-age=0") is CacheControl(max_age=0)
+    assert CacheControl.parse("max-age=1") is not CacheControl(max_age=1)
+    # 0 equals the default False, but is a different value
+    assert CacheControl.parse("no-cache, max-stale=0").max_stale == 0
+    assert CacheControl.parse("no-cache, max-stale=0") is not cc
+
+
+def test_intern():
+    class Tagged(ETag):
+        pass
+
+    a = Tagged(value="a")
+    assert Tagged.intern(a) is a
+    assert Tagged.intern(Tagged(value="a")) is a
+    assert Tagged.parse('"a"') is a
+    assert Tagged(value="a") is a
+    assert Tagged(value="a", weak=True) is not a
+    # registries are per class
+    assert ETag(value="a") is not a
+    with pytest.raises(TypeError):
+        Tagged.intern(ETag(value="b"))  # pyright: ignore[reportArgumentType]
+    Tagged.clear_interned()
+    assert Tagged(value="a") is not a
+
+
+RENDERED = [
+    ContentType.parse('text/plain; charset=utf-8; foo="a b"'),
+    ContentType(type="application/json"),
+    ContentDisposition.parse('attachment; filename="é rates.txt"; x=1'),
+    ContentDisposition(filename="plans.pdf", fallback="plan.pdf"),
+    CacheControl.parse("public, max-age=60, stale-if-error=5, no-transform"),
+    CacheControl(),
+    ETag(value="a"),
+    ETag(value="a", weak=True),
+    ContentRange.parse("bytes 0-20/30"),
+    Accept.parse("text/html, */*;q=0.1"),
+    IfNoneMatch.parse('"a", W/"b"'),
+]
+
+
+@pytest.mark.parametrize("model", RENDERED)
+def test_render_into(model):
+    expected = str(model).encode("latin-1")
+    if isinstance(model, ETag) and not model.weak:
+        expected = b'"' + expected + b'"'
+    assert model.to_bytes() == expected
+    buf = bytearray(b"x: ")
+    model.render_into(buf)
+    assert buf == b"x: " + expected
+    assert model.to_header() == (type(model).HEADER_NAME.lower().encode(), expected)
+
+
+def test_render_cached():
+    cc = CacheControl.parse("max-age=60")
+    assert cc.to_bytes() is cc.to_bytes()
+    copied = cc.model_copy(update={"max_age": 30})
+    assert copied.to_bytes() == b"max-age=30"
+    assert cc.to_bytes() == b"max-age=60"
+    ct = ContentType(type="text/plain", charset="utf-8")
+    assert ct.to_bytes() == b"text/plain; charset=utf-8"
+    copied = ct.model_copy(update={"type": "text/html"})
+    assert copied.to_bytes() == b"text/html; charset=utf-8"
+    assert copied.parameters == {"charset": "utf-8"}
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        ContentType(type="text/plain", title="€ rates"),
+        ETag(value="€"),
+    ],
+)
+def test_render_not_latin1(model):
+    assert "€" in str(model)
+    with pytest.raises(ValueError, match="not ISO-8859-1"):
+        model.to_bytes()
+    with pytest.raises(ValueError):
+        model.to_header()
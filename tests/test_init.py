@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import pytest
+
+import fast_header
+
+
+def test_lazy_import():
+    code = (
+        "import sys, fast_header\n"
+        "assert 'pydantic' not in sys.modules\n"
+        "assert 'fast_header.content_type' not in sys.modules\n"
+        "fast_header.ContentType\n"
+        "assert 'fast_header.content_type' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_getattr():
+    from fast_header.content_range import Range
+
+    assert fast_header.Range is Range
+    assert "Range" in fast_header.__dict__
+    assert set(fast_header.__all__) <= set(dir(fast_header))
+    assert fast_header.__all__ == list(fast_header._LAZY)
+    with pytest.raises(AttributeError):
+        fast_header.Missing
@@ -0,0 +1,76 @@
+import subprocess
+import sys
+
+import pytest
+
+from fast_header import CacheControl, ContentType, IfMatch, Range
+from fast_header import instrument
+from fast_header.instrument import Stats, install, instrumented, uninstall
+
+
+def test_stats():
+    with instrumented() as stats:
+        assert isinstance(stats, Stats)
+        ContentType.parse("text/html")
+        ContentType.parse_bytes(b"application/json")
+        with pytest.raises(ValueError):
+            ContentType.parse("bad")
+        str(CacheControl(max_age=5))
+        CacheControl(max_age=6).to_bytes()
+        IfMatch.parse_bytes(b'"a"')
+        Range.parse("bytes=0-1", 10)
+    summary = stats.summary()
+    parse = summary["ContentType.parse"]
+    assert parse["count"] == 2
+    assert parse["failures"] == 1
+    assert parse["sizes"] == {4: 1, 16: 1}
+    assert parse["total_ns"] >= parse["p99_ns"] >= parse["p50_ns"] > 0
+    assert summary["ContentType.parse_bytes"]["count"] == 1
+    assert summary["CacheControl.str"]["sizes"] == {16: 1}
+    assert summary["CacheControl.render"]["sizes"] == {16: 1}
+    # nested parse calls belong to the outer one
+    assert "IfMatch.parse" not in summary
+    assert summary["IfMatch.parse_bytes"]["count"] == 1
+    assert summary["Range.parse"]["count"] == 1
+    stats.clear()
+    assert stats.summary() == {}
+
+
+def test_callback():
+    calls = []
+    with instrumented(lambda *args: calls.append(args)):
+        ContentType.parse("text/html")
+    ((header, op, duration, size, error),) = calls
+    assert (header, op, size, error) == ("ContentType", "parse", 9, None)
+    assert duration > 0
+
+
+def test_uninstall_restores_originals():
+    parse = ContentType.__dict__["parse"]
+    to_str = ContentType.__dict__["__str__"]
+    install()
+    try:
+        assert ContentType.__dict__["parse"] is not parse
+        with pytest.raises(RuntimeError):
+            install()
+    finally:
+        uninstall()
+    assert ContentType.__dict__["parse"] is parse
+    assert ContentType.__dict__["__str__"] is to_str
+    assert not instrument._installed
+
+
+def test_install_before_first_use():
+    # a fresh interpreter, where no model module is imported yet
+    code = (
+        "import sys\n"
+        "from fast_header import instrument\n"
+        "stats = instrument.install()\n"
+        "from fast_header import CacheControl, ContentDisposition\n"
+        "CacheControl.parse('max-age=5')\n"
+        "ContentDisposition.parse_bytes(b'inline')\n"
+        "summary = stats.summary()\n"
+        "assert summary['CacheControl.parse']['count'] == 1, summary\n"
+        "assert summary['ContentDisposition.parse_bytes']['count'] == 1, summary\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,78 @@
+import io
+import json
+
+import pytest
+
+from fast_header import __main__
+from fast_header.__main__ import main, merge_stats, new_stats
+
+LOG = (
+    b"GET /a\tpublic, max-age=60\n"
+    b"GET /b\tno-cache\r\n"
+    b"GET /c\t\n"
+    b"GET /d\n"
+    b"GET /e\tpublic, max-age=60\n"
+)
+
+
+def run(argv):
+    out = io.StringIO()
+    assert main(argv, out) == 0
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_stats(tmp_path, jobs):
+    path = tmp_path / "access.log"
+    path.write_bytes(LOG * 3)
+    argv = ["cache-control", str(path), "-c", "1", "-j", jobs, "--chunk-size", "2"]
+    (stats,) = run(argv)
+    assert stats["header"] == "Cache-Control"
+    assert (stats["lines"], stats["parsed"], stats["missing"]) == (15, 9, 6)
+    assert stats["values"] == {"max-age=60, public": 6, "no-cache": 3}
+    assert stats["fields"] == {"public": 6, "max_age": 6, "no_cache": 3}
+
+
+def test_invalid_values(tmp_path):
+    path = tmp_path / "types.txt"
+    path.write_bytes(b"text/html\nnot a type\ntext/plain; charset=utf-8\n")
+    (stats,) = run(["Content-Type", str(path), "-j", "1"])
+    assert stats["invalid"] == 1
+    assert stats["samples"] == ["not a type"]
+    assert stats["errors"] == {"invalid media type": 1}
+    assert stats["fields"] == {"type": 2, "charset": 1}
+
+
+def test_merge_stats_bounded(monkeypatch):
+    monkeypatch.setattr(__main__, "MAX_DISTINCT", 2)
+    total = new_stats()
+    for i in range(10):
+        part = new_stats()
+        part["values"][f"max-age={i}"] = 1
+        part["errors"][f"invalid {i}"] = 10 - i
+        merge_stats(total, part)
+        assert len(total["values"]) <= 4
+        assert len(total["errors"]) <= 4
+    assert "invalid 0" in total["errors"]
+
+
+def test_normalize(tmp_path):
+    path = tmp_path / "types.txt"
+    path.write_bytes(b"Text/HTML ;Charset=UTF-8\nbad\n\n")
+    records = run(["content-type", str(path), "--normalize", "-j", "2"])
+    assert records == [
+        {"line": 1, "value": "text/html; charset=UTF-8"},
+        {"line": 2, "raw": "bad", "error": "invalid media type"},
+        {"line": 3, "value": None},
+    ]
+
+
+def test_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b'"a"\nW/"b"\n')))
+    (stats,) = run(["etag", "-", "-j", "1"])
+    assert stats["values"] == {"a": 1, 'W/"b"': 1}
+
+
+def test_unknown_header():
+    with pytest.raises(SystemExit):
+        main(["x-unknown"], io.StringIO())
@@ -0,0 +1,127 @@
+import pytest
+
+from fast_header.content_disposition import ContentDisposition
+from fast_header.content_type import ContentType
+from fast_header.multipart import (
+    FormDataParser,
+    FormDataStart,
+    MultipartParser,
+    PartData,
+    PartEnd,
+    PartStart,
+)
+
+BODY = (
+    b"preamble\r\n"
+    b"--xYzZY\r\n"
+    b'Content-Disposition: form-data; name="field"\r\n'
+    b"\r\n"
+    b"value\r\n"
+    b"--xYzZY  \r\n"
+    b"Content-Disposition: form-data; name=\"file\"; filename*=UTF-8''%E2%82%AC.txt\r\n"
+    b"Content-Type: text/plain; charset=utf-8\r\n"
+    b"\r\n"
+    b"line 1\r\nline 2\r\n--xY\r\n"
+    b"\r\n--xYzZY--\r\n"
+    b"epilogue"
+)
+
+
+def collect(parser, chunks):
+    parts = []
+    for chunk in chunks:
+        for event in parser.feed(chunk):
+            if isinstance(event, (PartStart, FormDataStart)):
+                parts.append([event, b""])
+            elif isinstance(event, PartData):
+                assert isinstance(event.data, memoryview)
+                parts[-1][1] += event.data
+            else:
+                assert isinstance(event, PartEnd)
+    parser.close()
+    return parts
+
+
+def test_form_data():
+    parts = collect(FormDataParser("xYzZY"), [BODY])
+    assert [p[1] for p in parts] == [b"value", b"line 1\r\nline 2\r\n--xY\r\n"]
+    field, file = (p[0] for p in parts)
+    assert field.name == "field"
+    assert field.filename is None
+    assert field.content_type is None
+    assert field.disposition == ContentDisposition.parse('form-data; name="field"')
+    assert file.name == "file"
+    assert file.filename == "€.txt"
+    assert file.content_type == ContentType.parse("text/plain; charset=utf-8")
+    assert file.headers.content_type == file.content_type
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 11, 64])
+def test_chunked(size):
+    chunks = [BODY[i : i + size] for i in range(0, len(BODY), size)]
+    parts = collect(FormDataParser("xYzZY"), chunks)
+    assert [p[1] for p in parts] == [b"value", b"line 1\r\nline 2\r\n--xY\r\n"]
+    assert parts[1][0].filename == "€.txt"
+
+
+def test_generic_parser():
+    body = b"--b\r\n\r\n\r\n--b\r\nX-A: 1\r\n\r\nabc\r\n--b--"
+    parts = collect(MultipartParser(b"b"), [body])
+    assert [p[1] for p in parts] == [b"", b"abc"]
+    assert parts[1][0].headers.get_raw("x-a") == b"1"
+
+
+def test_data_is_not_copied():
+    chunk = b"--b\r\n\r\n" + b"x" * 1000 + b"\r\n--b--"
+    events = MultipartParser("b").feed(chunk)
+    assert isinstance(events[1], PartData)
+    assert events[1].data.obj is chunk
+    assert len(events[1].data) == 1000
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, len(BODY)])
+def test_memoryview_is_not_copied(size):
+    buf = bytearray(BODY)
+    view = memoryview(buf)
+    parser = FormDataParser("xYzZY")
+    chunks = [view[i : i + size] for i in range(0, len(buf), size)]
+    parts = collect(parser, chunks)
+    assert [p[1] for p in parts] == [b"value", b"line 1\r\nline 2\r\n--xY\r\n"]
+    parser = FormDataParser("xYzZY")
+    for event in parser.feed(view):
+        if isinstance(event, PartData):
+            assert event.data.obj is buf
+
+
+def test_held_back_bytes_are_bounded():
+    parser = MultipartParser("b")
+    parser.feed(b"--b\r\n\r\n")
+    events = parser.feed(b"x" * 100 + b"\r\n-")
+    assert isinstance(events[0], PartData)
+    assert bytes(events[0].data) == b"x" * 100
+    events = parser.feed(b"x")
+    assert b"".join(e.data for e in events if isinstance(e, PartData)) == b"\r\n-x"
+
+
+def test_from_content_type():
+    ct = ContentType.parse("multipart/form-data; boundary=xYzZY")
+    assert collect(FormDataParser.from_content_type(ct), [BODY])
+    with pytest.raises(ValueError):
+        FormDataParser.from_content_type(ContentType(type="multipart/form-data"))
+
+
+def test_invalid():
+    for boundary in ["", "a" * 71, "a\r"]:
+        with pytest.raises(ValueError):
+            MultipartParser(boundary)
+    with pytest.raises(ValueError):
+        FormDataParser("b").feed(b"--b\r\nContent-Type: text/plain\r\n\r\n")
+    with pytest.raises(ValueError):
+        MultipartParser("b").feed(b"--b\r\nbad header\r\n\r\n")
+    with pytest.raises(ValueError):
+        MultipartParser("b", max_header_size=10).feed(b"--b\r\nX-A: 0123456789")
+    parser = MultipartParser("b")
+    parser.feed(b"--b\r\n\r\ndata")
+    assert not parser.done
+    with pytest.raises(ValueError):
+        parser.close()